@@ -23,10 +23,18 @@ import os
 import re
 import sys
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: C-backed JSON, several times faster than stdlib json
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 COUNTY_MAP_PATH = os.path.join(SCRIPT_DIR, 'county_state_map.json')
@@ -46,6 +54,14 @@ COL_TOTAL = 'TOT_BENES'
 COL_ORIGINAL = 'ORGNL_MDCR_BENES'
 COL_MA = 'MA_AND_OTH_BENES'
 
+# Low-cardinality columns repeated on every row — interned to share one string object
+INTERNED_COLUMNS = (COL_GEO_LEVEL, COL_STATE, COL_YEAR, COL_MONTH)
+
+USER_AGENT = 'DST-Compiler-Medicare-Enrollment/1.0 (github.com/Duynomite/dst-compiler)'
+
+# Average request rate against the CMS API (be polite)
+API_REQUESTS_PER_SECOND = 2
+
 # Months in order for finding the latest available
 MONTHS = ['January', 'February', 'March', 'April', 'May', 'June',
           'July', 'August', 'September', 'October', 'November', 'December']
@@ -85,6 +101,21 @@ COUNTY_SUFFIXES = [
 ]
 
 
+@dataclass(slots=True)
+class StateEnrollment:
+    """Per-state enrollment totals, accumulated while processing CMS rows."""
+    total: int = 0
+    ma_enrollment: int = 0
+    counties: Dict[str, dict] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            'total': self.total,
+            'maEnrollment': self.ma_enrollment,
+            'counties': self.counties,
+        }
+
+
 def normalize_cms_county_name(cms_name: str) -> str:
     """Convert CMS county name to match county_state_map.json format."""
     if not cms_name:
@@ -94,7 +125,11 @@ def normalize_cms_county_name(cms_name: str) -> str:
     if cms_name in COUNTY_NAME_OVERRIDES:
         return COUNTY_NAME_OVERRIDES[cms_name]
 
-    # Strip suffixes
+    # Fast path: the vast majority of CMS rows end in " County"
+    if cms_name.endswith(' County'):
+        return cms_name[:-7].strip()
+
+    # Strip remaining suffixes (Parish, Borough, Census Area, ...)
     name = cms_name
     for suffix in COUNTY_SUFFIXES:
         if name.endswith(suffix):
@@ -104,10 +139,119 @@ def normalize_cms_county_name(cms_name: str) -> str:
     return name.strip()
 
 
+def make_session() -> requests.Session:
+    """
+    requests.Session with a tuned connection pool and urllib3 retry/backoff,
+    so a transient CMS 5xx/429 is retried instead of failing the run.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False,  # Hand back the last response; raise_for_status() reports it
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/json',
+    })
+    return session
+
+
+class RateLimiter:
+    """Spaces requests at least 1/rps seconds apart without sleeping after slow responses."""
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps
+        self.next_ok = 0.0
+
+    def wait(self):
+        now = time.monotonic()
+        if now < self.next_ok:
+            time.sleep(self.next_ok - now)
+            now = self.next_ok
+        self.next_ok = now + self.interval
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Characters json.dumps escapes under ensure_ascii but orjson writes raw
+_RE_NON_ASCII = re.compile('[^\x00-\x7e]')
+
+
+def _escape_non_ascii(match) -> str:
+    """\\uXXXX escape for one character, as json.dumps(ensure_ascii=True) does."""
+    n = ord(match.group())
+    if n < 0x10000:
+        return f'\\u{n:04x}'
+    n -= 0x10000  # Astral characters become a UTF-16 surrogate pair
+    return f'\\u{0xd800 | (n >> 10):04x}\\u{0xdc00 | (n & 0x3ff):04x}'
+
+
+def json_dumps(obj) -> bytes:
+    """
+    Encode obj as 2-space indented JSON bytes, using orjson when installed.
+    Output matches json.dumps(obj, indent=2): orjson's raw UTF-8 is escaped
+    back to ASCII (e.g. "Do\\u00f1a Ana").
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        if data.isascii() and b'\x7f' not in data:
+            return data
+        return _RE_NON_ASCII.sub(_escape_non_ascii, data.decode()).encode()
+    return json.dumps(obj, indent=2).encode()
+
+
+def _indented(obj, depth: int) -> bytes:
+    """json_dumps(obj) with continuation lines shifted right by depth spaces."""
+    return json_dumps(obj).replace(b'\n', b'\n' + b' ' * depth)
+
+
+class _CountingSink:
+    """File-like sink that only counts bytes written (used by --dry-run)."""
+
+    def __init__(self):
+        self.n = 0
+
+    def write(self, b: bytes):
+        self.n += len(b)
+
+
+def write_enrollment_stream(fp, metadata: dict, states: dict):
+    """
+    Write the enrollment JSON to fp one state at a time.
+    Byte-identical to json.dumps({'metadata': ..., 'states': ...}, indent=2)
+    but never holds the whole encoded document in memory.
+    """
+    fp.write(b'{\n  "metadata": ')
+    fp.write(_indented(metadata, 2))
+    fp.write(b',\n  "states": {')
+    first = True
+    for state, data in states.items():
+        fp.write(b'\n    ' if first else b',\n    ')
+        fp.write(json_dumps(state))
+        fp.write(b': ')
+        fp.write(_indented(data, 4))
+        first = False
+    fp.write(b'}\n}' if first else b'\n  }\n}')
+
+
 def safe_int(value: str) -> int:
     """Parse CMS string value to int, handling suppressed values ('*')."""
     if not value or value == '*':
         return 0
+    if value.isdecimal():  # Common case: plain digits, no thousands separators
+        return int(value)
     try:
         return int(value.replace(',', ''))
     except (ValueError, TypeError):
@@ -116,11 +260,11 @@ def safe_int(value: str) -> int:
 
 def load_county_map() -> Dict[str, list]:
     """Load county_state_map.json to validate county name matching."""
-    with open(COUNTY_MAP_PATH, 'r') as f:
-        return json.load(f)
+    with open(COUNTY_MAP_PATH, 'rb') as f:
+        return json_loads(f.read())
 
 
-def discover_latest_period(session: requests.Session) -> Tuple[str, str]:
+def discover_latest_period(session: requests.Session, limiter: RateLimiter) -> Tuple[str, str]:
     """Find the most recent year/month available in the CMS dataset."""
     print('Discovering latest available data period...')
 
@@ -134,26 +278,40 @@ def discover_latest_period(session: requests.Session) -> Tuple[str, str]:
             'size': 1,
         }
         try:
+            limiter.wait()
             resp = session.get(CMS_API_BASE, params=params, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             if data:
-                # Found data for this year — now find latest month
-                for month in reversed(MONTHS):
-                    params['filter[MONTH]'] = month
+                # Found data for this year — now binary-search the latest month.
+                # CMS publishes months in order, so available months form a
+                # prefix of MONTHS: at most 4 probes instead of up to 12.
+                latest = -1
+                lo, hi = 0, len(MONTHS) - 1
+                while lo <= hi:
+                    mid = (lo + hi) // 2
+                    params['filter[MONTH]'] = MONTHS[mid]
+                    limiter.wait()
                     resp = session.get(CMS_API_BASE, params=params, timeout=30)
                     resp.raise_for_status()
-                    if resp.json():
-                        print(f'  Latest available: {month} {year}')
-                        return str(year), month
-        except requests.RequestException as e:
+                    if json_loads(resp.content):
+                        latest = mid
+                        lo = mid + 1
+                    else:
+                        hi = mid - 1
+                if latest >= 0:
+                    month = MONTHS[latest]
+                    print(f'  Latest available: {month} {year}')
+                    return str(year), month
+        except (requests.RequestException, ValueError) as e:
             print(f'  Warning: API error checking {year}: {e}')
             continue
 
     raise RuntimeError('Could not find any available data period in CMS API')
 
 
-def fetch_county_enrollment(session: requests.Session, year: str, month: str) -> list:
+def fetch_county_enrollment(session: requests.Session, limiter: RateLimiter,
+                            year: str, month: str) -> list:
     """Fetch all county-level enrollment records for a given period."""
     print(f'Fetching county enrollment data for {month} {year}...')
 
@@ -171,10 +329,11 @@ def fetch_county_enrollment(session: requests.Session, year: str, month: str) ->
         }
 
         try:
+            limiter.wait()
             resp = session.get(CMS_API_BASE, params=params, timeout=60)
             resp.raise_for_status()
-            page = resp.json()
-        except requests.RequestException as e:
+            page = json_loads(resp.content)
+        except (requests.RequestException, ValueError) as e:
             print(f'  Error fetching offset {offset}: {e}')
             if all_records:
                 print(f'  Using {len(all_records)} records fetched so far')
@@ -184,6 +343,12 @@ def fetch_county_enrollment(session: requests.Session, year: str, month: str) ->
         if not page:
             break
 
+        for rec in page:
+            for col in INTERNED_COLUMNS:
+                value = rec.get(col)
+                if isinstance(value, str):
+                    rec[col] = sys.intern(value)
+
         all_records.extend(page)
         print(f'  Fetched {len(all_records)} records...')
 
@@ -191,7 +356,6 @@ def fetch_county_enrollment(session: requests.Session, year: str, month: str) ->
             break
 
         offset += page_size
-        time.sleep(0.5)  # Be polite to the API
 
     print(f'  Total: {len(all_records)} county records')
     return all_records
@@ -199,15 +363,17 @@ def fetch_county_enrollment(session: requests.Session, year: str, month: str) ->
 
 def build_enrollment_json(records: list, county_map: dict, year: str, month: str) -> dict:
     """Process CMS records into our output format, validated against county_map."""
-    states = {}
+    states: Dict[str, StateEnrollment] = {}
     matched = 0
     unmatched = []
     skipped_territories = 0
 
-    # Build a lookup set from county_state_map for validation
-    county_lookup = {}
-    for state, counties in county_map.items():
-        county_lookup[state] = {c.lower(): c for c in counties}
+    # Build flat lookup sets from county_state_map for validation —
+    # one (state, lowercased county) probe per record instead of nested dicts
+    state_set = frozenset(county_map)
+    county_set = frozenset(
+        (state, c.lower()) for state, counties in county_map.items() for c in counties
+    )
 
     for rec in records:
         state = rec.get(COL_STATE, '')
@@ -226,36 +392,33 @@ def build_enrollment_json(records: list, county_map: dict, year: str, month: str
 
         # Parse enrollment numbers
         total = safe_int(rec.get(COL_TOTAL, '0'))
-        original = safe_int(rec.get(COL_ORIGINAL, '0'))
         ma = safe_int(rec.get(COL_MA, '0'))
 
         if total == 0:
             continue
 
         # Initialize state entry
-        if state not in states:
-            states[state] = {
-                'total': 0,
-                'maEnrollment': 0,
-                'counties': {},
-            }
+        entry = states.get(state)
+        if entry is None:
+            entry = states[state] = StateEnrollment()
 
         # Add county data (aggregate if multiple CMS entries map to same name, e.g. CT planning regions)
-        if our_county in states[state]['counties']:
-            states[state]['counties'][our_county]['total'] += total
-            states[state]['counties'][our_county]['ma'] += ma
-        else:
-            states[state]['counties'][our_county] = {
+        county = entry.counties.get(our_county)
+        if county is None:
+            entry.counties[our_county] = {
                 'total': total,
                 'ma': ma,
                 'fips': fips,
             }
-        states[state]['total'] += total
-        states[state]['maEnrollment'] += ma
+        else:
+            county['total'] += total
+            county['ma'] += ma
+        entry.total += total
+        entry.ma_enrollment += ma
 
         # Check if we can match this to our county_state_map
-        if state in county_lookup:
-            if our_county.lower() in county_lookup[state]:
+        if state in state_set:
+            if (state, our_county.lower()) in county_set:
                 matched += 1
             else:
                 unmatched.append(f'{our_county}, {state}')
@@ -263,9 +426,9 @@ def build_enrollment_json(records: list, county_map: dict, year: str, month: str
             skipped_territories += 1
 
     # Summary
-    total_counties = sum(len(s['counties']) for s in states.values())
-    total_benes = sum(s['total'] for s in states.values())
-    total_ma = sum(s['maEnrollment'] for s in states.values())
+    total_counties = sum(len(s.counties) for s in states.values())
+    total_benes = sum(s.total for s in states.values())
+    total_ma = sum(s.ma_enrollment for s in states.values())
 
     print(f'\nProcessing summary:')
     print(f'  States: {len(states)}')
@@ -298,7 +461,7 @@ def build_enrollment_json(records: list, county_map: dict, year: str, month: str
             'counties': total_counties,
             'matchRate': round(match_rate, 1),
         },
-        'states': states,
+        'states': {state: entry.to_dict() for state, entry in states.items()},
     }
 
     return output
@@ -313,17 +476,16 @@ def main():
     total_counties = sum(len(v) for v in county_map.values())
     print(f'  {len(county_map)} states, {total_counties} counties')
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'DST-Compiler-Medicare-Enrollment/1.0 (github.com/Duynomite/dst-compiler)',
-        'Accept': 'application/json',
-    })
+    session = make_session()
+
+    # Shared by every CMS API call so the average rate stays polite
+    limiter = RateLimiter(API_REQUESTS_PER_SECOND)
 
     # Step 1: Find latest available period
-    year, month = discover_latest_period(session)
+    year, month = discover_latest_period(session, limiter)
 
     # Step 2: Fetch county-level enrollment data
-    records = fetch_county_enrollment(session, year, month)
+    records = fetch_county_enrollment(session, limiter, year, month)
 
     if not records:
         print('ERROR: No records returned from CMS API')
@@ -334,7 +496,9 @@ def main():
 
     # Step 4: Write output
     if dry_run:
-        print(f'\n[DRY RUN] Would write {len(json.dumps(output)):,} bytes to {OUTPUT_PATH}')
+        sink = _CountingSink()
+        write_enrollment_stream(sink, output['metadata'], output['states'])
+        print(f'\n[DRY RUN] Would write {sink.n:,} bytes to {OUTPUT_PATH}')
         # Print a sample
         sample_state = list(output['states'].keys())[0] if output['states'] else None
         if sample_state:
@@ -346,8 +510,8 @@ def main():
             for county, data in sample_counties.items():
                 print(f'  {county}: {data["total"]:,} total, {data["ma"]:,} MA')
     else:
-        with open(OUTPUT_PATH, 'w') as f:
-            json.dump(output, f, indent=2)
+        with open(OUTPUT_PATH, 'wb') as f:
+            write_enrollment_stream(f, output['metadata'], output['states'])
         file_size = os.path.getsize(OUTPUT_PATH)
         print(f'\nWrote {OUTPUT_PATH} ({file_size:,} bytes)')
 
@@ -21,14 +21,29 @@ import json
 import re
 import time
 import hashlib
-import calendar
+import functools
 import traceback
-from datetime import date, datetime, timedelta
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: Lexbor-backed HTML parser, far faster than bs4's html.parser
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import orjson  # Optional: C-backed JSON, several times faster than stdlib json
+except ImportError:
+    orjson = None
 
 # =========================================================================
 # Configuration
@@ -36,6 +51,17 @@ from bs4 import BeautifulSoup
 
 LOOKBACK_MONTHS = 24
 REQUEST_TIMEOUT = 15  # seconds
+# requests speaks HTTP/1.1 only (one in-flight request per connection), so
+# concurrency comes from parallel keep-alive connections. Worker counts must stay
+# within the per-host pool or the extra connections are opened and thrown away.
+HTTP_POOL_SIZE = 32  # keep-alive connections per host in the shared session
+FR_FETCH_WORKERS = min(8, HTTP_POOL_SIZE)  # concurrent Federal Register raw-text downloads
+FEMA_FETCH_WORKERS = 4  # concurrent OpenFEMA pages once the total count is known
+SCRAPE_MAX_BYTES = 2 * 1024 * 1024  # read cap for HHS/FMCSA HTML scrapes
+FR_PARSE_PROCESS_MIN_DOCS = 500  # parse FR notices in a process pool at or above this many
+FR_CACHE_DIR = Path(".fr_cache")  # on-disk cache of FR raw text (published docs are immutable) and HTTP validators with their bodies
+FR_CACHE_MAX_AGE_DAYS = 30
+FR_TEXT_CACHE_VERSION = 2  # bump when _RE_CONTIGUOUS_SECTION changes: cached text is cut at its terminator
 USER_AGENT = "DST-Compiler/1.0 (Medicare SEP Tool; contact: admin@clearpathcoverage.com)"
 OUTPUT_FILE = "curated_disasters.json"
 ALL_DISASTERS_FILE = "all_disasters.json"
@@ -105,15 +131,52 @@ STATE_NAME_TO_CODE = {
 
 STATE_CODE_TO_NAME = {v: k for k, v in STATE_NAME_TO_CODE.items()}
 
+
+def make_session() -> requests.Session:
+    """
+    requests.Session with a tuned connection pool and urllib3 retry/backoff.
+    The default pool (10 connections, no retries) throttles concurrent fetches
+    and turns one transient 5xx into a failed run.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,  # Hand back the last response; callers check status
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+# Shared HTTP session: keep-alive connection pooling across all collectors
+_SESSION = make_session()
+
 # =========================================================================
 # Utility Functions
 # =========================================================================
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_IN_MONTH_LEAP = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def last_day_of_month(year: int, month: int) -> int:
+    """Number of days in month (1-12) — table lookup, same result as calendar.monthrange()[1]."""
+    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return _DAYS_IN_MONTH_LEAP[month - 1]
+    return _DAYS_IN_MONTH[month - 1]
+
+
 def calculate_sep_window_end(incident_end: date) -> date:
     """
     Calculate SEP end: last day of 2nd full calendar month after incident end.
     CRITICAL: Uses month arithmetic only, never day arithmetic.
-    Never use setMonth() equivalent — use monthrange() for last day.
+    Never use setMonth() equivalent — use last_day_of_month() for last day.
 
     Examples:
       Jan 15 -> Mar 31
@@ -129,7 +192,7 @@ def calculate_sep_window_end(incident_end: date) -> date:
     if target_month > 12:
         target_month -= 12
         target_year += 1
-    last_day = calendar.monthrange(target_year, target_month)[1]
+    last_day = last_day_of_month(target_year, target_month)
     return date(target_year, target_month, last_day)
 
 
@@ -150,7 +213,7 @@ def calculate_ongoing_max_end(sep_start: date, renewal_dates: Optional[List[date
     while target_month > 12:
         target_month -= 12
         target_year += 1
-    last_day = calendar.monthrange(target_year, target_month)[1]
+    last_day = last_day_of_month(target_year, target_month)
     return date(target_year, target_month, last_day)
 
 
@@ -179,80 +242,224 @@ def days_remaining(sep_end: Optional[date]) -> Optional[int]:
     return (sep_end - date.today()).days
 
 
+# Shape-gated strptime formats for parse_date_fuzzy(). A cheap regex match
+# picks the candidate formats so strptime only runs where it can succeed.
+# A None format means ISO (date.fromisoformat).
+_DATE_PATTERNS = (
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), (None,)),         # 2026-01-15
+    (re.compile(r"^[A-Za-z]+\.?\s+\d{1,2},?\s+\d{4}$"), (
+        "%B %d, %Y",      # January 15, 2026
+        "%b %d, %Y",      # Jan 15, 2026
+        "%b. %d, %Y",     # Jan. 15, 2026
+        "%B %d %Y",       # January 15 2026
+    )),
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), ("%m/%d/%Y",)),  # 01/15/2026
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date_fuzzy(date_str: str) -> Optional[date]:
     """
     Parse various date formats to date object.
     Handles: "January 15, 2026", "Jan 15, 2026", "01/15/2026", "2026-01-15"
+    Memoized — the same date strings recur across FR documents and FEMA groups.
     """
     if not date_str:
         return None
     date_str = date_str.strip().rstrip(".")
 
-    # ISO format
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-        try:
-            return date.fromisoformat(date_str)
-        except ValueError:
-            pass
-
-    formats = [
-        "%B %d, %Y",      # January 15, 2026
-        "%b %d, %Y",      # Jan 15, 2026
-        "%b. %d, %Y",     # Jan. 15, 2026
-        "%m/%d/%Y",        # 01/15/2026
-        "%B %d %Y",        # January 15 2026
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).date()
-        except ValueError:
+    for pattern, formats in _DATE_PATTERNS:
+        if not pattern.match(date_str):
             continue
+        for fmt in formats:
+            try:
+                if fmt is None:
+                    return date.fromisoformat(date_str)
+                return datetime.strptime(date_str, fmt).date()
+            except ValueError:
+                continue
+        return None
     return None
 
 
+# County type suffixes stripped by normalize_county_name(). Order matters:
+# "(City and Borough)" before "(Borough)" to avoid partial match.
+COUNTY_SUFFIXES = (
+    "(City and Borough)",
+    "(County)",
+    "(Parish)",
+    "(Borough)",
+    "(Census Area)",
+    "(city)",
+    "(Municipio)",
+    "(ANV/ANVSA)",
+)
+_COUNTY_SUFFIXES_LOWER = tuple(s.lower() for s in COUNTY_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_county_name(name: str) -> str:
     """
-    Strip county type suffixes. Order matters:
-    "(City and Borough)" before "(Borough)" to avoid partial match.
+    Strip county type suffixes (case-insensitive), e.g. "Harris (County)" -> "Harris".
+    Stacked suffixes are all removed: "X (Census Area)(ANV/ANVSA)" -> "X".
+    Plain endswith() checks — no regex needed for a literal suffix strip.
+    Cached: the same county names recur across FR notices and FEMA rows.
+    """
+    stripped = name.strip()
+    while True:
+        low = stripped.lower()
+        for suffix in _COUNTY_SUFFIXES_LOWER:
+            if low.endswith(suffix):
+                stripped = stripped[:-len(suffix)].rstrip()
+                break
+        else:
+            return stripped
+
+
+def parse_html(markup):
+    """
+    Parse HTML with selectolax when installed, else BeautifulSoup (html.parser).
+    Accepts the raw response bytes; both parsers detect the encoding themselves,
+    so callers skip requests' own (chardet-guessed) decode of resp.text.
+    """
+    if HTMLParser is not None:
+        return HTMLParser(markup)
+    # Imported on first use: runs where every scrape falls back to curated data
+    # (or selectolax is installed) never pay for bs4/soupsieve at startup
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, "html.parser")
+
+
+def read_capped(resp: requests.Response, max_bytes: int) -> bytes:
+    """
+    Read a stream=True response body, stopping after max_bytes. Guards the
+    scrapers against multi-MB SharePoint pages or a misbehaving server; the
+    truncated markup still parses.
+    """
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=65536):
+        buf.extend(chunk)
+        if len(buf) >= max_bytes:
+            del buf[max_bytes:]
+            break
+    return bytes(buf)
+
+
+def fetch_scrape_page(cache_name: str, url: str, **kwargs) -> bytes:
+    """
+    GET an HTML page for scraping (capped at SCRAPE_MAX_BYTES) as a conditional
+    request. The last 200 body is kept in FR_CACHE_DIR/scrape next to its
+    ETag/Last-Modified; a 304 Not Modified returns that stored body, so the
+    parser sees the same page either way. Extra kwargs go to _SESSION.get.
+    """
+    validators_path = FR_CACHE_DIR / "scrape" / f"{cache_name}.json"
+    body_path = FR_CACHE_DIR / "scrape" / f"{cache_name}.html"
+    headers = {}
+    try:
+        stored = json_loads(validators_path.read_bytes())
+        stored_body = body_path.read_bytes()
+    except (OSError, ValueError):
+        stored_body = None  # Nothing stored (or unreadable) — plain GET
+    else:
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("lastModified"):
+            headers["If-Modified-Since"] = stored["lastModified"]
+
+    with _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True, **kwargs) as resp:
+        if resp.status_code == 304 and stored_body is not None:
+            return stored_body  # Unchanged since the last scrape
+        resp.raise_for_status()
+        body = read_capped(resp, SCRAPE_MAX_BYTES)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        # Body first: validators on disk always have a body to go with them
+        _write_cache_file(body_path, body)
+        _write_cache_file(validators_path, json.dumps({"etag": etag, "lastModified": last_modified}))
+    return body
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Characters json.dumps escapes under ensure_ascii but orjson writes raw
+_RE_NON_ASCII = re.compile("[^\x00-\x7e]")
+
+
+def _escape_non_ascii(match) -> str:
+    """\\uXXXX escape for one character, as json.dumps(ensure_ascii=True) does."""
+    n = ord(match.group())
+    if n < 0x10000:
+        return f"\\u{n:04x}"
+    n -= 0x10000  # Astral characters become a UTF-16 surrogate pair
+    return f"\\u{0xd800 | (n >> 10):04x}\\u{0xdc00 | (n & 0x3ff):04x}"
+
+
+def write_json(filepath: str, obj) -> None:
+    """
+    Write obj as 2-space indented JSON, byte-identical to json.dump(obj, f, indent=2)
+    (audit_curated_data.py rewrites these files with json.dump). orjson encodes
+    to one bytes buffer in C, with its raw UTF-8 escaped back to ASCII; the
+    stdlib fallback streams into the file instead of building the whole
+    document as a str first.
     """
-    suffixes = [
-        "(City and Borough)",
-        "(County)",
-        "(Parish)",
-        "(Borough)",
-        "(Census Area)",
-        "(city)",
-        "(Municipio)",
-        "(ANV/ANVSA)",
-    ]
-    result = name.strip()
-    for suffix in suffixes:
-        result = re.sub(re.escape(suffix), "", result, flags=re.IGNORECASE).strip()
-    return result
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        if not data.isascii() or b"\x7f" in data:
+            data = _RE_NON_ASCII.sub(_escape_non_ascii, data.decode()).encode()
+        with open(filepath, "wb") as f:
+            f.write(data)
+    else:
+        with open(filepath, "w") as f:
+            json.dump(obj, f, indent=2)
 
 
 def verify_url(url: str) -> bool:
     """
     Verify URL is reachable with HEAD request.
-    Returns True on 2xx or 3xx status.
+    Returns True on 2xx or 3xx status. Retries are handled by the session adapter.
     """
-    for attempt in range(2):
-        try:
-            resp = requests.head(
-                url, timeout=REQUEST_TIMEOUT, allow_redirects=True,
-                headers={"User-Agent": USER_AGENT}
-            )
-            return resp.status_code < 400
-        except Exception:
-            if attempt == 0:
-                time.sleep(1)
-    return False
+    try:
+        resp = _SESSION.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+        return resp.status_code < 400
+    except Exception:
+        return False
+
+
+def verify_record_urls(records: List[Dict], max_workers: int = 16) -> Dict[str, bool]:
+    """
+    Verify every distinct officialUrl concurrently (VERIFY_URLS_ON_BUILD debug runs).
+    Prints a warning per record whose URL is unreachable. Returns {url: reachable}.
+    """
+    urls = sorted({rec["officialUrl"] for rec in records if rec.get("officialUrl")})
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        reachable = dict(zip(urls, pool.map(verify_url, urls)))
+    for rec in records:
+        url = rec.get("officialUrl")
+        if url and not reachable[url]:
+            print(f"  WARNING: URL unreachable for {rec['id']}: {url[:80]}")
+    return reachable
+
+
+# Shared counties value for statewide curated entries; build_record copies it
+STATEWIDE = ("Statewide",)
+
+
+def intern_field(value):
+    """sys.intern() a categorical string field; non-strings (e.g. null) pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def build_record(
     id_str: str, source: str, state: str, title: str, incident_type: str,
     declaration_date: date, incident_start: date, incident_end: Optional[date],
-    renewal_dates_list: Optional[List[date]], counties: List[str],
+    renewal_dates_list: Optional[List[date]], counties: Sequence[str],
     statewide: bool, official_url: str, confidence: str,
     last_verified: Optional[str] = None,
     extensions: Optional[List[Dict]] = None,
@@ -260,7 +467,15 @@ def build_record(
 ) -> Optional[Dict]:
     """Build a validated disaster record dict. Returns None if invalid.
 
+    Records stay plain dicts: later passes (PHE expiry, incident-end corrections,
+    carrier acknowledgments, lastVerified) add or overwrite keys in place, and
+    the same dicts are serialized as-is by write_output. For the same reason, and
+    because status/daysRemaining depend on today, results aren't memoized here;
+    curated builders are cached whole by cached_curated().
+
     Args:
+        counties: Any sequence (constant tuples are fine); the record gets its own
+            sorted list.
         extensions: Optional list of extension events, each with:
             {"date": "ISO", "newIncidentEnd": "ISO|null", "newSepEnd": "ISO",
              "source": "str", "notes": "str"}
@@ -276,9 +491,6 @@ def build_record(
         return None
     if not official_url:
         return None
-    if VERIFY_URLS_ON_BUILD:
-        if not verify_url(official_url):
-            print(f"  WARNING: URL unreachable for {id_str}: {official_url[:80]}")
     if not counties:
         return None
     if state not in VALID_STATES:
@@ -303,12 +515,14 @@ def build_record(
     if renewal_dates_list:
         renewal_strs = [d.isoformat() for d in renewal_dates_list]
 
+    # Categorical fields repeat across thousands of records (FEMA values arrive as
+    # fresh strings per API row); intern them so records share one object each.
     record = {
         "id": id_str,
-        "source": source,
-        "state": state,
+        "source": sys.intern(source),
+        "state": sys.intern(state),
         "title": title,
-        "incidentType": incident_type,
+        "incidentType": intern_field(incident_type),
         "declarationDate": declaration_date.isoformat(),
         "incidentStart": incident_start.isoformat(),
         "incidentEnd": incident_end.isoformat() if incident_end else None,
@@ -320,8 +534,8 @@ def build_record(
         "sepWindowStart": sep_start.isoformat(),
         "sepWindowEnd": sep_end.isoformat(),
         "daysRemaining": days_rem,
-        "confidenceLevel": confidence,
-        "lastUpdated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "confidenceLevel": sys.intern(confidence),
+        "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
     if last_verified:
         record["lastVerified"] = last_verified
@@ -332,15 +546,224 @@ def build_record(
     return record
 
 
+def fanout_record(states: Sequence[str], *, id_prefix: str, **shared) -> List[Dict]:
+    """
+    Build one record per state for a multi-state declaration (e.g. FMCSA regional
+    emergencies). build_record runs once; the other states get copies of that
+    prototype with their own id, state and counties list.
+    """
+    states = [st for st in states if st in VALID_STATES]
+    if not states:
+        return []
+    proto = build_record(id_str=f"{id_prefix}{states[0]}", state=states[0], **shared)
+    if proto is None:
+        return []
+    records = [proto]
+    for st in states[1:]:
+        rec = dict(proto)
+        rec["id"] = f"{id_prefix}{st}"
+        rec["state"] = sys.intern(st)
+        rec["counties"] = list(proto["counties"])
+        records.append(rec)
+    return records
+
+
+@functools.lru_cache(maxsize=16)
+def _build_curated(builder: Callable[[], List[Optional[Dict]]], as_of: date) -> Tuple[Dict, ...]:
+    """
+    Run a collector's curated builder once per (builder, day). Keyed on the date
+    because build_record derives status/daysRemaining (and drops expired
+    records) from today.
+
+    The curated tables stay as build_record() calls in source rather than a
+    pre-built data blob: the RUNBOOK edits them in place, and built records go
+    stale as soon as the date changes. This cache is what keeps them cheap.
+    """
+    return tuple(rec for rec in builder() if rec)
+
+
+def cached_curated(builder: Callable[[], List[Optional[Dict]]]) -> List[Dict]:
+    """
+    Curated records from a collector's _get_curated_*() builder, memoized per day.
+    Returns fresh shallow copies: downstream passes mutate records in place.
+    Warm calls don't re-run the builder, so its date(...) literals are only
+    constructed on the first call of the day.
+    """
+    return [dict(rec) for rec in _build_curated(builder, date.today())]
+
+
 # =========================================================================
 # SBA Collector — Federal Register API
 # =========================================================================
 
+# Federal Register text patterns, compiled once at import (used per parsed document)
+_RE_STATE_OF = re.compile(r"State of\s+([A-Z][A-Za-z\s]+?)(?:\s*$|\s*dated)", re.IGNORECASE)
+_RE_INCIDENT_PERIOD_THROUGH = re.compile(
+    r"Incident\s+Period:\s*(.+?)(?:through|to)\s+(.+?)(?:\.|$)", re.IGNORECASE
+)
+_RE_BEGIN_END = re.compile(r"beginning\s+(.+?)\s+and\s+ending\s+(.+?)(?:\.|,|$)", re.IGNORECASE)
+_RE_BEGIN_CONTINUING = re.compile(r"beginning\s+(?:on\s+)?(.+?)(?:,?\s+and\s+continuing)", re.IGNORECASE)
+_RE_INCIDENT_SINGLE = re.compile(r"Incident\s+Period:\s*(\w+\s+\d{1,2},?\s+\d{4})\s*\.?", re.IGNORECASE)
+# Every incident-date pattern above starts at one of these two anchors; one scan
+# for them replaces four full-text searches (see _extract_incident_dates)
+_RE_DATE_ANCHORS = re.compile(r"(?P<period>Incident\s+Period:)|beginning\s", re.IGNORECASE)
+_RE_INCIDENT_NAME = re.compile(r"Incident:\s*(.+?)(?:\.|$)")
+_RE_PRIMARY_COUNTIES = re.compile(
+    r"Primary\s+(?:Counties|Parishes|Boroughs|Areas)(?:\s*\(Physical\s+Damage[^)]*\))?:\s*(.+?)(?:Contiguous|$)",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_PRIMARY_ALT = re.compile(
+    r"Primary\s+(?:Counties|Parishes):\s*(.+?)(?:\n\n|\nContiguous|\nInterest)",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_CONTIGUOUS_SECTION = re.compile(
+    r"Contiguous\s+(?:Counties|Parishes|Boroughs|Areas)(?:\s*\([^)]*\))?:\s*(.+?)(?:Interest\s+Rates|A\s+list\s+of|The\s+interest|$)",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_STATE_COUNTIES_LINE = re.compile(
+    r"(?:^|\n)\s*(?:In\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*:\s*([^:]+?)(?=(?:\n\s*(?:In\s+)?[A-Z][a-z]|$))",
+    re.DOTALL
+)
+_RE_CONTIGUOUS_IN_STATE = re.compile(
+    r"(?:contiguous\s+counties\s+in\s+(?:the\s+State\s+of\s+)?|the\s+following\s+counties\s+in\s+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:\-—]\s*([^.]+)",
+    re.IGNORECASE
+)
+_RE_COUNTY_SPLIT = re.compile(r"[,;\n]+")
+_RE_COUNTY_PREFIX_BAD = re.compile(r"^(In |and |the )", re.IGNORECASE)
+# Every first character _RE_COUNTY_PREFIX_BAD can match (IGNORECASE includes dotted/dotless i)
+_COUNTY_PREFIX_BAD_FIRST = frozenset("AaIiTt\u0130\u0131")
+_RE_COUNTY_SPECIALS = re.compile(r"[<>(){}\[\]|/\\]")
+_RE_COUNTY_KEYWORDS = re.compile(
+    r"(Catalog|BILLING|Available|Credit|Percent|Interest|Elsewhere|Filed|Code|--------)", re.IGNORECASE
+)
+_RE_CACHE_KEY_UNSAFE = re.compile(r"[^A-Za-z0-9_-]")
+# The terminator alternatives of _RE_CONTIGUOUS_SECTION, used to decide when a
+# streamed notice is worth re-searching for a closed contiguous section
+_RE_CONTIGUOUS_TERMINATOR = re.compile(r"Interest\s+Rates|A\s+list\s+of|The\s+interest", re.IGNORECASE)
+_TERMINATOR_OVERLAP = 256  # chars of earlier text re-scanned, for terminators split across chunks
+
+
+def _split_counties(counties_text: str, reject_garbage: bool = False) -> List[str]:
+    """
+    Split an FR county list on commas/semicolons/newlines in a single pass.
+    Drops blanks and "In "/"and "/"the " fragments; with reject_garbage, also drops
+    entries with special chars/HTML, leading digits, boilerplate keywords, or
+    excessive length (primary-county sections pick these up from page furniture).
+    """
+    counties = []
+    # Cheapest checks first: lengths and the first character, then regexes
+    for c in _RE_COUNTY_SPLIT.split(counties_text):
+        c = c.strip()
+        if len(c) <= 1:
+            continue
+        c = c.rstrip(".")
+        if reject_garbage and (len(c) >= 60 or c[:1].isdecimal()):
+            continue
+        # Filter out non-county items (state names, headers, metadata, HTML)
+        if c[:1] in _COUNTY_PREFIX_BAD_FIRST and _RE_COUNTY_PREFIX_BAD.match(c):
+            continue
+        if reject_garbage and (_RE_COUNTY_SPECIALS.search(c) or _RE_COUNTY_KEYWORDS.search(c)):
+            continue
+        counties.append(c)
+    return counties
+
+
+def _write_cache_file(path: Path, data) -> None:
+    """
+    Write a cache entry (str as UTF-8, or raw bytes) via a temp file + rename,
+    so an interrupted run never leaves a truncated entry. Best-effort: I/O
+    errors never fail a run.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        if isinstance(data, bytes):
+            tmp_path.write_bytes(data)
+        else:
+            tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def _first_match_at(pattern: re.Pattern, text: str, positions: List[int]) -> Optional[re.Match]:
+    """First match of pattern anchored at one of positions (ascending), or None."""
+    for pos in positions:
+        match = pattern.match(text, pos)
+        if match:
+            return match
+    return None
+
+
+# Any state/territory name as a whole word, longest first so "West Virginia"
+# wins over "Virginia" and "Arkansas" is never read as "Kansas". Lowercase
+# literals only: callers search the already-lowered title.
+_STATE_NAME_LOWER_TO_CODE = {name.lower(): code for name, code in STATE_NAME_TO_CODE.items()}
+_STATE_NAME_RE = re.compile(
+    r"\b(" + "|".join(re.escape(n) for n in sorted(_STATE_NAME_LOWER_TO_CODE, key=len, reverse=True)) + r")\b"
+)
+
+# Incident-type keywords in one alternation. The lookahead reports every keyword
+# (overlapping ones too, e.g. "fire" inside "wildfire") in a single scan; the
+# classifier then applies precedence, so "Severe Storms and Flooding" stays Flood.
+_INCIDENT_TYPE_RE = re.compile(
+    r"(?=(?P<hurricane>hurricane)|(?P<wildfire>wildfire)"
+    r"|(?P<structure>apartment|building|complex|house|structure|residential|alarm)"
+    r"|(?P<fire>fire)|(?P<flood>flood|tidal)|(?P<tornado>tornado)"
+    r"|(?P<winter>winter storm|ice storm|snow)|(?P<storm>storm|severe)"
+    r"|(?P<drought>drought)|(?P<earthquake>earthquake))"
+)
+# Precedence after the fire checks (first keyword group present wins)
+_INCIDENT_TYPE_ORDER = (
+    ("flood", "Flood"),
+    ("tornado", "Tornado"),
+    ("winter", "Severe Winter Storm"),
+    ("storm", "Severe Storm"),
+    ("drought", "Drought"),
+    ("earthquake", "Earthquake"),
+)
+
+# FR-parsed SBA record IDs that SBACollector's curated data replaces. Includes
+# expired records — those must be suppressed from FR output even though the
+# curated build_record returns None.
+_SBA_OVERRIDE_IDS = frozenset({
+    "SBA-2025-12380-CA",  # Expired (incident ended Jun 18, 2025)
+    "SBA-2025-16217-AK",  # Wrong incidentStart
+    "SBA-2025-23433-CT",  # Wrong incidentStart/End
+    "SBA-2025-23433-NJ",  # Contiguous record, same date issues
+    "SBA-2025-04575-OR",  # Expired + corrupted counties
+    # Single-day events: parser missed end date (Pattern 4 fix in _extract_incident_dates)
+    # These overrides ensure correct data even if the parser fix doesn't retroactively
+    # apply to cached FR text.
+    "SBA-2025-01588-TX",  # Single-day storm Dec 28, 2024 — EXPIRED
+    "SBA-2025-01871-TX",  # Same event area expansion — EXPIRED
+    "SBA-2025-04573-IL",  # Single-day fire Jan 25, 2025 — EXPIRED
+    "SBA-2025-04573-IN",  # Contiguous for above — EXPIRED
+    "SBA-2025-04581-NJ",  # Single-day fire Jan 10, 2025 (primary=NY) — EXPIRED
+    "SBA-2025-04581-NY",  # Primary record for above — EXPIRED
+    "SBA-2025-07251-IL",  # Single-day storm Mar 19, 2025 (primary=IN) — EXPIRED
+    "SBA-2025-07251-IN",  # Primary record for above — EXPIRED
+    "SBA-2025-20283-IN",  # Single-day crash Nov 4, 2025 (primary=KY) — EXPIRED
+    "SBA-2025-20283-KY",  # Primary record for above — EXPIRED
+    # Wrong incidentStart (used FR pub date) + missing incidentEnd (single-day events)
+    "SBA-2025-05997-IL",  # Single-day apartment fire Feb 22, 2025 — EXPIRED
+    "SBA-2025-05997-IN",  # Contiguous for above — EXPIRED
+    "SBA-2025-23887-MN",  # Single-day fire Oct 26, 2025 — EXPIRED
+    # Amendment expanded county list — curated override has full list
+    "SBA-2026-02294-LA",  # Original had 5 parishes; amendment adds 16 more
+    # PA Hotel Fire — curated includes primary + contiguous counties
+    "SBA-2026-04576-PA",
+    "SBA-2026-04576-NJ",
+})
+
+
 class SBACollector:
     """Collects SBA disaster declarations via Federal Register API."""
 
     FR_API = "https://www.federalregister.gov/api/v1/documents.json"
 
+    __slots__ = ("records", "errors", "warnings", "fr_count", "curated_count")
+
     def __init__(self):
         self.records: List[Dict] = []
         self.errors: List[str] = []
@@ -350,17 +773,32 @@ class SBACollector:
 
     def collect(self) -> List[Dict]:
         try:
-            documents = self._fetch_documents()
-            for doc in documents:
-                try:
-                    results = self._parse_document(doc)
-                    for rec in results:
-                        if rec:
-                            self.records.append(rec)
-                            self.fr_count += 1
-                except Exception as e:
+            # Raw-text downloads dominate wall-clock. Each one starts as soon as its
+            # listing page arrives (overlapping the remaining page fetches); parsing
+            # then runs serially in publication order.
+            with ThreadPoolExecutor(max_workers=FR_FETCH_WORKERS) as pool:
+                pending = [
+                    (doc, pool.submit(self._fetch_raw_text, doc))
+                    for doc in self._iter_documents()
+                ]
+            fetched = [(doc, future.result()) for doc, future in pending]
+            parsed = iter(self._parse_all(
+                [(doc, text) for doc, text in fetched if not isinstance(text, Exception)]
+            ))
+            for doc, full_text in fetched:
+                if isinstance(full_text, Exception):
+                    results, warnings, error = [], [], str(full_text)
+                else:
+                    results, warnings, error = next(parsed)
+                self.warnings.extend(warnings)
+                if error is not None:
                     doc_num = doc.get("document_number", "?")
-                    self.errors.append(f"Failed to parse FR doc {doc_num}: {e}")
+                    self.errors.append(f"Failed to parse FR doc {doc_num}: {error}")
+                    continue
+                for rec in results:
+                    if rec:
+                        self.records.append(rec)
+                        self.fr_count += 1
         except Exception as e:
             self.errors.append(f"Federal Register API query failed: {e}")
             self.warnings.append("Using curated SBA data as fallback")
@@ -368,9 +806,8 @@ class SBACollector:
         # Curated overrides take priority over FR-parsed records.
         # This corrects known parser failures (wrong dates, corrupted counties).
         # IDs to suppress from FR results (even if the curated version is expired/None)
-        override_ids = self._get_curated_sba_override_ids()
-        self.records = [r for r in self.records if r["id"] not in override_ids]
-        curated = self._get_curated_sba()
+        self.records[:] = [r for r in self.records if r["id"] not in _SBA_OVERRIDE_IDS]
+        curated = cached_curated(self._get_curated_sba)
         for rec in curated:
             if rec:
                 self.records.append(rec)
@@ -378,10 +815,28 @@ class SBACollector:
 
         return self.records
 
-    def _fetch_documents(self) -> List[Dict]:
-        """Query Federal Register for SBA disaster notices."""
+    @staticmethod
+    def _parse_all(docs: List[Tuple[Dict, Optional[str]]]) -> List[Tuple[List[Dict], List[str], Optional[str]]]:
+        """
+        Parse (doc, raw text) pairs in order. Large backlogs (historical reruns)
+        fan the regex-heavy parsing out over a process pool; a normal run's few
+        dozen notices parse faster in-process than a pool takes to start.
+        Workers are spawned, not forked: main() runs collectors on threads,
+        and forking a multithreaded process can copy a held lock into the child.
+        """
+        if len(docs) < FR_PARSE_PROCESS_MIN_DOCS:
+            return [_parse_fr_document(doc, text) for doc, text in docs]
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(_parse_fr_document, *zip(*docs), chunksize=8))
+
+    def _iter_documents(self) -> Iterator[Dict]:
+        """
+        Query Federal Register for SBA disaster notices.
+        Yields filtered declarations page by page, so callers can start work on
+        page N while page N+1 is still being requested.
+        """
         cutoff = (date.today() - timedelta(days=LOOKBACK_MONTHS * 31)).isoformat()
-        all_results = []
+        seen_doc_numbers = set()
         page = 1
 
         while True:
@@ -397,14 +852,32 @@ class SBACollector:
                     "raw_text_url", "document_number", "type"
                 ],
             }
-            resp = requests.get(
-                self.FR_API, params=params, timeout=REQUEST_TIMEOUT,
-                headers={"User-Agent": USER_AGENT}
-            )
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_listing_page(params)
             results = data.get("results", [])
-            all_results.extend(results)
+
+            # Filter to actual disaster declarations only. Duplicates (a notice that
+            # shifts onto the next page as new ones are published under
+            # order=newest) are dropped here, before any raw text is requested.
+            # Docs with curated overrides are still fetched: which states a notice
+            # covers (contiguous counties) is only known after parsing its text,
+            # and states not in _SBA_OVERRIDE_IDS must keep their FR record.
+            for doc in results:
+                doc_num = doc.get("document_number", "")
+                if doc_num in seen_doc_numbers:
+                    continue
+                seen_doc_numbers.add(doc_num)
+                title = (doc.get("title") or "").lower()
+                # Must be a declaration or amendment notice related to disasters
+                is_declaration = "declaration" in title and "disaster" in title
+                is_amendment = "amendment" in title and "disaster" in title
+                if is_declaration or is_amendment:
+                    # Skip presidential declarations (overlap with FEMA)
+                    if "presidential" in title:
+                        continue
+                    # Skip filing deadline / reopening notices (not new declarations)
+                    if "impacted by" in title or "filing" in title or "reopening" in title:
+                        continue
+                    yield doc
 
             total_pages = data.get("total_pages", 1)
             if page >= total_pages or not results:
@@ -412,44 +885,117 @@ class SBACollector:
             page += 1
             time.sleep(0.5)  # Be respectful
 
-        # Filter to actual disaster declarations only
-        filtered = []
-        seen_doc_numbers = set()
-        for doc in all_results:
-            doc_num = doc.get("document_number", "")
-            if doc_num in seen_doc_numbers:
-                continue
-            seen_doc_numbers.add(doc_num)
-            title = (doc.get("title") or "").lower()
-            # Must be a declaration or amendment notice related to disasters
-            is_declaration = "declaration" in title and "disaster" in title
-            is_amendment = "amendment" in title and "disaster" in title
-            if is_declaration or is_amendment:
-                # Skip presidential declarations (overlap with FEMA)
-                if "presidential" in title:
-                    continue
-                # Skip filing deadline / reopening notices (not new declarations)
-                if "impacted by" in title or "filing" in title or "reopening" in title:
-                    continue
-                filtered.append(doc)
+    def _get_listing_page(self, params: Dict) -> Dict:
+        """
+        GET one FR listing page as a conditional request. The last 200 response for
+        the same query is kept in FR_CACHE_DIR with its ETag/Last-Modified; a 304
+        Not Modified reuses that stored body instead of downloading it again.
+        The file is keyed without the publication-date cutoff, which moves daily,
+        so each page has one entry that is overwritten rather than a new file per
+        day; validators are only sent while the stored cutoff still matches.
+        """
+        stable = {k: v for k, v in params.items() if k != "conditions[publication_date][gte]"}
+        query_key = hashlib.sha256(json.dumps(stable, sort_keys=True).encode()).hexdigest()[:16]
+        cache_path = FR_CACHE_DIR / "listing" / f"{query_key}.json"
+        cutoff = params.get("conditions[publication_date][gte]")
+        headers = {}
+        try:
+            stored = json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            stored = None  # Nothing stored (or unreadable) — plain GET
+        if stored is not None and stored.get("cutoff") != cutoff:
+            stored = None  # Stored body answers an older cutoff — plain GET
+        if stored is not None:
+            if stored.get("etag"):
+                headers["If-None-Match"] = stored["etag"]
+            if stored.get("lastModified"):
+                headers["If-Modified-Since"] = stored["lastModified"]
+
+        resp = _SESSION.get(self.FR_API, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304 and stored is not None:
+            return stored["data"]
+        resp.raise_for_status()
+        data = json_loads(resp.content)
 
-        return filtered
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            _write_cache_file(cache_path, json.dumps(
+                {"cutoff": cutoff, "etag": etag, "lastModified": last_modified, "data": data}
+            ))
+        return data
 
-    def _parse_document(self, doc: Dict) -> List[Optional[Dict]]:
+    def _fetch_raw_text(self, doc: Dict):
         """
-        Parse a Federal Register document into DST records.
-        Returns a list because contiguous counties in other states create separate records.
+        Download a document's raw text, served from FR_CACHE_DIR when a fresh copy
+        exists. Runs on a worker thread, so failures are returned (not raised) and
+        reported against the document by collect().
+        Returns None when the document has no raw_text_url.
         """
         raw_text_url = doc.get("raw_text_url")
         if not raw_text_url:
-            return []
+            return None
+        cache_path = self._raw_text_cache_path(doc)
+        if cache_path is not None:
+            try:
+                age = time.time() - cache_path.stat().st_mtime
+                if age < FR_CACHE_MAX_AGE_DAYS * 86400:
+                    return cache_path.read_text(encoding="utf-8")
+            except OSError:
+                pass  # Not cached yet (or unreadable) — fetch it
+        try:
+            with _SESSION.get(raw_text_url, stream=True, timeout=REQUEST_TIMEOUT) as resp:
+                resp.raise_for_status()
+                full_text = self._read_notice_text(resp)
+        except Exception as e:
+            return e
+        if cache_path is not None:
+            _write_cache_file(cache_path, full_text)
+        return full_text
 
-        resp = requests.get(
-            raw_text_url, timeout=REQUEST_TIMEOUT,
-            headers={"User-Agent": USER_AGENT}
-        )
-        resp.raise_for_status()
-        full_text = resp.text
+    @staticmethod
+    def _read_notice_text(resp: requests.Response) -> str:
+        """
+        Read a streamed FR raw-text body, stopping once the contiguous-counties
+        section has been closed by its terminator ("Interest Rates", etc.).
+        Everything the parsers use (dates, primary, contiguous) precedes it, and
+        the remainder is interest-rate and billing boilerplate. Without a closed
+        contiguous section the whole body is read. The section regex only runs
+        again when a terminator shows up in the newly read text, so reading
+        stays linear in the body size.
+        """
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        text = ""
+        for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
+            scan_from = max(0, len(text) - _TERMINATOR_OVERLAP)
+            text += chunk
+            if not _RE_CONTIGUOUS_TERMINATOR.search(text, scan_from):
+                continue
+            match = _RE_CONTIGUOUS_SECTION.search(text)
+            # A non-empty terminator (not just end-of-buffer) means the section is complete
+            if match and match.end() > match.end(1):
+                return text
+        return text
+
+    @staticmethod
+    def _raw_text_cache_path(doc: Dict) -> Optional[Path]:
+        """
+        Cache file for a document, keyed by FR document number and
+        FR_TEXT_CACHE_VERSION (None if it has no document number).
+        """
+        doc_number = _RE_CACHE_KEY_UNSAFE.sub("_", doc.get("document_number") or "")
+        if not doc_number:
+            return None
+        return FR_CACHE_DIR / f"{doc_number}.v{FR_TEXT_CACHE_VERSION}.txt"
+
+    def _parse_document(self, doc: Dict, full_text: Optional[str]) -> List[Optional[Dict]]:
+        """
+        Parse a Federal Register document (with its downloaded raw text) into DST records.
+        Returns a list because contiguous counties in other states create separate records.
+        """
+        if full_text is None:
+            return []
 
         doc_number = doc.get("document_number", "UNKNOWN")
         publication_date = doc.get("publication_date")
@@ -472,8 +1018,10 @@ class SBACollector:
             # Fall back to declaration date
             incident_start = decl_date
 
-        # Extract incident name from abstract or title
+        # Extract incident name from abstract or title; shared by every record below
         incident_name = self._extract_incident_name(abstract, title_raw)
+        title = incident_name or title_raw
+        incident_type = self._infer_incident_type(title)
 
         # Extract counties
         primary_counties = self._extract_primary_counties(full_text)
@@ -487,8 +1035,8 @@ class SBACollector:
                 id_str=f"SBA-{doc_number}-{primary_state}",
                 source="SBA",
                 state=primary_state,
-                title=incident_name or title_raw,
-                incident_type=self._infer_incident_type(incident_name or title_raw),
+                title=title,
+                incident_type=incident_type,
                 declaration_date=decl_date,
                 incident_start=incident_start,
                 incident_end=incident_end,
@@ -512,8 +1060,8 @@ class SBACollector:
                 id_str=f"SBA-{doc_number}-{state_code}",
                 source="SBA",
                 state=state_code,
-                title=incident_name or title_raw,
-                incident_type=self._infer_incident_type(incident_name or title_raw),
+                title=title,
+                incident_type=incident_type,
                 declaration_date=decl_date,
                 incident_start=incident_start,
                 incident_end=incident_end,
@@ -531,32 +1079,37 @@ class SBACollector:
     def _extract_state_from_title(self, title: str) -> Optional[str]:
         """Extract state code from title like 'Declaration of a Disaster for the State of CALIFORNIA'."""
         # Try "State of [NAME]" pattern
-        match = re.search(r"State of\s+([A-Z][A-Za-z\s]+?)(?:\s*$|\s*dated)", title, re.IGNORECASE)
+        match = _RE_STATE_OF.search(title)
         if match:
             state_name = match.group(1).strip().title()
             code = STATE_NAME_TO_CODE.get(state_name)
             if code:
                 return code
 
+        title_lower = title.lower()
         # "Rural Area" declarations are typically in Alaska (tribal villages)
-        if "rural area" in title.lower():
+        if "rural area" in title_lower:
             # Check abstract/full text for state, but assume AK for now
             return "AK"
 
         # Try matching state names directly
-        for name, code in STATE_NAME_TO_CODE.items():
-            if name.upper() in title.upper():
-                return code
+        match = _STATE_NAME_RE.search(title_lower)
+        if match:
+            return _STATE_NAME_LOWER_TO_CODE[match.group(1)]
 
         return None
 
     def _extract_incident_dates(self, text: str) -> Tuple[Optional[date], Optional[date]]:
         """Extract incident start/end from the full text DATES section."""
+        # Single pass over the text for pattern start positions. Each pattern is then
+        # tried only at its own anchors, in order — the first hit is exactly what a
+        # full-text .search() would have returned.
+        period_at, beginning_at = [], []
+        for anchor in _RE_DATE_ANCHORS.finditer(text):
+            (period_at if anchor.lastgroup == "period" else beginning_at).append(anchor.start())
+
         # Pattern 1: "Incident Period: January 23, 2026 through January 25, 2026"
-        match = re.search(
-            r"Incident\s+Period:\s*(.+?)(?:through|to)\s+(.+?)(?:\.|$)",
-            text, re.IGNORECASE
-        )
+        match = _first_match_at(_RE_INCIDENT_PERIOD_THROUGH, text, period_at)
         if match:
             start = parse_date_fuzzy(match.group(1).strip())
             end = parse_date_fuzzy(match.group(2).strip())
@@ -564,10 +1117,7 @@ class SBACollector:
                 return start, end
 
         # Pattern 2: "beginning December 16, 2025 and ending December 26, 2025"
-        match = re.search(
-            r"beginning\s+(.+?)\s+and\s+ending\s+(.+?)(?:\.|,|$)",
-            text, re.IGNORECASE
-        )
+        match = _first_match_at(_RE_BEGIN_END, text, beginning_at)
         if match:
             start = parse_date_fuzzy(match.group(1).strip())
             end = parse_date_fuzzy(match.group(2).strip())
@@ -575,10 +1125,7 @@ class SBACollector:
                 return start, end
 
         # Pattern 3: "beginning on December 16, 2025, and continuing"
-        match = re.search(
-            r"beginning\s+(?:on\s+)?(.+?)(?:,?\s+and\s+continuing)",
-            text, re.IGNORECASE
-        )
+        match = _first_match_at(_RE_BEGIN_CONTINUING, text, beginning_at)
         if match:
             start = parse_date_fuzzy(match.group(1).strip())
             if start:
@@ -588,10 +1135,7 @@ class SBACollector:
         # This must come AFTER patterns 1-3 to avoid false matches on multi-date patterns.
         # When FR specifies a single date with no "through"/"and continuing", the incident
         # was a one-day event (fire, storm, crash). End date = start date.
-        match = re.search(
-            r"Incident\s+Period:\s*(\w+\s+\d{1,2},?\s+\d{4})\s*\.?",
-            text, re.IGNORECASE
-        )
+        match = _first_match_at(_RE_INCIDENT_SINGLE, text, period_at)
         if match:
             start = parse_date_fuzzy(match.group(1).strip())
             if start:
@@ -602,11 +1146,11 @@ class SBACollector:
     def _extract_incident_name(self, abstract: str, title: str) -> Optional[str]:
         """Extract incident name like '2025 Late December Storm' from abstract or title."""
         # From abstract: "Incident: 2025 Late December Storm."
-        match = re.search(r"Incident:\s*(.+?)(?:\.|$)", abstract)
+        match = _RE_INCIDENT_NAME.search(abstract)
         if match:
             return match.group(1).strip()
         # From abstract: "Incident Period: ... Incident: ..."
-        match = re.search(r"Incident:\s*(.+?)(?:\.|$)", title)
+        match = _RE_INCIDENT_NAME.search(title)
         if match:
             return match.group(1).strip()
         return None
@@ -614,34 +1158,14 @@ class SBACollector:
     def _extract_primary_counties(self, text: str) -> List[str]:
         """Extract primary counties from 'Primary Counties:' section."""
         # Look for "Primary Counties:" or "Primary Parishes:" etc.
-        match = re.search(
-            r"Primary\s+(?:Counties|Parishes|Boroughs|Areas)(?:\s*\(Physical\s+Damage[^)]*\))?:\s*(.+?)(?:Contiguous|$)",
-            text, re.IGNORECASE | re.DOTALL
-        )
+        match = _RE_PRIMARY_COUNTIES.search(text)
         if not match:
             # Try alternate pattern — stop at double newline, "Interest", or "Contiguous"
-            match = re.search(
-                r"Primary\s+(?:Counties|Parishes):\s*(.+?)(?:\n\n|\nContiguous|\nInterest)",
-                text, re.IGNORECASE | re.DOTALL
-            )
+            match = _RE_PRIMARY_ALT.search(text)
         if not match:
             return []
 
-        counties_text = match.group(1).strip()
-        # Split by comma, semicolon, or newline
-        counties = re.split(r"[,;\n]+", counties_text)
-        counties = [c.strip().rstrip(".") for c in counties if c.strip() and len(c.strip()) > 1]
-        # Filter out non-county items (state names, headers, metadata, HTML)
-        counties = [c for c in counties if not re.match(r"^(In |and |the )", c, re.IGNORECASE)]
-        # Reject garbage: lines with special chars, HTML, numbers, or very long strings
-        counties = [
-            c for c in counties
-            if len(c) < 60
-            and not re.search(r"[<>(){}\[\]|/\\]", c)
-            and not re.search(r"^\d", c)
-            and not re.search(r"(Catalog|BILLING|Available|Credit|Percent|Interest|Elsewhere|Filed|Code|--------)", c, re.IGNORECASE)
-        ]
-        return counties
+        return _split_counties(match.group(1).strip(), reject_garbage=True)
 
     def _extract_contiguous_counties(self, text: str) -> Dict[str, List[str]]:
         """
@@ -651,10 +1175,7 @@ class SBACollector:
         result: Dict[str, List[str]] = {}
 
         # Find the contiguous section
-        match = re.search(
-            r"Contiguous\s+(?:Counties|Parishes|Boroughs|Areas)(?:\s*\([^)]*\))?:\s*(.+?)(?:Interest\s+Rates|A\s+list\s+of|The\s+interest|$)",
-            text, re.IGNORECASE | re.DOTALL
-        )
+        match = _RE_CONTIGUOUS_SECTION.search(text)
         if not match:
             return result
 
@@ -663,30 +1184,18 @@ class SBACollector:
         # Pattern: "In [State]: county1, county2, county3."
         # or "In [State]: county1, county2"
         # Primary pattern: "In [State]: county1, county2"
-        for state_match in re.finditer(
-            r"(?:^|\n)\s*(?:In\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*:\s*([^:]+?)(?=(?:\n\s*(?:In\s+)?[A-Z][a-z]|$))",
-            contiguous_text, re.DOTALL
-        ):
+        for state_match in _RE_STATE_COUNTIES_LINE.finditer(contiguous_text):
             state_name = state_match.group(1).strip()
-            counties_str = state_match.group(2).strip()
-            counties = re.split(r"[,;\n]+", counties_str)
-            counties = [c.strip().rstrip(".") for c in counties if c.strip() and len(c.strip()) > 1]
-            counties = [c for c in counties if not re.match(r"^(In |and |the )", c, re.IGNORECASE)]
+            counties = _split_counties(state_match.group(2).strip())
             if counties:
                 result[state_name] = counties
 
         # Fallback pattern: "contiguous counties in the State of [Name]" or
         # "the following counties in [Name]: county1, county2"
         if not result:
-            for state_match in re.finditer(
-                r"(?:contiguous\s+counties\s+in\s+(?:the\s+State\s+of\s+)?|the\s+following\s+counties\s+in\s+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:\-—]\s*([^.]+)",
-                contiguous_text, re.IGNORECASE
-            ):
+            for state_match in _RE_CONTIGUOUS_IN_STATE.finditer(contiguous_text):
                 state_name = state_match.group(1).strip().title()
-                counties_str = state_match.group(2).strip()
-                counties = re.split(r"[,;\n]+", counties_str)
-                counties = [c.strip().rstrip(".") for c in counties if c.strip() and len(c.strip()) > 1]
-                counties = [c for c in counties if not re.match(r"^(In |and |the )", c, re.IGNORECASE)]
+                counties = _split_counties(state_match.group(2).strip())
                 if counties:
                     result[state_name] = counties
 
@@ -694,67 +1203,21 @@ class SBACollector:
 
     def _infer_incident_type(self, name: str) -> str:
         """Infer incident type from disaster name."""
-        name_lower = name.lower()
-        if "hurricane" in name_lower:
+        found = {m.lastgroup for m in _INCIDENT_TYPE_RE.finditer(name.lower())}
+        if "hurricane" in found:
             return "Hurricane"
-        if "wildfire" in name_lower:
+        if "wildfire" in found:
             return "Wildfire"
-        if "fire" in name_lower:
+        if "fire" in found:
             # Distinguish structure fires from wildfires
-            if any(kw in name_lower for kw in ["apartment", "building", "complex", "house", "structure", "residential", "alarm"]):
-                return "Fire"
-            return "Wildfire"
-        if "flood" in name_lower or "tidal" in name_lower:
-            return "Flood"
-        if "tornado" in name_lower:
-            return "Tornado"
-        if "winter storm" in name_lower or "ice storm" in name_lower or "snow" in name_lower:
-            return "Severe Winter Storm"
-        if "storm" in name_lower or "severe" in name_lower:
-            return "Severe Storm"
-        if "drought" in name_lower:
-            return "Drought"
-        if "earthquake" in name_lower:
-            return "Earthquake"
+            return "Fire" if "structure" in found else "Wildfire"
+        for group, incident_type in _INCIDENT_TYPE_ORDER:
+            if group in found:
+                return incident_type
         return "Disaster"
 
-    def _get_curated_sba_override_ids(self) -> set:
-        """
-        IDs of FR-parsed records that curated data should replace.
-        Includes records that are expired — those must be suppressed from FR output
-        even though the curated build_record returns None.
-        """
-        return {
-            "SBA-2025-12380-CA",  # Expired (incident ended Jun 18, 2025)
-            "SBA-2025-16217-AK",  # Wrong incidentStart
-            "SBA-2025-23433-CT",  # Wrong incidentStart/End
-            "SBA-2025-23433-NJ",  # Contiguous record, same date issues
-            "SBA-2025-04575-OR",  # Expired + corrupted counties
-            # Single-day events: parser missed end date (Pattern 4 fix in _extract_incident_dates)
-            # These overrides ensure correct data even if the parser fix doesn't retroactively
-            # apply to cached FR text.
-            "SBA-2025-01588-TX",  # Single-day storm Dec 28, 2024 — EXPIRED
-            "SBA-2025-01871-TX",  # Same event area expansion — EXPIRED
-            "SBA-2025-04573-IL",  # Single-day fire Jan 25, 2025 — EXPIRED
-            "SBA-2025-04573-IN",  # Contiguous for above — EXPIRED
-            "SBA-2025-04581-NJ",  # Single-day fire Jan 10, 2025 (primary=NY) — EXPIRED
-            "SBA-2025-04581-NY",  # Primary record for above — EXPIRED
-            "SBA-2025-07251-IL",  # Single-day storm Mar 19, 2025 (primary=IN) — EXPIRED
-            "SBA-2025-07251-IN",  # Primary record for above — EXPIRED
-            "SBA-2025-20283-IN",  # Single-day crash Nov 4, 2025 (primary=KY) — EXPIRED
-            "SBA-2025-20283-KY",  # Primary record for above — EXPIRED
-            # Wrong incidentStart (used FR pub date) + missing incidentEnd (single-day events)
-            "SBA-2025-05997-IL",  # Single-day apartment fire Feb 22, 2025 — EXPIRED
-            "SBA-2025-05997-IN",  # Contiguous for above — EXPIRED
-            "SBA-2025-23887-MN",  # Single-day fire Oct 26, 2025 — EXPIRED
-            # Amendment expanded county list — curated override has full list
-            "SBA-2026-02294-LA",  # Original had 5 parishes; amendment adds 16 more
-            # PA Hotel Fire — curated includes primary + contiguous counties
-            "SBA-2026-04576-PA",
-            "SBA-2026-04576-NJ",
-        }
-
-    def _get_curated_sba(self) -> List[Optional[Dict]]:
+    @staticmethod
+    def _get_curated_sba() -> List[Optional[Dict]]:
         """
         Curated SBA overrides/fallbacks.
         Used to correct records where the FR raw text parser gets dates wrong
@@ -1236,6 +1699,19 @@ class SBACollector:
         return curated
 
 
+def _parse_fr_document(doc: Dict, full_text: Optional[str]) -> Tuple[List[Dict], List[str], Optional[str]]:
+    """
+    Parse one FR notice with a scratch collector. Module-level (picklable) so it
+    can run in a worker process. Returns (records, warnings, error message).
+    """
+    collector = SBACollector()
+    try:
+        records = collector._parse_document(doc, full_text)
+    except Exception as e:
+        return [], collector.warnings, str(e)
+    return records, collector.warnings, None
+
+
 # =========================================================================
 # HHS Collector — Curated + Scrape Attempt
 # =========================================================================
@@ -1257,15 +1733,17 @@ class HHSCollector:
 
     def collect(self) -> List[Dict]:
         # Start with curated data
-        self.records = self._get_curated_hhs()
+        self.records = cached_curated(self._get_curated_hhs)
 
         # Attempt scrape for new PHEs
         try:
             scraped = self._scrape_phe_page()
-            existing_ids = {r["id"] for r in self.records}
+            # Keyed by id: curated entries win, and duplicate scraped ids are kept once
+            merged = {r["id"]: r for r in self.records}
             for rec in scraped:
-                if rec and rec["id"] not in existing_ids:
-                    self.records.append(rec)
+                if rec:
+                    merged.setdefault(rec["id"], rec)
+            self.records = list(merged.values())
         except Exception as e:
             self.warnings.append(f"HHS scrape failed ({type(e).__name__}: {e}) — using curated data only")
 
@@ -1307,19 +1785,18 @@ class HHSCollector:
 
     def _scrape_phe_page(self) -> List[Dict]:
         """Attempt to scrape HHS PHE page. May fail due to SSL/SharePoint."""
-        resp = requests.get(
-            self.PHE_URL, timeout=REQUEST_TIMEOUT,
-            headers={"User-Agent": USER_AGENT},
+        body = fetch_scrape_page(
+            "hhs_phe", self.PHE_URL,
             verify=True  # Will fail if cert is bad
         )
-        resp.raise_for_status()
         # SharePoint pages are complex — basic parsing
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = parse_html(body)
         # Look for active PHE indicators in page content
         # This is best-effort; curated data is the reliable path
         return []
 
-    def _get_curated_hhs(self) -> List[Optional[Dict]]:
+    @staticmethod
+    def _get_curated_hhs() -> List[Optional[Dict]]:
         """
         Curated HHS PHE data.
 
@@ -1382,15 +1859,17 @@ class FMCSACollector:
 
     def collect(self) -> List[Dict]:
         # Start with curated data
-        self.records = self._get_curated_fmcsa()
+        self.records = cached_curated(self._get_curated_fmcsa)
 
         # Attempt scrape for new declarations
         try:
             scraped = self._scrape_listing()
-            existing_ids = {r["id"] for r in self.records}
+            # Keyed by id: curated entries win, and duplicate scraped ids are kept once
+            merged = {r["id"]: r for r in self.records}
             for rec in scraped:
-                if rec and rec["id"] not in existing_ids:
-                    self.records.append(rec)
+                if rec:
+                    merged.setdefault(rec["id"], rec)
+            self.records = list(merged.values())
         except Exception as e:
             self.warnings.append(f"FMCSA scrape failed ({type(e).__name__}: {e}) — using curated data only")
 
@@ -1398,17 +1877,14 @@ class FMCSACollector:
 
     def _scrape_listing(self) -> List[Dict]:
         """Attempt to scrape FMCSA emergency declarations page."""
-        resp = requests.get(
-            self.LISTING_URL, timeout=REQUEST_TIMEOUT,
-            headers={"User-Agent": USER_AGENT}
-        )
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        body = fetch_scrape_page("fmcsa_listing", self.LISTING_URL)
+        tree = parse_html(body)
         # Parse emergency declaration links
         # Known issue: FMCSA returns 403 to automated requests
         return []
 
-    def _get_curated_fmcsa(self) -> List[Optional[Dict]]:
+    @staticmethod
+    def _get_curated_fmcsa() -> List[Optional[Dict]]:
         """
         Curated FMCSA emergency declarations.
         Updated when new FMCSA emergencies are discovered.
@@ -1423,30 +1899,27 @@ class FMCSACollector:
         # Issued Jan 23, 2026 (document text: "this 23rd day of January 2026").
         # Extended Feb 3, 2026 to Feb 20, 2026.
         # Source: https://www.fmcsa.dot.gov/emergency/esc-msc-ssc-wsc-regional-emergency-declaration-no-2026-001-01-22-2026
-        fmcsa_2026_001_states = [
+        fmcsa_2026_001_states = (
             "AL", "AR", "CO", "CT", "DE", "DC", "FL", "GA", "IL", "IN",
             "IA", "KS", "KY", "LA", "MD", "MA", "MI", "MN", "MS", "MO",
             "MT", "NE", "NH", "NJ", "NY", "NC", "ND", "OH", "OK", "PA",
             "RI", "SC", "SD", "TN", "TX", "VT", "VA", "WV", "WI", "WY",
-        ]
-        for st in fmcsa_2026_001_states:
-            rec = build_record(
-                id_str=f"FMCSA-2026-001-{st}",
-                source="FMCSA",
-                state=st,
-                title="FMCSA Regional Emergency Declaration 2026-001 — Severe Winter Storms",
-                incident_type="Severe Winter Storm",
-                declaration_date=date(2026, 1, 23),
-                incident_start=date(2026, 1, 20),
-                incident_end=date(2026, 2, 20),  # Extended expiration
-                renewal_dates_list=None,
-                counties=["Statewide"],
-                statewide=True,
-                official_url="https://www.fmcsa.dot.gov/emergency/esc-msc-ssc-wsc-regional-emergency-declaration-no-2026-001-01-22-2026",
-                confidence="curated",
-            )
-            if rec:
-                curated.append(rec)
+        )
+        curated.extend(fanout_record(
+            fmcsa_2026_001_states,
+            id_prefix="FMCSA-2026-001-",
+            source="FMCSA",
+            title="FMCSA Regional Emergency Declaration 2026-001 — Severe Winter Storms",
+            incident_type="Severe Winter Storm",
+            declaration_date=date(2026, 1, 23),
+            incident_start=date(2026, 1, 20),
+            incident_end=date(2026, 2, 20),  # Extended expiration
+            renewal_dates_list=None,
+            counties=STATEWIDE,
+            statewide=True,
+            official_url="https://www.fmcsa.dot.gov/emergency/esc-msc-ssc-wsc-regional-emergency-declaration-no-2026-001-01-22-2026",
+            confidence="curated",
+        ))
 
         # --- FMCSA 2025-012: Heating Fuels Emergency (Dec 2025) ---
         # Original: Dec 12, 2025 for DE/NJ/NY/PA.
@@ -1455,55 +1928,49 @@ class FMCSACollector:
         # Extended Feb 13, 2026 to Feb 28, 2026 — added ME and VT.
         # Extended Feb 27, 2026 to Mar 14, 2026 — added NC, OH, RI, VA.
         # Pipeline break at Marcus Hook refinery + winter storms disrupted propane supply.
-        fmcsa_2025_012_states = [
+        fmcsa_2025_012_states = (
             "CT", "DE", "MA", "MD", "ME", "NC", "NH", "NJ", "NY",
             "OH", "PA", "RI", "VA", "VT", "WV",
-        ]
-        for st in fmcsa_2025_012_states:
-            rec = build_record(
-                id_str=f"FMCSA-2025-012-{st}",
-                source="FMCSA",
-                state=st,
-                title="FMCSA Emergency Declaration 2025-012 — Heating Fuels Shortage",
-                incident_type="Fuel Supply Emergency",
-                declaration_date=date(2025, 12, 12),
-                incident_start=date(2025, 12, 10),
-                incident_end=date(2026, 3, 14),  # Extended Feb 27 to Mar 14
-                renewal_dates_list=None,
-                counties=["Statewide"],
-                statewide=True,
-                official_url="https://www.fmcsa.dot.gov/emergency/esc-de-nj-ny-and-pa-regional-emergency-declaration-no-2025-012",
-                confidence="curated",
-            )
-            if rec:
-                curated.append(rec)
+        )
+        curated.extend(fanout_record(
+            fmcsa_2025_012_states,
+            id_prefix="FMCSA-2025-012-",
+            source="FMCSA",
+            title="FMCSA Emergency Declaration 2025-012 — Heating Fuels Shortage",
+            incident_type="Fuel Supply Emergency",
+            declaration_date=date(2025, 12, 12),
+            incident_start=date(2025, 12, 10),
+            incident_end=date(2026, 3, 14),  # Extended Feb 27 to Mar 14
+            renewal_dates_list=None,
+            counties=STATEWIDE,
+            statewide=True,
+            official_url="https://www.fmcsa.dot.gov/emergency/esc-de-nj-ny-and-pa-regional-emergency-declaration-no-2025-012",
+            confidence="curated",
+        ))
 
         # --- FMCSA 2025-013: Heating Fuels — Midwest/South (Dec 2025) ---
         # Issued Dec 23, 2025. Extended Jan 15, 2026 to Feb 15, 2026.
         # Extended Feb 14, 2026 to Feb 28, 2026 (confirmed via PA Propane Gas Assn).
         # Pipeline break + winter storms affecting heating fuel delivery.
         # Note: MI was never part of this declaration (MN is correct per FMCSA source).
-        fmcsa_2025_013_states = [
+        fmcsa_2025_013_states = (
             "IL", "IA", "KS", "KY", "MN", "MO", "NE", "OH", "TN", "WI",
-        ]
-        for st in fmcsa_2025_013_states:
-            rec = build_record(
-                id_str=f"FMCSA-2025-013-{st}",
-                source="FMCSA",
-                state=st,
-                title="FMCSA Regional Emergency Declaration 2025-013 — Heating Fuels",
-                incident_type="Fuel Supply Emergency",
-                declaration_date=date(2025, 12, 23),
-                incident_start=date(2025, 12, 20),
-                incident_end=date(2026, 2, 28),  # Extended Feb 14 to Feb 28
-                renewal_dates_list=None,
-                counties=["Statewide"],
-                statewide=True,
-                official_url="https://www.fmcsa.dot.gov/emergency/msc-ssc-regional-emergency-declaration-no-2025-013-heating-fuels-12-23-2025",
-                confidence="curated",
-            )
-            if rec:
-                curated.append(rec)
+        )
+        curated.extend(fanout_record(
+            fmcsa_2025_013_states,
+            id_prefix="FMCSA-2025-013-",
+            source="FMCSA",
+            title="FMCSA Regional Emergency Declaration 2025-013 — Heating Fuels",
+            incident_type="Fuel Supply Emergency",
+            declaration_date=date(2025, 12, 23),
+            incident_start=date(2025, 12, 20),
+            incident_end=date(2026, 2, 28),  # Extended Feb 14 to Feb 28
+            renewal_dates_list=None,
+            counties=STATEWIDE,
+            statewide=True,
+            official_url="https://www.fmcsa.dot.gov/emergency/msc-ssc-regional-emergency-declaration-no-2025-013-heating-fuels-12-23-2025",
+            confidence="curated",
+        ))
 
         # --- FMCSA 2025-014: Washington State Flooding (Nov-Dec 2025) ---
         # Original: Nov 2025 for WA. Extended Dec 23, 2025 to Jan 23, 2026.
@@ -1520,7 +1987,7 @@ class FMCSACollector:
             incident_start=date(2025, 11, 19),
             incident_end=date(2026, 1, 23),  # Extended expiration (Jan 23, verified via PDF)
             renewal_dates_list=None,
-            counties=["Statewide"],
+            counties=STATEWIDE,
             statewide=True,
             official_url="https://www.fmcsa.dot.gov/emergency/wsc-wa-extension-emergency-declaration-no-2025-014-12-23-2025",
             confidence="curated",
@@ -1544,10 +2011,11 @@ class USDACollector:
         self.warnings: List[str] = []
 
     def collect(self) -> List[Dict]:
-        self.records = self._get_curated_usda()
+        self.records = cached_curated(self._get_curated_usda)
         return self.records
 
-    def _get_curated_usda(self) -> List[Optional[Dict]]:
+    @staticmethod
+    def _get_curated_usda() -> List[Optional[Dict]]:
         """
         Curated USDA secretarial disaster designations.
 
@@ -1577,10 +2045,22 @@ class StateCollector:
         self.warnings: List[str] = []
 
     def collect(self) -> List[Dict]:
-        self.records = self._get_curated_state()
+        """
+        Curated rows, built once per day and handed out as fresh copies.
+        A row whose id is already taken is dropped with a warning.
+        """
+        by_id: Dict[str, Dict] = {}
+        for rec in cached_curated(self._get_curated_state):
+            kept = by_id.setdefault(rec["id"], rec)
+            if kept is not rec:
+                self.warnings.append(
+                    f"Duplicate curated id {rec['id']}: kept '{kept['title']}', dropped '{rec['title']}'"
+                )
+        self.records = list(by_id.values())
         return self.records
 
-    def _get_curated_state(self) -> List[Optional[Dict]]:
+    @staticmethod
+    def _get_curated_state() -> List[Dict]:
         """
         Curated state governor emergency declarations.
 
@@ -1591,2843 +2071,2261 @@ class StateCollector:
         To add a new state declaration:
         1. Find the governor's executive order or proclamation
         2. Get the official URL (governor's office website)
-        3. Identify affected counties (or "Statewide")
-        4. Add a build_record() call below
+        3. Identify affected counties (or STATEWIDE)
+        4. Add a dict(...) row below with the build_record() arguments; source,
+           confidence and renewal_dates_list default to "STATE", "curated", None
+        Ids must be unique: collect() keeps only the first row per id and
+        warns with the colliding id (audit_curated_data.py only sees the
+        deduplicated output, so it cannot catch these).
+
+        Rows that build_record rejects (e.g. expired) are left out, so the
+        returned list holds no None entries.
 
         Last comprehensive review: 2026-02-11
         """
-        curated = []
-
-        # =============================================================
-        # JAN 2026 WINTER STORM GOVERNOR DECLARATIONS
-        # Storm hit ~Jan 20-27, 2026 across eastern/central US
-        # =============================================================
-
-        # --- TEXAS ---
-        # Gov Abbott, Jan 22 declaration, 219 counties (expanded Jan 25)
-        # No termination found
-        rec = build_record(
-            id_str="STATE-2026-001-TX",
-            source="STATE", state="TX",
-            title="Governor Abbott Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.texas.gov/news/post/governor-abbott-provides-update-on-texas-ongoing-response-to-severe-winter-weather-",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NORTH CAROLINA ---
-        # Gov Stein, Jan 21 declaration, statewide
-        rec = build_record(
-            id_str="STATE-2026-001-NC",
-            source="STATE", state="NC",
-            title="Governor Stein Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 21),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.nc.gov/news/press-releases/2026/01/21/governor-stein-declares-state-emergency-ahead-winter-storm",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- VIRGINIA ---
-        # Gov Spanberger, Jan 22, EO 11, statewide
-        rec = build_record(
-            id_str="STATE-2026-001-VA",
-            source="STATE", state="VA",
-            title="Governor Spanberger Emergency Declaration (EO 11) — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.governor.virginia.gov/newsroom/news-releases/2026/january-releases/name-1111570-en.html",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- GEORGIA (Winter Storm Fern) ---
-        # Gov Kemp, Jan 22, statewide, effective through Jan 29
-        rec = build_record(
-            id_str="STATE-2026-001-GA",
-            source="STATE", state="GA",
-            title="Governor Kemp Emergency Declaration — January 2026 Winter Storm (Fern)",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 22),
-            incident_end=date(2026, 1, 29),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.georgia.gov/press-releases/2026-01-22/gov-kemp-declares-state-emergency-activates-state-operations-center-ahead",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- GEORGIA (Winter Storm Gianna) ---
-        # Gov Kemp, Jan 30, statewide, effective through Feb 6
-        rec = build_record(
-            id_str="STATE-2026-002-GA",
-            source="STATE", state="GA",
-            title="Governor Kemp Emergency Declaration — January 2026 Winter Storm (Gianna)",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 30),
-            incident_start=date(2026, 1, 30),
-            incident_end=date(2026, 2, 6),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.georgia.gov/press-releases/2026-01-30/gov-kemp-declares-new-state-emergency-ahead-winter-storm",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW YORK (EO 55, Dec 26 2025 Winter Storm) ---
-        # 35 counties. EO 55.1 extended to statewide scope.
-        rec = build_record(
-            id_str="STATE-2025-002-NY",
-            source="STATE", state="NY",
-            title="Governor Hochul Emergency Declaration (EO 55) — December 2025 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 12, 26),
-            incident_start=date(2025, 12, 26),
-            incident_end=date(2026, 1, 25),
-            renewal_dates_list=None,
-            counties=["Albany", "Bronx", "Broome", "Cayuga", "Chenango", "Columbia",
-                       "Cortland", "Delaware", "Dutchess", "Fulton", "Greene", "Herkimer",
-                       "Kings", "Madison", "Montgomery", "Nassau", "New York", "Oneida",
-                       "Onondaga", "Orange", "Oswego", "Otsego", "Putnam", "Queens",
-                       "Rensselaer", "Richmond", "Rockland", "Saratoga", "Schenectady",
-                       "Schoharie", "Suffolk", "Sullivan", "Ulster", "Wayne", "Westchester"],
-            statewide=False,
-            official_url="https://www.governor.ny.gov/executive-order/no-55-declaring-disaster-emergency-counties-albany-bronx-broome-cayuga-chenango",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW YORK (EO 57, Jan 23 2026 Winter Storm) ---
-        # Statewide. Previously had wrong URL (pointed to EO 55).
-        rec = build_record(
-            id_str="STATE-2026-001-NY",
-            source="STATE", state="NY",
-            title="Governor Hochul Emergency Declaration (EO 57) — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.governor.ny.gov/executive-order/no-57-declaring-disaster-emergency-throughout-state-new-york",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW YORK (EO 58, Feb 21 2026 Nor'easter / Winter Storm Hernando) ---
-        # 22+ counties
-        rec = build_record(
-            id_str="STATE-2026-003-NY",
-            source="STATE", state="NY",
-            title="Governor Hochul Emergency Declaration (EO 58) — February 2026 Nor'easter",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 21),
-            incident_start=date(2026, 2, 22),
-            incident_end=date(2026, 3, 24),
-            renewal_dates_list=None,
-            counties=["Albany", "Bronx", "Columbia", "Delaware", "Dutchess", "Greene",
-                       "Kings", "Nassau", "New York", "Orange", "Otsego", "Putnam",
-                       "Queens", "Rensselaer", "Richmond", "Rockland", "Schenectady",
-                       "Schoharie", "Suffolk", "Sullivan", "Ulster", "Westchester"],
-            statewide=False,
-            official_url="https://www.governor.ny.gov/executive-order/no-58-declaring-disaster-emergency-counties-albany-bronx-columbia-greene-delaware",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- PENNSYLVANIA ---
-        # Gov Shapiro, Jan 24, statewide, 21-day auto-expire (~Feb 14)
-        rec = build_record(
-            id_str="STATE-2026-001-PA",
-            source="STATE", state="PA",
-            title="Governor Shapiro Disaster Emergency Proclamation — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 24),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 2, 14),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.pa.gov/governor/newsroom/2026-press-releases/gov-shapiro-signs-proclamation-of-disaster-emergency-to-prepare-/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- DELAWARE ---
-        # Gov Meyer, Jan 23, statewide, TERMINATED Jan 26
-        rec = build_record(
-            id_str="STATE-2026-001-DE",
-            source="STATE", state="DE",
-            title="Governor Meyer Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 1, 26),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://news.delaware.gov/2026/01/23/soe-eoc-activated-winter-storm/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW MEXICO ---
-        # Gov Lujan Grisham, Jan 22, EO 2026-005, statewide
-        rec = build_record(
-            id_str="STATE-2026-001-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency Declaration (EO 2026-005) — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.dhsem.nm.gov/governor-activates-emergency-resources-as-winter-weather-moves-into-new-mexico/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- KENTUCKY ---
-        # Gov Beshear, Jan 2026 winter storm (separate from Jan 2025)
-        rec = build_record(
-            id_str="STATE-2026-001-KY",
-            source="STATE", state="KY",
-            title="Governor Beshear Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.ky.gov/attachments/20260123_Executive-Order_2026-047_State-of-Emergency-Related-to-Continuing-Winter-Weather-Event.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- LOUISIANA ---
-        # Gov Landry, Jan 18 2025, statewide, renewed/extended
-        rec = build_record(
-            id_str="STATE-2025-001-LA",
-            source="STATE", state="LA",
-            title="Governor Landry Emergency Declaration (JML 25-12) — January 2025 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 1, 18),
-            incident_start=date(2025, 1, 18),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.louisiana.gov/news/4746",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- ARKANSAS ---
-        # Gov Sanders, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-AR",
-            source="STATE", state="AR",
-            title="Governor Sanders Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.arkansas.gov/executive_orders/sanders-declares-emergency-for-severe-winter-weather-expected-on-or-about-january-23-2026/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MISSISSIPPI ---
-        # Gov Reeves, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-MS",
-            source="STATE", state="MS",
-            title="Governor Reeves Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governorreeves.ms.gov/governor-reeves-issues-state-of-emergency-ahead-of-severe-winter-weather/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- INDIANA ---
-        # Gov Braun, Jan 25 2026, EO 26-03, statewide, 60-day window
-        rec = build_record(
-            id_str="STATE-2026-001-IN",
-            source="STATE", state="IN",
-            title="Governor Braun Disaster Emergency (EO 26-03) — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 25),
-            incident_start=date(2026, 1, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.in.gov/gov/files/EO26-03.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MARYLAND ---
-        # Gov Moore, late Jan 2025 (Jan 24-26 storm), statewide
-        rec = build_record(
-            id_str="STATE-2025-002-MD",
-            source="STATE", state="MD",
-            title="Governor Moore Emergency Declaration — January 2025 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 1, 24),
-            incident_start=date(2025, 1, 24),
-            incident_end=date(2025, 1, 28),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.maryland.gov/news/press/pages/Governor-Moore-Declares-State-of-Emergency,-Requests-Federal-Emergency-Declaration-Ahead-of-Dangerous-Winter-Storm.aspx",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- WEST VIRGINIA ---
-        # Gov Morrisey, Jan 23 2026, statewide (all 55 counties)
-        rec = build_record(
-            id_str="STATE-2026-001-WV",
-            source="STATE", state="WV",
-            title="Governor Morrisey Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 21),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.wv.gov/article/governor-morrisey-declares-state-emergency-all-55-counties-major-winter-storm-approaches",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- SOUTH CAROLINA ---
-        # Gov McMaster, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-SC",
-            source="STATE", state="SC",
-            title="Governor McMaster Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.sc.gov/news/2026-01/gov-mcmaster-declares-state-emergency-ahead-winter-storm",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- TENNESSEE ---
-        # Gov Lee, Jan 22 2026, statewide (all 95 counties)
-        rec = build_record(
-            id_str="STATE-2026-001-TN",
-            source="STATE", state="TN",
-            title="Governor Lee Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.tn.gov/governor/news/2026/1/22/gov--lee-issues-state-of-emergency-ahead-of-major-winter-storm.html",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- COLORADO — Western Colorado Flooding (Oct 2025) ---
-        # EO D 2025-021, verbal Oct 12, signed Nov 10. Tropical Storms Priscilla/Raymond.
-        # FEMA major disaster request denied; appeal filed.
-        # $13.8M validated infrastructure damage, 60+ miles of road destroyed.
-        rec = build_record(
-            id_str="STATE-2025-001-CO",
-            source="STATE", state="CO",
-            title="Governor Polis Emergency — Western Colorado Flooding (EO D 2025-021)",
-            incident_type="Flood",
-            declaration_date=date(2025, 10, 12),
-            incident_start=date(2025, 10, 10),
-            incident_end=date(2025, 10, 14),
-            renewal_dates_list=None,
-            counties=["Archuleta", "La Plata", "Mineral"],
-            statewide=False,
-            official_url="https://www.colorado.gov/governor/news/governor-polis-memorializes-emergency-declaration-support-communities-recovering-flooding",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CONNECTICUT ---
-        # Gov Lamont, Jan 25 2026, statewide, storm passed ~Jan 27
-        rec = build_record(
-            id_str="STATE-2026-001-CT",
-            source="STATE", state="CT",
-            title="Governor Lamont Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 25),
-            incident_start=date(2026, 1, 25),
-            incident_end=date(2026, 1, 27),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://portal.ct.gov/governor/news/press-releases/2026/01-2026/governor-lamont-declares-state-of-emergency-limits-commercial-vehicle-travel",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OHIO ---
-        # Gov DeWine, Jan 24 2026, statewide (all 88 counties), 90-day window
-        rec = build_record(
-            id_str="STATE-2026-001-OH",
-            source="STATE", state="OH",
-            title="Governor DeWine Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 24),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 4, 26),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://content.govdelivery.com/accounts/OHIOGOVERNOR/bulletins/405eda8",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- KANSAS ---
-        # Gov Kelly, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-KS",
-            source="STATE", state="KS",
-            title="Governor Kelly Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.kansastag.gov/m/newsflash/Home/Detail/817",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MISSOURI ---
-        # Gov Kehoe, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-MO",
-            source="STATE", state="MO",
-            title="Governor Kehoe Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-signs-executive-order-26-05-declaring-state-emergency",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- ALABAMA ---
-        # Gov Ivey, Jan 2026 winter storm
-        rec = build_record(
-            id_str="STATE-2026-001-AL",
-            source="STATE", state="AL",
-            title="Governor Ivey Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 22),
-            incident_start=date(2026, 1, 20),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.alabama.gov/newsroom/2026/01/governor-ivey-issues-state-of-emergency-for-19-northern-counties-ahead-of-wintery-icy-forecast/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW JERSEY ---
-        # Gov Sherrill, Jan 24 2026, Executive Order 8, all 21 counties
-        # Emergency ended Jan 26 at noon
-        rec = build_record(
-            id_str="STATE-2026-001-NJ",
-            source="STATE", state="NJ",
-            title="Governor Sherrill Emergency Declaration (EO 8) — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 24),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 1, 26),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.nj.gov/governor/news/2026/20260123b.shtml",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MARYLAND (Jan 2026 Winter Storm — separate from Jan 2025) ---
-        # Gov Moore, Jan 23 2026, statewide
-        rec = build_record(
-            id_str="STATE-2026-001-MD",
-            source="STATE", state="MD",
-            title="Governor Moore Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.maryland.gov/news/press/pages/Governor-Moore-Declares-State-of-Emergency,-Requests-Federal-Emergency-Declaration-Ahead-of-Dangerous-Winter-Storm.aspx",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- WASHINGTON, D.C. ---
-        # Mayor Bowser, Jan 23 2026, district-wide
-        # Snow emergency period Jan 24 - Jan 27
-        rec = build_record(
-            id_str="STATE-2026-001-DC",
-            source="STATE", state="DC",
-            title="Mayor Bowser Emergency Declaration — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 1, 27),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://mayor.dc.gov/release/mayor-bowser-declares-state-emergency-washington-dc-ahead-major-winter-storm-and-extreme",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MAINE ---
-        # Gov Mills, Jan 5 2026, Energy Emergency Proclamation
-        # Also declared Civil Emergency for coastal flooding Jan 10
-        # Energy emergency expired Jan 15; coastal counties affected
-        rec = build_record(
-            id_str="STATE-2026-001-ME",
-            source="STATE", state="ME",
-            title="Governor Mills Emergency Declaration — January 2026 Energy Emergency & Coastal Flooding",
-            incident_type="Energy Emergency",
-            declaration_date=date(2026, 1, 5),
-            incident_start=date(2026, 1, 5),
-            incident_end=date(2026, 1, 15),
-            renewal_dates_list=None,
-            counties=[
-                "Cumberland", "Hancock", "Knox", "Lincoln",
-                "Sagadahoc", "Waldo", "Washington", "York",
-            ],
-            statewide=False,
-            official_url="https://www.maine.gov/governor/mills/news/governor-mills-declares-state-civil-emergency-coastal-counties-impacted-flooding-urges-maine",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # CALIFORNIA GOVERNOR DECLARATIONS
-        # =============================================================
-
-        # California Dec 2025 storms - Gov Newsom, 6 counties
-        rec = build_record(
-            id_str="STATE-2025-002-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency Declaration — December 2025 Winter Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 24),
-            incident_start=date(2025, 12, 21),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=[
-                "Los Angeles", "Orange", "Riverside", "San Bernardino",
-                "San Diego", "Shasta",
-            ],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/24/governor-newsom-proclaims-state-of-emergency-to-support-response-in-multiple-counties-due-to-late-december-storms/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # MASSACHUSETTS GOVERNOR DECLARATION
-        # =============================================================
-
-        # Gov Healey, Jan 23 2026, Declaration of Emergency (heating fuels + winter storm)
-        # Referenced on FMCSA site; statewide scope
-        rec = build_record(
-            id_str="STATE-2026-001-MA",
-            source="STATE", state="MA",
-            title="Governor Healey Declaration of Emergency — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.fmcsa.dot.gov/emergency/massachusetts-declaration-emergency-notice-1-23-2026",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # California Jan 2025 LA Wildfires - Gov Newsom
-        rec = build_record(
-            id_str="STATE-2025-001-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency Declaration — January 2025 Los Angeles Wildfires",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 1, 7),
-            incident_start=date(2025, 1, 7),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Los Angeles", "Ventura"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/01/07/governor-newsom-proclaims-state-of-emergency-meets-with-first-responders-in-pacific-palisades-amid-dangerous-fire-weather/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # NEW STATE DECLARATIONS — Added Mar 27, 2026 audit
-        # =============================================================
-
-        # Florida EO 26-33: Cold front (Jan 31 - Feb 3), drought, wildfires — all 67 counties
-        # Signed Feb 9, 2026. Incident start = Jan 31 (cold front onset per EO text).
-        # Ongoing due to drought/wildfire component (120 active wildfires at signing).
-        # PDF: https://www.flgov.com/eog/sites/default/files/executive-orders/2026/EO%2026-33.pdf
-        rec = build_record(
-            id_str="STATE-2026-001-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis EO 26-33 — Cold Front, Drought, Wildfires",
-            incident_type="Wildfire",
-            declaration_date=date(2026, 2, 9),
-            incident_start=date(2026, 1, 31),
-            incident_end=None,  # Ongoing — drought + 120 active wildfires
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.flgov.com/eog/sites/default/files/executive-orders/2026/EO%2026-33.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Oklahoma EO 2026-11: Tornadoes/severe weather — Mar 7, 2026
-        rec = build_record(
-            id_str="STATE-2026-002-OK",
-            source="STATE", state="OK",
-            title="Governor Stitt Emergency Declaration — Tornadoes and Severe Weather",
-            incident_type="Tornado",
-            declaration_date=date(2026, 3, 7),
-            incident_start=date(2026, 3, 7),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Creek", "Mayes", "Muskogee", "Okmulgee", "Rogers", "Tulsa", "Wagoner", "Washington"],
-            statewide=False,
-            official_url="https://oklahoma.gov/governor/newsroom/newsroom/2026/governor-stitt-declares-state-of-emergency-following-severe-weather.html",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Michigan EO 2026-1: Deadly tornadoes — Mar 8, 2026
-        rec = build_record(
-            id_str="STATE-2026-002-MI",
-            source="STATE", state="MI",
-            title="Governor Whitmer Emergency Declaration — Deadly Tornadoes",
-            incident_type="Tornado",
-            declaration_date=date(2026, 3, 8),
-            incident_start=date(2026, 3, 8),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Branch", "Cass", "St. Joseph"],
-            statewide=False,
-            official_url="https://www.michigan.gov/whitmer/news/press-releases/2026/03/08/whitmer-declares-state-emergency-following-deadly-tornadoes-in-southwest-michigan",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Michigan EO 2026-2/3: Historic blizzard — Mar 17+25, 2026
-        rec = build_record(
-            id_str="STATE-2026-003-MI",
-            source="STATE", state="MI",
-            title="Governor Whitmer Emergency Declaration — Historic Blizzard (EO 2026-2, amended 2026-3)",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 3, 17),
-            incident_start=date(2026, 3, 17),
-            incident_end=None,
-            renewal_dates_list=[date(2026, 3, 25)],  # EO 2026-3 amendment added Osceola County
-            counties=["Antrim", "Benzie", "Grand Traverse", "Kalkaska", "Leelanau",
-                       "Manistee", "Missaukee", "Osceola", "Wexford"],
-            statewide=False,
-            official_url="https://www.michigan.gov/whitmer/news/state-orders-and-directives/2026/03/17/executive-order-2026-2-declaration-of-state-of-emergency-and-energy-emergency",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Missouri EO 26-08: Severe storms/tornadoes — Mar 6, 2026
-        rec = build_record(
-            id_str="STATE-2026-002-MO",
-            source="STATE", state="MO",
-            title="Governor Kehoe Emergency Declaration — Severe Storms and Tornadoes",
-            incident_type="Tornado",
-            declaration_date=date(2026, 3, 6),
-            incident_start=date(2026, 3, 6),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-signs-executive-order-26-08-activating-state-emergency",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Nebraska: Wildfires — Mar 25-26, 2026
-        rec = build_record(
-            id_str="STATE-2026-002-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency Declaration — Wildfires",
-            incident_type="Wildfire",
-            declaration_date=date(2026, 3, 25),
-            incident_start=date(2026, 3, 25),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.nebraska.gov/gov-pillen-declares-emergency-mobilizes-guard-wildfires-burn-central-and-western-nebraska",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # Rhode Island EO 26-02: Blizzard — Feb 22, 2026
-        rec = build_record(
-            id_str="STATE-2026-001-RI",
-            source="STATE", state="RI",
-            title="Governor McKee Emergency Declaration — Blizzard",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.ri.gov/press-releases/governor-mckee-declares-state-emergency-issues-travel-ban-ahead-blizzard-conditions",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # v3.0 CARRIER-DISCOVERED BACKFILL — March 2026
-        # Records below discovered via Aetna/Wellcare carrier data
-        # cross-reference (carrier_data_parser.py). Official government
-        # URLs verified from carrier RelatedLinks fields.
-        # =============================================================
-
-        # --- CALIFORNIA (Governor Newsom consolidated declarations) ---
-        # Many CA disasters covered by a Dec 23 2025 omnibus proclamation
-
-        rec = build_record(
-            id_str="STATE-2025-010-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — February 2025 Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 2, 1),
-            incident_start=date(2025, 1, 31),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/07/29/governor-newsom-issues-emergency-proclamation-for-storm-impacted-counties/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-011-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — Rancho Cucamonga Windstorm",
-            incident_type="Severe Wind",
-            declaration_date=date(2025, 1, 7),
-            incident_start=date(2025, 1, 7),
-            incident_end=date(2026, 1, 7),
-            renewal_dates_list=None,
-            counties=["San Bernardino"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-012-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — July 2025 Tsunami",
-            incident_type="Tsunami",
-            declaration_date=date(2025, 7, 30),
-            incident_start=date(2025, 7, 30),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-013-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — Gifford Fire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 8, 1),
-            incident_start=date(2025, 8, 1),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-014-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — August Storms and Mudslides",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 8, 23),
-            incident_start=date(2025, 8, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-015-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — September Lightning Complex",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 9, 2),
-            incident_start=date(2025, 9, 2),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/09/19/governor-newsom-issues-emergency-proclamation-to-help-calaveras-and-tuolumne-counties-recover-from-tcu-lightning-complex-fires/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-016-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — Tropical Storm Mario",
-            incident_type="Tropical Storm",
-            declaration_date=date(2025, 9, 18),
-            incident_start=date(2025, 9, 18),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-017-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Emergency — Mono Pack Fire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 12, 9),
-            incident_start=date(2025, 11, 13),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Mono"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/09/governor-newsom-proclaims-state-of-emergency-in-mono-county-due-to-the-pack-fire/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CONNECTICUT — Feb 22 2026 Winter Storm ---
-        rec = build_record(
-            id_str="STATE-2026-002-CT",
-            source="STATE", state="CT",
-            title="Governor Lamont Emergency Declaration — February 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://portal.ct.gov/governor/news/press-releases/2026/02-2026/governor-lamont-declares-state-of-emergency-prohibits-commercial-vehicle-travel",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- HAWAII ---
-        rec = build_record(
-            id_str="STATE-2025-001-HI",
-            source="STATE", state="HI",
-            title="Governor Green Emergency — Wildfires",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 7, 15),
-            incident_start=date(2025, 7, 15),
-            incident_end=date(2025, 10, 21),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.hawaii.gov/wp-content/uploads/2025/07/2507065_ATG-Proclamation-Wildfires.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2026-001-HI",
-            source="STATE", state="HI",
-            title="Governor Green Emergency — February 2026 Severe Weather",
-            incident_type="Severe Storm",
-            declaration_date=date(2026, 2, 6),
-            incident_start=date(2026, 2, 6),
-            incident_end=date(2026, 2, 11),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.hawaii.gov/newsroom/news-release-hiema-advises-public-to-prepare-for-severe-weather/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- HAWAII — Feb 20-22 Heavy Rains ---
-        # Proclamation 2602068, signed Feb 24. Separate from Feb 6-11 severe weather.
-        rec = build_record(
-            id_str="STATE-2026-002-HI",
-            source="STATE", state="HI",
-            title="Governor Green Proclamation — February 20-22, 2026 Heavy Rains",
-            incident_type="Flood",
-            declaration_date=date(2026, 2, 24),
-            incident_start=date(2026, 2, 20),
-            incident_end=date(2026, 2, 22),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.hawaii.gov/wp-content/uploads/2026/02/2602068_Proclamation-Relating-to-February-20-22-2026-Rains-Scanned.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- KANSAS — Wildland Fires Feb 2026 ---
-        rec = build_record(
-            id_str="STATE-2026-002-KS",
-            source="STATE", state="KS",
-            title="Governor Kelly Emergency — Wildland Fires",
-            incident_type="Wildfire",
-            declaration_date=date(2026, 2, 15),
-            incident_start=date(2026, 2, 15),
-            incident_end=date(2026, 3, 2),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.kansastag.gov/m/newsflash/Home/Detail/821",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- LOUISIANA — Tallulah Water System ---
-        rec = build_record(
-            id_str="STATE-2025-001-LA",
-            source="STATE", state="LA",
-            title="Governor Landry Emergency — Tallulah Water System Failure",
-            incident_type="Infrastructure Emergency",
-            declaration_date=date(2025, 2, 13),
-            incident_start=date(2025, 2, 13),
-            incident_end=date(2025, 11, 2),
-            renewal_dates_list=None,
-            counties=["Madison"],
-            statewide=False,
-            official_url="https://gov.louisiana.gov/assets/ExecutiveOrders/2026/JML-Exective-Order-26-007.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MAINE — Jan 2026 Winter Storm ---
-        rec = build_record(
-            id_str="STATE-2026-002-ME",
-            source="STATE", state="ME",
-            title="Governor Mills Emergency — January 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 25),
-            incident_start=date(2026, 1, 25),
-            incident_end=date(2026, 2, 24),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.maine.gov/governor/mills/news/powerful-noreaster-expected-governor-mills-closes-state-offices-monday-2026-02-22",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MISSOURI ---
-        rec = build_record(
-            id_str="STATE-2025-001-MO",
-            source="STATE", state="MO",
-            title="Governor Kehoe Emergency — April 2025 Severe Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 4, 29),
-            incident_start=date(2025, 4, 29),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-requests-federal-disaster-declaration-response-march-30-april",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-002-MO",
-            source="STATE", state="MO",
-            title="Governor Kehoe Emergency — May 2025 Memorial Weekend Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 5, 23),
-            incident_start=date(2025, 5, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-announces-fema-participate-joint-damage-assessments-5",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MONTANA — Dec 2025 Flooding ---
-        rec = build_record(
-            id_str="STATE-2025-001-MT",
-            source="STATE", state="MT",
-            title="Governor Gianforte Emergency — December 2025 Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 12, 8),
-            incident_start=date(2025, 12, 8),
-            incident_end=date(2026, 1, 25),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Receives-Incident-Command-Briefing-on-Flooding-in-Libby",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEBRASKA (multiple 2025 events) ---
-        rec = build_record(
-            id_str="STATE-2025-001-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency — March 2025 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 3, 21),
-            incident_start=date(2025, 3, 18),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Boone", "Burt", "Butler", "Cass", "Clay", "Colfax", "Cuming", "Dodge", "Douglas", "Fillmore", "Hamilton", "Jefferson", "Johnson", "Lancaster", "Nuckolls", "Otoe", "Platte", "Polk", "Saline", "Sarpy", "Saunders", "Seward", "Thayer", "Thurston", "Washington", "York"],
-            statewide=False,
-            official_url="https://governor.nebraska.gov/gov-pillen-declares-emergency-counties-impacted-winter-storm",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-002-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency — Plum Creek Fire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 4, 21),
-            incident_start=date(2025, 4, 21),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.nebraska.gov/governor-pillen-declares-emergency-mobilizes-nebraska-national-guard-and-issues-statewide-burn-ban",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-003-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency — Dawson County Severe Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 6, 29),
-            incident_start=date(2025, 6, 29),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Dawson"],
-            statewide=False,
-            official_url="https://governor.nebraska.gov/gov-pillen-issues-disaster-declaration-dawson-county-following-june-storms",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-004-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency — August 2025 Storms",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 8, 8),
-            incident_start=date(2025, 8, 8),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.nebraska.gov/gov-pillen-issues-disaster-declaration-23-counties-following-aug-8-storms",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NEW MEXICO ---
-        rec = build_record(
-            id_str="STATE-2025-001-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — July 2025 Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 7, 25),
-            incident_start=date(2025, 7, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.governor.state.nm.us/2025/07/08/new-mexico-governor-mobilizes-resources-following-catastrophic-flooding-in-ruidoso/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2026-002-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — January 2026 Severe Weather",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.dot.nm.gov/blog/2026/01/22/winter-storm-watch-and-travel-advisory-issued/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OKLAHOMA — Feb 2026 Wildfires ---
-        rec = build_record(
-            id_str="STATE-2026-003-OK",
-            source="STATE", state="OK",
-            title="Governor Stitt Emergency — February 2026 Wildfires",
-            incident_type="Wildfire",
-            declaration_date=date(2026, 2, 17),
-            incident_start=date(2026, 2, 17),
-            incident_end=date(2026, 3, 19),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://oklahoma.gov/governor/newsroom/newsroom/2026/governor-declares-state-of-emergency.html",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OREGON (multiple wildfires 2025) ---
-        or_fires = [
-            ("STATE-2025-001-OR", "Governor Kotek Emergency — Rowena Fire", date(2025, 6, 11), date(2025, 7, 30),
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-for-rowena-fire"),
-            ("STATE-2025-002-OR", "Governor Kotek Emergency — Cold Spring Fire", date(2025, 7, 2), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-cold-springs-fire"),
-            ("STATE-2025-003-OR", "Governor Kotek Emergency — Elk Fire", date(2025, 7, 9), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-elk-fire"),
-            ("STATE-2025-004-OR", "Governor Kotek Emergency — Highland Fire", date(2025, 7, 12), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-highland-fire"),
-            ("STATE-2025-005-OR", "Governor Kotek Emergency — Cram Fire", date(2025, 7, 14), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-cram-fire"),
-            ("STATE-2025-006-OR", "Governor Kotek Emergency — Flat Fire", date(2025, 8, 22), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-flat-fire"),
-            ("STATE-2025-007-OR", "Governor Kotek Emergency — Moon Complex Fire", date(2025, 9, 27), None,
-             "https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-moon-complex-fire"),
-        ]
-        for id_str, title, inc_start, inc_end, url in or_fires:
-            rec = build_record(
-                id_str=id_str,
-                source="STATE", state="OR",
-                title=title,
-                incident_type="Wildfire",
-                declaration_date=inc_start,
-                incident_start=inc_start,
-                incident_end=inc_end,
-                renewal_dates_list=None,
-                counties=["Statewide"],
-                statewide=True,
-                official_url=url,
-                confidence="curated",
-                last_verified="2026-03-27",
-            )
-            if rec:
-                curated.append(rec)
-
-        # --- SOUTH DAKOTA — Dec 2025 Winter Wind Storm ---
-        rec = build_record(
-            id_str="STATE-2025-001-SD",
-            source="STATE", state="SD",
-            title="Governor Noem Emergency — Severe Winter Wind Storm",
-            incident_type="Severe Wind",
-            declaration_date=date(2025, 12, 17),
-            incident_start=date(2025, 12, 17),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://news.sd.gov/news?id=news_kb_article_view&sys_id=96a3de25dbd2b2d091ce9f9583d5bfbd",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- WASHINGTON — Dec 2025 Winter Weather ---
-        rec = build_record(
-            id_str="STATE-2025-001-WA",
-            source="STATE", state="WA",
-            title="Governor Ferguson Emergency — Winter Weather and River Flooding",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 12, 2),
-            incident_start=date(2025, 12, 2),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.wa.gov/news/2025/governor-ferguson-declares-statewide-emergency",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- WYOMING ---
-        rec = build_record(
-            id_str="STATE-2025-001-WY",
-            source="STATE", state="WY",
-            title="Governor Gordon Emergency — Red Canyon Fire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 8, 13),
-            incident_start=date(2025, 8, 13),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.wyo.gov/news-releases/governor-gordon-issues-emergency-declaration-for-red-canyon-fire",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        rec = build_record(
-            id_str="STATE-2025-002-WY",
-            source="STATE", state="WY",
-            title="Governor Gordon Emergency — Dollar Fire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 8, 21),
-            incident_start=date(2025, 8, 21),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.wyo.gov/news-releases/governor-gordon-provides-wildfire-updates-dollar-fire",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # FLORIDA — HURRICANE / STORM GOVERNOR DECLARATIONS
-        # Carrier cross-reference: Aetna + Wellcare both track these
-        # =============================================================
-
-        # --- FL Hurricane Debby (Aug 2024) ---
-        # EO 24-156 initial, 10 governor extensions through EO 2026-59 (Mar 2026)
-        # Note: Aug 7 date from prior data was CFO/FDACS order, NOT governor EO
-        # 51+ counties, still active
-        rec = build_record(
-            id_str="STATE-2024-001-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis Emergency — Hurricane Debby (EO 24-156)",
-            incident_type="Hurricane",
-            declaration_date=date(2024, 8, 1),
-            incident_start=date(2024, 8, 1),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2024, 9, 25), date(2024, 11, 22),
-                date(2025, 1, 17), date(2025, 3, 14), date(2025, 5, 14),
-                date(2025, 7, 11), date(2025, 9, 9), date(2025, 11, 7),
-                date(2026, 1, 6), date(2026, 3, 6),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2026-59",
-            confidence="curated",
-            last_verified="2026-03-27",
-            extensions=[
-                {"date": "2024-09-25", "eo": "2024-211", "url": "https://www.flgov.com/eog/news/executive-orders/2024-211", "notes": "First 60-day extension"},
-                {"date": "2024-11-22", "eo": "2024-261", "url": "https://www.flgov.com/eog/news/executive-orders/2024-261", "notes": "Second extension"},
-                {"date": "2025-01-17", "eo": "2025-12", "url": "https://www.flgov.com/eog/news/executive-orders/2025-12", "notes": "Third extension"},
-                {"date": "2025-03-14", "eo": "2025-59", "url": "https://www.flgov.com/eog/news/executive-orders/2025-59", "notes": "Fourth extension"},
-                {"date": "2025-05-14", "eo": "2025-104", "url": "https://www.flgov.com/eog/news/executive-orders/2025-104", "notes": "Fifth extension"},
-                {"date": "2025-07-11", "eo": "2025-144", "url": "https://www.flgov.com/eog/news/executive-orders/2025-144", "notes": "Sixth extension"},
-                {"date": "2025-09-09", "eo": "2025-184", "url": "https://www.flgov.com/eog/news/executive-orders/2025-184", "notes": "Seventh extension"},
-                {"date": "2025-11-07", "eo": "2025-232", "url": "https://www.flgov.com/eog/news/executive-orders/2025-232", "notes": "Eighth extension"},
-                {"date": "2026-01-06", "eo": "2026-03", "url": "https://www.flgov.com/eog/news/executive-orders/2026-3", "notes": "Ninth extension"},
-                {"date": "2026-03-06", "eo": "2026-59", "url": "https://www.flgov.com/eog/news/executive-orders/2026-59", "notes": "Tenth extension (current)"},
-            ],
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL Hurricane Helene (Sep 2024) ---
-        # EO 24-208 initial (for "Potential Tropical Cyclone Nine"), 7 extensions through EO 2026-58
-        # EO 24-209 amended to expand to 61 counties on Sep 24
-        # Still active
-        rec = build_record(
-            id_str="STATE-2024-002-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis Emergency — Hurricane Helene (EO 24-208)",
-            incident_type="Hurricane",
-            declaration_date=date(2024, 9, 23),
-            incident_start=date(2024, 9, 23),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2024, 11, 21), date(2025, 5, 14), date(2025, 7, 11),
-                date(2025, 9, 9), date(2025, 11, 7), date(2026, 1, 6),
-                date(2026, 3, 6),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2026-58",
-            confidence="curated",
-            last_verified="2026-03-27",
-            extensions=[
-                {"date": "2024-11-21", "eo": "2024-249", "url": "https://www.flgov.com/eog/news/executive-orders/2024-249", "notes": "First extension"},
-                {"date": "2025-05-14", "eo": "2025-102", "url": "https://www.flgov.com/eog/news/executive-orders/2025-102", "notes": "Second extension"},
-                {"date": "2025-07-11", "eo": "2025-143", "url": "https://www.flgov.com/eog/news/executive-orders/2025-143", "notes": "Third extension"},
-                {"date": "2025-09-09", "eo": "2025-182", "url": "https://www.flgov.com/eog/news/executive-orders/2025-182", "notes": "Fourth extension"},
-                {"date": "2025-11-07", "eo": "2025-231", "url": "https://www.flgov.com/eog/news/executive-orders/2025-231", "notes": "Fifth extension (previously untracked)"},
-                {"date": "2026-01-06", "eo": "2026-02", "url": "https://www.flgov.com/eog/news/executive-orders/2026-2", "notes": "Sixth extension"},
-                {"date": "2026-03-06", "eo": "2026-58", "url": "https://www.flgov.com/eog/news/executive-orders/2026-58", "notes": "Seventh extension (current)"},
-            ],
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL Hurricane Milton (Oct 2024) ---
-        # EO 24-214 initial (titled "Tropical Storm Milton" at issuance), 7 extensions
-        # EO 24-215 amended Oct 6 to expand counties as storm intensified to Cat 5
-        # Confirmed expired: Last extension EO 2025-242 (Nov 25, 2025). No 2026 renewal.
-        # incidentEnd set to 2026-01-24 per Humana carrier data + our research.
-        rec = build_record(
-            id_str="STATE-2024-003-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis Emergency — Hurricane Milton (EO 24-214)",
-            incident_type="Hurricane",
-            declaration_date=date(2024, 10, 5),
-            incident_start=date(2024, 10, 5),
-            incident_end=date(2026, 1, 24),
-            renewal_dates_list=[
-                date(2024, 12, 3), date(2025, 1, 31), date(2025, 3, 31),
-                date(2025, 5, 30), date(2025, 7, 28), date(2025, 9, 26),
-                date(2025, 11, 25),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2025-242",
-            confidence="curated",
-            last_verified="2026-03-27",
-            extensions=[
-                {"date": "2024-12-03", "eo": "2024-264", "url": "https://www.flgov.com/eog/news/executive-orders/2024-264", "notes": "First extension"},
-                {"date": "2025-01-31", "eo": "2025-26", "url": "https://www.flgov.com/eog/news/executive-orders/2025-26", "notes": "Second extension"},
-                {"date": "2025-03-31", "eo": "2025-68", "url": "https://www.flgov.com/eog/news/executive-orders/2025-68", "notes": "Third extension"},
-                {"date": "2025-05-30", "eo": "2025-119", "url": "https://www.flgov.com/eog/news/executive-orders/2025-119", "notes": "Fourth extension (previously untracked)"},
-                {"date": "2025-07-28", "eo": "2025-150", "url": "https://www.flgov.com/eog/news/executive-orders/2025-150", "notes": "Fifth extension"},
-                {"date": "2025-09-26", "eo": "2025-191", "url": "https://www.flgov.com/eog/news/executive-orders/2025-191", "notes": "Sixth extension"},
-                {"date": "2025-11-25", "eo": "2025-242", "url": "https://www.flgov.com/eog/news/executive-orders/2025-242", "notes": "Seventh extension (last known — no 2026 renewal found)"},
-            ],
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL May 2024 North Florida Tornadoes ---
-        # EO 24-94 initial, 9+ extensions, 15 counties
-        # incidentEnd set to 2025-12-23 per Humana carrier data
-        rec = build_record(
-            id_str="STATE-2024-004-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis Emergency — May 2024 North Florida Tornadoes (EO 24-94)",
-            incident_type="Tornado",
-            declaration_date=date(2024, 5, 10),
-            incident_start=date(2024, 5, 10),
-            incident_end=date(2025, 12, 23),
-            renewal_dates_list=[
-                date(2024, 9, 6), date(2024, 11, 4), date(2025, 3, 3),
-                date(2025, 5, 1), date(2025, 7, 1), date(2025, 9, 1),
-                date(2025, 11, 1), date(2026, 1, 1), date(2026, 3, 1),
-            ],
-            counties=["Baker", "Columbia", "Escambia", "Gadsden", "Hamilton",
-                       "Jefferson", "Lafayette", "Leon", "Liberty", "Madison",
-                       "Okaloosa", "Santa Rosa", "Suwannee", "Taylor", "Wakulla"],
-            statewide=False,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2026-34",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL May 2025 NW Florida Tornadoes ---
-        # EO 25-101, 5 extensions, Holmes County
-        # incidentEnd set to 2026-01-06 per Humana carrier data (last extension expired)
-        rec = build_record(
-            id_str="STATE-2025-001-FL",
-            source="STATE", state="FL",
-            title="Governor Emergency — May 2025 NW Florida Tornadoes (EO 25-101)",
-            incident_type="Tornado",
-            declaration_date=date(2025, 5, 11),
-            incident_start=date(2025, 5, 10),
-            incident_end=date(2026, 1, 6),
-            renewal_dates_list=[
-                date(2025, 7, 10), date(2025, 9, 8), date(2025, 11, 7),
-                date(2026, 1, 6), date(2026, 3, 6),
-            ],
-            counties=["Holmes"],
-            statewide=False,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2025-101",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL Lake County Flooding ---
-        # EO 25-213, extended by EO 25-257
-        # incidentEnd set to 2025-12-28 per Humana carrier data
-        rec = build_record(
-            id_str="STATE-2025-002-FL",
-            source="STATE", state="FL",
-            title="Governor Emergency — Lake County Flooding (EO 25-213)",
-            incident_type="Flood",
-            declaration_date=date(2025, 10, 29),
-            incident_start=date(2025, 10, 26),
-            incident_end=date(2025, 12, 28),
-            renewal_dates_list=[date(2025, 12, 22)],
-            counties=["Lake"],
-            statewide=False,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2025-213",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- FL Illegal Migration ---
-        # EO 23-03, Jan 6 2023, statewide, 19+ renewals, still active (EO 2026-75)
-        rec = build_record(
-            id_str="STATE-2023-001-FL",
-            source="STATE", state="FL",
-            title="Governor DeSantis Emergency — Illegal Immigration (EO 23-03)",
-            incident_type="Immigration Emergency",
-            declaration_date=date(2023, 1, 6),
-            incident_start=date(2023, 1, 6),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 3, 24), date(2025, 5, 22), date(2025, 7, 20),
-                date(2025, 9, 17), date(2025, 11, 25), date(2026, 3, 24),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.flgov.com/eog/news/executive-orders/2026-75",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # NEW YORK — NON-STANDARD GOVERNOR DECLARATIONS
-        # =============================================================
-
-        # --- NY Vaccine Access Disaster ---
-        # EO No. 52, Sep 5 2025, statewide, extended through Apr 19 2026 (EO 52.7)
-        rec = build_record(
-            id_str="STATE-2025-001-NY",
-            source="STATE", state="NY",
-            title="Governor Hochul Disaster Declaration — Vaccine Access (EO 52)",
-            incident_type="Healthcare Emergency",
-            declaration_date=date(2025, 9, 5),
-            incident_start=date(2025, 9, 5),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 10, 4), date(2025, 11, 3), date(2025, 12, 3),
-                date(2026, 1, 2), date(2026, 1, 31), date(2026, 2, 20),
-                date(2026, 3, 21),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.governor.ny.gov/executive-order/no-527-extending-declaration-disaster-state-new-york-due-federal-actions-related",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # TEXAS — BORDER CRISIS + DROUGHT
-        # =============================================================
-
-        # --- TX Border Crisis ---
-        # Disaster Proclamation May 31 2021, renewed monthly, 66 counties
-        # Latest renewal: Mar 18, 2026
-        rec = build_record(
-            id_str="STATE-2021-001-TX",
-            source="STATE", state="TX",
-            title="Governor Abbott Disaster Proclamation — Border Security",
-            incident_type="Immigration Emergency",
-            declaration_date=date(2021, 5, 31),
-            incident_start=date(2021, 5, 31),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1),
-                date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
-                date(2026, 3, 18),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.texas.gov/news/post/governor-abbott-renews-border-security-disaster-proclamation-in-march-2026",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # OKLAHOMA — WILDFIRES
-        # =============================================================
-
-        # --- OK Wildfires EO 2026-09 ---
-        # Feb 18 2026, Beaver/Texas/Woodward/Harper counties
-        rec = build_record(
-            id_str="STATE-2026-001-OK",
-            source="STATE", state="OK",
-            title="Governor Stitt Emergency — Wildfires (EO 2026-09)",
-            incident_type="Wildfire",
-            declaration_date=date(2026, 2, 18),
-            incident_start=date(2026, 2, 17),
-            incident_end=date(2026, 3, 19),
-            renewal_dates_list=None,
-            counties=["Beaver", "Harper", "Texas", "Woodward"],
-            statewide=False,
-            official_url="https://www.sos.ok.gov/documents/executive/2170.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # MONTANA — FLOODING + HIGH WIND
-        # =============================================================
-
-        # --- MT Flooding EO 9-2025 ---
-        rec = build_record(
-            id_str="STATE-2025-001-MT",
-            source="STATE", state="MT",
-            title="Governor Gianforte Disaster Declaration — Flooding (EO 9-2025)",
-            incident_type="Flood",
-            declaration_date=date(2025, 12, 11),
-            incident_start=date(2025, 12, 8),
-            incident_end=date(2026, 1, 25),
-            renewal_dates_list=None,
-            counties=["Lincoln", "Sanders", "Flathead"],
-            statewide=False,
-            official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Issues-Executive-Order-Declaring-Flooding-Disaster",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- MT Damaging High Wind EO 11-2025 ---
-        rec = build_record(
-            id_str="STATE-2025-002-MT",
-            source="STATE", state="MT",
-            title="Governor Gianforte Disaster Declaration — Severe Wind (EO 11-2025)",
-            incident_type="Severe Wind",
-            declaration_date=date(2025, 12, 18),
-            incident_start=date(2025, 12, 17),
-            incident_end=date(2026, 2, 1),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Issues-Executive-Order-Declaring-Wind-Disaster",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # CONNECTICUT — FEB 2026 BLIZZARD
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2026-001-CT",
-            source="STATE", state="CT",
-            title="Governor Lamont Emergency — February 2026 Blizzard",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=date(2026, 2, 23),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://portal.ct.gov/-/media/office-of-the-governor/news/2026/20260222-emergency-declaration.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # GEORGIA — SPALDING COUNTY WATER SUPPLY
-        # Fuel spill at Hartsfield-Jackson contaminated Flint River intake
-        # Advisory lifted same night after testing cleared supply
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2026-003-GA",
-            source="STATE", state="GA",
-            title="Governor Kemp Emergency — Spalding County Water Supply (EO 01.30.26.02)",
-            incident_type="Infrastructure Emergency",
-            declaration_date=date(2026, 1, 30),
-            incident_start=date(2026, 1, 30),
-            incident_end=date(2026, 2, 6),
-            renewal_dates_list=None,
-            counties=["Spalding"],
-            statewide=False,
-            official_url="https://gov.georgia.gov/document/2026-executive-order/01302602/download",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # NEBRASKA — POWER DEMANDS
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2026-001-NE",
-            source="STATE", state="NE",
-            title="Governor Pillen Emergency — Power Demands (EO 26-01)",
-            incident_type="Power Emergency",
-            declaration_date=date(2026, 1, 23),
-            incident_start=date(2026, 1, 23),
-            incident_end=date(2026, 2, 27),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.nebraska.gov/sites/default/files/doc/press/EO-26-01.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # UTAH — WILDFIRES (single EO covers all 3 fires)
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2025-001-UT",
-            source="STATE", state="UT",
-            title="Governor Cox Emergency — 2025 Wildfires (EO 2025-08)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 7, 31),
-            incident_start=date(2025, 7, 1),
-            incident_end=date(2025, 8, 30),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.utah.gov/press/gov-cox-declares-state-of-emergency-as-wildfires-intensify/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # LOUISIANA — HURRICANE IDA (still active 2026!)
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2021-001-LA",
-            source="STATE", state="LA",
-            title="Governor Emergency — Hurricane Ida (JBE 2021-165, latest renewal JML 26-023)",
-            incident_type="Hurricane",
-            declaration_date=date(2021, 8, 26),
-            incident_start=date(2021, 8, 26),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1),
-                date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
-                date(2026, 3, 1),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.doa.la.gov/doa/osr/executive-orders/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # OREGON — ADDITIONAL DECLARATIONS
-        # =============================================================
-
-        # --- OR Alder Springs Fire ---
-        # EO 25-07, Jun 16 2025, Jefferson/Deschutes (Conflagration Act)
-        rec = build_record(
-            id_str="STATE-2025-010-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Emergency — Alder Springs Fire (EO 25-07)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 6, 16),
-            incident_start=date(2025, 6, 16),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Jefferson", "Deschutes"],
-            statewide=False,
-            official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-alder-springs-fire",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OR Rowena Fire ---
-        # EO 25-08, Jun 21 2025, Wasco County
-        rec = build_record(
-            id_str="STATE-2025-011-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Emergency — Rowena Fire (EO 25-08)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 6, 21),
-            incident_start=date(2025, 6, 11),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Wasco"],
-            statewide=False,
-            official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-due-to-rowena-fire",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OR Statewide Wildfire Emergency ---
-        # EO 25-16, Jul 16 2025, statewide, through Dec 2025
-        rec = build_record(
-            id_str="STATE-2025-008-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Emergency — Statewide Wildfire Threat (EO 25-16)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 7, 16),
-            incident_start=date(2025, 7, 16),
-            incident_end=date(2025, 12, 31),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-due-to-imminent-threat-of-wildfire",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OR Homelessness Emergency ---
-        # EO 25-01 (originally 23-02), statewide, through Jan 10 2027
-        rec = build_record(
-            id_str="STATE-2023-001-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Emergency — Homelessness (EO 25-01)",
-            incident_type="Homelessness Emergency",
-            declaration_date=date(2023, 1, 10),
-            incident_start=date(2023, 1, 10),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2024, 1, 9), date(2025, 1, 9), date(2026, 1, 9),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.oregon.gov/oem/pages/housing-emergency-executive-orders.aspx",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- OR December 2025 Severe Storms ---
-        # EO 25-32, Dec 30 2025, 25 counties
-        rec = build_record(
-            id_str="STATE-2025-009-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Emergency — December 2025 Severe Storms (EO 25-32)",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 30),
-            incident_start=date(2025, 12, 15),
-            incident_end=date(2025, 12, 21),
-            renewal_dates_list=None,
-            counties=["Clackamas", "Clatsop", "Coos", "Curry", "Douglas",
-                       "Hood River", "Jackson", "Klamath", "Lane", "Lincoln",
-                       "Linn", "Marion", "Multnomah", "Polk", "Tillamook",
-                       "Umatilla", "Union", "Wallowa", "Washington", "Yamhill"],
-            statewide=False,
-            official_url="https://www.oregon.gov/gov/eo/eo-25-32.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # KENTUCKY — UPS PLANE CRASH
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2025-001-KY",
-            source="STATE", state="KY",
-            title="Governor Beshear Emergency — Louisville UPS Plane Crash (EO 2025-758)",
-            incident_type="Plane Crash",
-            declaration_date=date(2025, 11, 5),
-            incident_start=date(2025, 11, 4),
-            incident_end=date(2025, 11, 4),
-            renewal_dates_list=None,
-            counties=["Jefferson"],
-            statewide=False,
-            official_url="https://governor.ky.gov/Documents/Executive%20Order%202025-758%20-%20State%20of%20Emergency%20Related%20to%20Louisville%20Plane%20Crash.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # MINNESOTA — WILDFIRES
-        # =============================================================
-
-        # --- MN Munger Shaw / Camp House Fires ---
-        # EO 25-05, May 20 2025, Saint Louis County
-        rec = build_record(
-            id_str="STATE-2025-001-MN",
-            source="STATE", state="MN",
-            title="Governor Walz Peacetime Emergency — NE Minnesota Wildfires (EO 25-05)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 5, 20),
-            incident_start=date(2025, 5, 12),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Saint Louis"],
-            statewide=False,
-            official_url="https://mn.gov/governor/newsroom/press-releases/?id=1055-685281",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # LOUISIANA — TALLULAH WATER SYSTEM
-        # =============================================================
-
-        # EO JML 25-054, renewed monthly through JML 26-027
-        rec = build_record(
-            id_str="STATE-2025-001-LA",
-            source="STATE", state="LA",
-            title="Governor Landry Emergency — Tallulah Water System (JML 25-054)",
-            incident_type="Infrastructure Emergency",
-            declaration_date=date(2025, 2, 13),
-            incident_start=date(2025, 2, 13),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 3, 15), date(2025, 4, 14), date(2025, 5, 14),
-                date(2025, 6, 13), date(2025, 7, 13), date(2025, 8, 12),
-                date(2025, 9, 11), date(2025, 10, 11), date(2025, 11, 10),
-                date(2025, 12, 10), date(2026, 1, 9), date(2026, 2, 8),
-            ],
-            counties=["Madison"],
-            statewide=False,
-            official_url="https://gov.louisiana.gov/assets/2026-Executive-Orders/JML-Exective-Order-26-027.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # MASSACHUSETTS — FEB 2026 BLIZZARD
-        # =============================================================
-
-        rec = build_record(
-            id_str="STATE-2026-002-MA",
-            source="STATE", state="MA",
-            title="Governor Healey Emergency — February 2026 Blizzard",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=date(2026, 2, 24),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.mass.gov/news/governor-healey-declares-emergency-activates-national-guard-ahead-of-strong-winter-storm",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # ALASKA — WINDSTORM + WINTER STORM + POWER OUTAGE
-        # =============================================================
-
-        # --- AK Mat-SU Windstorm ---
-        rec = build_record(
-            id_str="STATE-2025-001-AK",
-            source="STATE", state="AK",
-            title="Governor Dunleavy Disaster Declaration — Mat-Su Windstorm",
-            incident_type="Severe Wind",
-            declaration_date=date(2025, 12, 10),
-            incident_start=date(2025, 12, 9),
-            incident_end=date(2026, 1, 9),
-            renewal_dates_list=None,
-            counties=["Matanuska-Susitna"],
-            statewide=False,
-            official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2025.12.10_Press%20Release%20-%20Governor%20Dunleavy%20Declares%20December%202025%20Mat-Su%20Windstorm%20a%20Disaster.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- AK Napaskiak Power Outage ---
-        # Dec 30 2025 declaration, Bethel Census Area
-        rec = build_record(
-            id_str="STATE-2025-002-AK",
-            source="STATE", state="AK",
-            title="Governor Dunleavy Disaster Declaration — Napaskiak Power Outage",
-            incident_type="Power Emergency",
-            declaration_date=date(2025, 12, 30),
-            incident_start=date(2025, 12, 6),
-            incident_end=date(2026, 2, 4),
-            renewal_dates_list=None,
-            counties=["Bethel"],
-            statewide=False,
-            official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2025.01.05_Press%20Release%20-%20Governor%20Dunleavy%20Declares%202025%20Napaskiak%20Power%20Outage.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- AK Southeast Winter Storm ---
-        rec = build_record(
-            id_str="STATE-2026-001-AK",
-            source="STATE", state="AK",
-            title="Governor Dunleavy Disaster Declaration — Jan 2026 Southeast Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 1, 10),
-            incident_start=date(2026, 1, 6),
-            incident_end=date(2026, 2, 9),
-            renewal_dates_list=None,
-            counties=["Hoonah-Angoon", "Juneau"],
-            statewide=False,
-            official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2026.01.10_Press%20Release%20-%20Governor%20Dunleavy%20Declares%202026%20Jan%20Southeast%20Winter%20Storm.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- TX Flooding / Hill Country ---
-        # Jul 4 2025, 30 counties, renewed through Mar 2026
-        rec = build_record(
-            id_str="STATE-2025-001-TX",
-            source="STATE", state="TX",
-            title="Governor Abbott Disaster Proclamation — Hill Country Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 7, 4),
-            incident_start=date(2025, 7, 2),
-            incident_end=None,
-            renewal_dates_list=[date(2025, 7, 22), date(2026, 3, 1)],
-            counties=["Bandera", "Bexar", "Burnet", "Caldwell", "Coke", "Comal",
-                       "Concho", "Edwards", "Gillespie", "Guadalupe", "Hamilton",
-                       "Kendall", "Kerr", "Kimble", "Kinney", "Lampasas", "Llano",
-                       "Mason", "Maverick", "McCulloch", "Menard", "Real", "Reeves",
-                       "San Saba", "Schleicher", "Sutton", "Tom Green", "Travis",
-                       "Uvalde", "Williamson"],
-            statewide=False,
-            official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-flooding-disaster-proclamation-in-march-2026",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- TX Wildfires / Fire Weather ---
-        # Aug 12 2025, statewide, renewed through Mar 2026
-        rec = build_record(
-            id_str="STATE-2025-002-TX",
-            source="STATE", state="TX",
-            title="Governor Abbott Disaster Proclamation — Fire Weather Conditions",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 8, 12),
-            incident_start=date(2025, 8, 10),
-            incident_end=None,
-            renewal_dates_list=[date(2026, 3, 9)],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-fire-weather-conditions-disaster-proclamation-in-march-2026",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- TX Drought ---
-        # Governor Abbott disaster proclamation, renewed monthly, 80+ counties
-        rec = build_record(
-            id_str="STATE-2024-001-TX",
-            source="STATE", state="TX",
-            title="Governor Abbott Disaster Proclamation — Drought",
-            incident_type="Drought",
-            declaration_date=date(2024, 7, 1),
-            incident_start=date(2024, 7, 1),
-            incident_end=None,
-            renewal_dates_list=[
-                date(2025, 9, 18), date(2025, 10, 18), date(2025, 11, 18),
-                date(2025, 12, 18), date(2026, 1, 18), date(2026, 2, 18),
-                date(2026, 3, 18),
-            ],
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-drought-disaster-proclamation-in-march-2026",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # NEW MEXICO — CRIME, FLOODS, FIRE, INFRASTRUCTURE
-        # =============================================================
-
-        # --- NM Española Crime Emergency ---
-        # EO 2025-358, Aug 13 2025, Rio Arriba County + Pueblos
-        rec = build_record(
-            id_str="STATE-2025-003-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Española Crime (EO 2025-358)",
-            incident_type="Crime Emergency",
-            declaration_date=date(2025, 8, 13),
-            incident_start=date(2025, 8, 13),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Rio Arriba"],
-            statewide=False,
-            official_url="https://www.governor.state.nm.us/2025/08/13/governor-declares-emergency-in-espanola-area-due-to-crime/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NM Albuquerque Crime Emergency ---
-        # EO 2025-080, Apr 8 2025, Albuquerque/Bernalillo County
-        rec = build_record(
-            id_str="STATE-2025-004-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Albuquerque Crime (EO 2025-080)",
-            incident_type="Crime Emergency",
-            declaration_date=date(2025, 4, 8),
-            incident_start=date(2025, 4, 8),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Bernalillo"],
-            statewide=False,
-            official_url="https://www.governor.state.nm.us/wp-content/uploads/2025/04/Executive-Order-2025-080-1.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NM Cotton/Desert Willow Complex Fire ---
-        # EO 2025-247, Jun 21 2025, Valencia County
-        rec = build_record(
-            id_str="STATE-2025-005-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Cotton Fire / Desert Willow Complex (EO 2025-247)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 6, 21),
-            incident_start=date(2025, 6, 21),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Valencia"],
-            statewide=False,
-            official_url="https://www.governor.state.nm.us/2025/06/21/governor-secures-resources-to-support-cotton-fire-response-additional-firefighting-crews-air-support-and-shelter-services-mobilized/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NM Lincoln County Flood ---
-        # EO 2025-248, Jun 26 2025, Lincoln County
-        rec = build_record(
-            id_str="STATE-2025-006-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Lincoln County Flooding (EO 2025-248)",
-            incident_type="Flood",
-            declaration_date=date(2025, 6, 26),
-            incident_start=date(2025, 6, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Lincoln"],
-            statewide=False,
-            official_url="https://www.dhsem.nm.gov/governor-signs-emergency-declarations-for-lincoln-and-chaves-county/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NM Dona Ana County Flood ---
-        # EO 2025-333, Jul 25 2025, Dona Ana County
-        rec = build_record(
-            id_str="STATE-2025-007-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Dona Ana County Flooding (EO 2025-333)",
-            incident_type="Flood",
-            declaration_date=date(2025, 7, 25),
-            incident_start=date(2025, 7, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Dona Ana"],
-            statewide=False,
-            official_url="https://www.governor.state.nm.us/2025/07/25/governor-signs-emergency-order-for-dona-ana-county-flooding/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- NM Torrance County Well Outages ---
-        # EO 2025-373, Oct 2025, Torrance County
-        rec = build_record(
-            id_str="STATE-2025-008-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency — Torrance County Water System (EO 2025-373)",
-            incident_type="Infrastructure Emergency",
-            declaration_date=date(2025, 10, 15),
-            incident_start=date(2024, 12, 1),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Torrance"],
-            statewide=False,
-            official_url="https://www.dhsem.nm.gov/state-to-provide-emergency-water-to-torrance-county-community/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # =============================================================
-        # PHASE 3 SESSION 2 — CARRIER CROSS-REFERENCE GAP FILLS
-        # Added 2026-03-27 from four-carrier cross-reference analysis
-        # =============================================================
-
-        # --- CALIFORNIA: Pack Fire, Mono County ---
-        # Governor Newsom proclamation Dec 9, 2025
-        rec = build_record(
-            id_str="STATE-2025-018-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — Pack Fire (Mono County)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 12, 9),
-            incident_start=date(2025, 11, 13),
-            incident_end=date(2025, 12, 3),
-            renewal_dates_list=None,
-            counties=["Mono"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/09/governor-newsom-proclaims-state-of-emergency-in-mono-county-for-pack-fire/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CALIFORNIA: July Tsunami, Del Norte County ---
-        # Part of Dec 23, 2025 omnibus proclamation (6 events)
-        rec = build_record(
-            id_str="STATE-2025-019-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — July 2025 Tsunami (Del Norte County)",
-            incident_type="Tsunami",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 7, 29),
-            incident_end=date(2025, 7, 30),
-            renewal_dates_list=None,
-            counties=["Del Norte"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CALIFORNIA: August Storms/Mudslides, Sierra County ---
-        rec = build_record(
-            id_str="STATE-2025-020-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — August 2025 Storms and Mudslides (Sierra County)",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 8, 23),
-            incident_end=date(2025, 8, 27),
-            renewal_dates_list=None,
-            counties=["Sierra"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CALIFORNIA: August Monsoon Storms, Imperial County ---
-        rec = build_record(
-            id_str="STATE-2025-021-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — August 2025 Monsoon Storms (Imperial County)",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 8, 25),
-            incident_end=date(2025, 8, 25),
-            renewal_dates_list=None,
-            counties=["Imperial"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CALIFORNIA: Gifford Fire, SLO + Santa Barbara ---
-        rec = build_record(
-            id_str="STATE-2025-022-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — Gifford Fire (SLO, Santa Barbara)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 8, 1),
-            incident_end=date(2025, 9, 28),
-            renewal_dates_list=None,
-            counties=["San Luis Obispo", "Santa Barbara"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
-
-        # --- CALIFORNIA: January Windstorm, San Bernardino ---
-        rec = build_record(
-            id_str="STATE-2025-023-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — January 2025 Windstorm (San Bernardino)",
-            incident_type="Severe Wind",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 1, 7),
-            incident_end=date(2025, 1, 9),
-            renewal_dates_list=None,
-            counties=["San Bernardino"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+        # Shared fields for statewide Severe Winter Storm declarations (most of
+        # the table); rows spread it with dict(winter_storm, ...)
+        winter_storm = {"incident_type": "Severe Winter Storm", "counties": STATEWIDE, "statewide": True}
+
+        # Dates stay inline as date(...) literals so each row reads on its own;
+        # cached_curated() builds this table once per day, not per collect().
+        rows = (
+            # =============================================================
+            # JAN 2026 WINTER STORM GOVERNOR DECLARATIONS
+            # Storm hit ~Jan 20-27, 2026 across eastern/central US
+            # =============================================================
+
+            # --- TEXAS ---
+            # Gov Abbott, Jan 22 declaration, 219 counties (expanded Jan 25)
+            # No termination found
+            dict(winter_storm,
+                id_str="STATE-2026-001-TX",
+                state="TX",
+                title="Governor Abbott Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://gov.texas.gov/news/post/governor-abbott-provides-update-on-texas-ongoing-response-to-severe-winter-weather-",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NORTH CAROLINA ---
+            # Gov Stein, Jan 21 declaration, statewide
+            dict(winter_storm,
+                id_str="STATE-2026-001-NC",
+                state="NC",
+                title="Governor Stein Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 21),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.nc.gov/news/press-releases/2026/01/21/governor-stein-declares-state-emergency-ahead-winter-storm",
+                last_verified="2026-03-27",
+            ),
+
+            # --- VIRGINIA ---
+            # Gov Spanberger, Jan 22, EO 11, statewide
+            dict(winter_storm,
+                id_str="STATE-2026-001-VA",
+                state="VA",
+                title="Governor Spanberger Emergency Declaration (EO 11) — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://www.governor.virginia.gov/newsroom/news-releases/2026/january-releases/name-1111570-en.html",
+                last_verified="2026-03-27",
+            ),
+
+            # --- GEORGIA (Winter Storm Fern) ---
+            # Gov Kemp, Jan 22, statewide, effective through Jan 29
+            dict(winter_storm,
+                id_str="STATE-2026-001-GA",
+                state="GA",
+                title="Governor Kemp Emergency Declaration — January 2026 Winter Storm (Fern)",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 22),
+                incident_end=date(2026, 1, 29),
+                official_url="https://gov.georgia.gov/press-releases/2026-01-22/gov-kemp-declares-state-emergency-activates-state-operations-center-ahead",
+                last_verified="2026-03-27",
+            ),
+
+            # --- GEORGIA (Winter Storm Gianna) ---
+            # Gov Kemp, Jan 30, statewide, effective through Feb 6
+            dict(winter_storm,
+                id_str="STATE-2026-002-GA",
+                state="GA",
+                title="Governor Kemp Emergency Declaration — January 2026 Winter Storm (Gianna)",
+                declaration_date=date(2026, 1, 30),
+                incident_start=date(2026, 1, 30),
+                incident_end=date(2026, 2, 6),
+                official_url="https://gov.georgia.gov/press-releases/2026-01-30/gov-kemp-declares-new-state-emergency-ahead-winter-storm",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW YORK (EO 55, Dec 26 2025 Winter Storm) ---
+            # 35 counties. EO 55.1 extended to statewide scope.
+            dict(
+                id_str="STATE-2025-002-NY",
+                state="NY",
+                title="Governor Hochul Emergency Declaration (EO 55) — December 2025 Winter Storm",
+                incident_type="Severe Winter Storm",
+                declaration_date=date(2025, 12, 26),
+                incident_start=date(2025, 12, 26),
+                incident_end=date(2026, 1, 25),
+                counties=["Albany", "Bronx", "Broome", "Cayuga", "Chenango", "Columbia",
+                           "Cortland", "Delaware", "Dutchess", "Fulton", "Greene", "Herkimer",
+                           "Kings", "Madison", "Montgomery", "Nassau", "New York", "Oneida",
+                           "Onondaga", "Orange", "Oswego", "Otsego", "Putnam", "Queens",
+                           "Rensselaer", "Richmond", "Rockland", "Saratoga", "Schenectady",
+                           "Schoharie", "Suffolk", "Sullivan", "Ulster", "Wayne", "Westchester"],
+                statewide=False,
+                official_url="https://www.governor.ny.gov/executive-order/no-55-declaring-disaster-emergency-counties-albany-bronx-broome-cayuga-chenango",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW YORK (EO 57, Jan 23 2026 Winter Storm) ---
+            # Statewide. Previously had wrong URL (pointed to EO 55).
+            dict(winter_storm,
+                id_str="STATE-2026-001-NY",
+                state="NY",
+                title="Governor Hochul Emergency Declaration (EO 57) — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=None,
+                official_url="https://www.governor.ny.gov/executive-order/no-57-declaring-disaster-emergency-throughout-state-new-york",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW YORK (EO 58, Feb 21 2026 Nor'easter / Winter Storm Hernando) ---
+            # 22+ counties
+            dict(
+                id_str="STATE-2026-003-NY",
+                state="NY",
+                title="Governor Hochul Emergency Declaration (EO 58) — February 2026 Nor'easter",
+                incident_type="Severe Winter Storm",
+                declaration_date=date(2026, 2, 21),
+                incident_start=date(2026, 2, 22),
+                incident_end=date(2026, 3, 24),
+                counties=["Albany", "Bronx", "Columbia", "Delaware", "Dutchess", "Greene",
+                           "Kings", "Nassau", "New York", "Orange", "Otsego", "Putnam",
+                           "Queens", "Rensselaer", "Richmond", "Rockland", "Schenectady",
+                           "Schoharie", "Suffolk", "Sullivan", "Ulster", "Westchester"],
+                statewide=False,
+                official_url="https://www.governor.ny.gov/executive-order/no-58-declaring-disaster-emergency-counties-albany-bronx-columbia-greene-delaware",
+                last_verified="2026-03-27",
+            ),
+
+            # --- PENNSYLVANIA ---
+            # Gov Shapiro, Jan 24, statewide, 21-day auto-expire (~Feb 14)
+            dict(winter_storm,
+                id_str="STATE-2026-001-PA",
+                state="PA",
+                title="Governor Shapiro Disaster Emergency Proclamation — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 24),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 2, 14),
+                official_url="https://www.pa.gov/governor/newsroom/2026-press-releases/gov-shapiro-signs-proclamation-of-disaster-emergency-to-prepare-/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- DELAWARE ---
+            # Gov Meyer, Jan 23, statewide, TERMINATED Jan 26
+            dict(winter_storm,
+                id_str="STATE-2026-001-DE",
+                state="DE",
+                title="Governor Meyer Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 1, 26),
+                official_url="https://news.delaware.gov/2026/01/23/soe-eoc-activated-winter-storm/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW MEXICO ---
+            # Gov Lujan Grisham, Jan 22, EO 2026-005, statewide
+            dict(winter_storm,
+                id_str="STATE-2026-001-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency Declaration (EO 2026-005) — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://www.dhsem.nm.gov/governor-activates-emergency-resources-as-winter-weather-moves-into-new-mexico/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- KENTUCKY ---
+            # Gov Beshear, Jan 2026 winter storm (separate from Jan 2025)
+            dict(winter_storm,
+                id_str="STATE-2026-001-KY",
+                state="KY",
+                title="Governor Beshear Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.ky.gov/attachments/20260123_Executive-Order_2026-047_State-of-Emergency-Related-to-Continuing-Winter-Weather-Event.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- LOUISIANA ---
+            # Gov Landry, Jan 18 2025, statewide, renewed/extended
+            dict(winter_storm,
+                id_str="STATE-2025-001-LA",
+                state="LA",
+                title="Governor Landry Emergency Declaration (JML 25-12) — January 2025 Winter Storm",
+                declaration_date=date(2025, 1, 18),
+                incident_start=date(2025, 1, 18),
+                incident_end=None,
+                official_url="https://gov.louisiana.gov/news/4746",
+                last_verified="2026-03-27",
+            ),
+
+            # --- ARKANSAS ---
+            # Gov Sanders, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-AR",
+                state="AR",
+                title="Governor Sanders Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.arkansas.gov/executive_orders/sanders-declares-emergency-for-severe-winter-weather-expected-on-or-about-january-23-2026/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MISSISSIPPI ---
+            # Gov Reeves, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-MS",
+                state="MS",
+                title="Governor Reeves Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governorreeves.ms.gov/governor-reeves-issues-state-of-emergency-ahead-of-severe-winter-weather/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- INDIANA ---
+            # Gov Braun, Jan 25 2026, EO 26-03, statewide, 60-day window
+            dict(winter_storm,
+                id_str="STATE-2026-001-IN",
+                state="IN",
+                title="Governor Braun Disaster Emergency (EO 26-03) — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 25),
+                incident_start=date(2026, 1, 23),
+                incident_end=None,
+                official_url="https://www.in.gov/gov/files/EO26-03.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MARYLAND ---
+            # Gov Moore, late Jan 2025 (Jan 24-26 storm), statewide
+            dict(winter_storm,
+                id_str="STATE-2025-002-MD",
+                state="MD",
+                title="Governor Moore Emergency Declaration — January 2025 Winter Storm",
+                declaration_date=date(2025, 1, 24),
+                incident_start=date(2025, 1, 24),
+                incident_end=date(2025, 1, 28),
+                official_url="https://governor.maryland.gov/news/press/pages/Governor-Moore-Declares-State-of-Emergency,-Requests-Federal-Emergency-Declaration-Ahead-of-Dangerous-Winter-Storm.aspx",
+                last_verified="2026-03-27",
+            ),
+
+            # --- WEST VIRGINIA ---
+            # Gov Morrisey, Jan 23 2026, statewide (all 55 counties)
+            dict(winter_storm,
+                id_str="STATE-2026-001-WV",
+                state="WV",
+                title="Governor Morrisey Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 21),
+                incident_end=None,
+                official_url="https://governor.wv.gov/article/governor-morrisey-declares-state-emergency-all-55-counties-major-winter-storm-approaches",
+                last_verified="2026-03-27",
+            ),
+
+            # --- SOUTH CAROLINA ---
+            # Gov McMaster, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-SC",
+                state="SC",
+                title="Governor McMaster Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.sc.gov/news/2026-01/gov-mcmaster-declares-state-emergency-ahead-winter-storm",
+                last_verified="2026-03-27",
+            ),
+
+            # --- TENNESSEE ---
+            # Gov Lee, Jan 22 2026, statewide (all 95 counties)
+            dict(winter_storm,
+                id_str="STATE-2026-001-TN",
+                state="TN",
+                title="Governor Lee Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 22),
+                incident_end=None,
+                official_url="https://www.tn.gov/governor/news/2026/1/22/gov--lee-issues-state-of-emergency-ahead-of-major-winter-storm.html",
+                last_verified="2026-03-27",
+            ),
+
+            # --- COLORADO — Western Colorado Flooding (Oct 2025) ---
+            # EO D 2025-021, verbal Oct 12, signed Nov 10. Tropical Storms Priscilla/Raymond.
+            # FEMA major disaster request denied; appeal filed.
+            # $13.8M validated infrastructure damage, 60+ miles of road destroyed.
+            dict(
+                id_str="STATE-2025-001-CO",
+                state="CO",
+                title="Governor Polis Emergency — Western Colorado Flooding (EO D 2025-021)",
+                incident_type="Flood",
+                declaration_date=date(2025, 10, 12),
+                incident_start=date(2025, 10, 10),
+                incident_end=date(2025, 10, 14),
+                counties=["Archuleta", "La Plata", "Mineral"],
+                statewide=False,
+                official_url="https://www.colorado.gov/governor/news/governor-polis-memorializes-emergency-declaration-support-communities-recovering-flooding",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CONNECTICUT ---
+            # Gov Lamont, Jan 25 2026, statewide, storm passed ~Jan 27
+            dict(winter_storm,
+                id_str="STATE-2026-001-CT",
+                state="CT",
+                title="Governor Lamont Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 25),
+                incident_start=date(2026, 1, 25),
+                incident_end=date(2026, 1, 27),
+                official_url="https://portal.ct.gov/governor/news/press-releases/2026/01-2026/governor-lamont-declares-state-of-emergency-limits-commercial-vehicle-travel",
+                last_verified="2026-03-27",
+            ),
+
+            # --- OHIO ---
+            # Gov DeWine, Jan 24 2026, statewide (all 88 counties), 90-day window
+            dict(winter_storm,
+                id_str="STATE-2026-001-OH",
+                state="OH",
+                title="Governor DeWine Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 24),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 4, 26),
+                official_url="https://content.govdelivery.com/accounts/OHIOGOVERNOR/bulletins/405eda8",
+                last_verified="2026-03-27",
+            ),
+
+            # --- KANSAS ---
+            # Gov Kelly, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-KS",
+                state="KS",
+                title="Governor Kelly Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://www.kansastag.gov/m/newsflash/Home/Detail/817",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MISSOURI ---
+            # Gov Kehoe, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-MO",
+                state="MO",
+                title="Governor Kehoe Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-signs-executive-order-26-05-declaring-state-emergency",
+                last_verified="2026-03-27",
+            ),
+
+            # --- ALABAMA ---
+            # Gov Ivey, Jan 2026 winter storm
+            dict(winter_storm,
+                id_str="STATE-2026-001-AL",
+                state="AL",
+                title="Governor Ivey Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 22),
+                incident_start=date(2026, 1, 20),
+                incident_end=None,
+                official_url="https://governor.alabama.gov/newsroom/2026/01/governor-ivey-issues-state-of-emergency-for-19-northern-counties-ahead-of-wintery-icy-forecast/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW JERSEY ---
+            # Gov Sherrill, Jan 24 2026, Executive Order 8, all 21 counties
+            # Emergency ended Jan 26 at noon
+            dict(winter_storm,
+                id_str="STATE-2026-001-NJ",
+                state="NJ",
+                title="Governor Sherrill Emergency Declaration (EO 8) — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 24),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 1, 26),
+                official_url="https://www.nj.gov/governor/news/2026/20260123b.shtml",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MARYLAND (Jan 2026 Winter Storm — separate from Jan 2025) ---
+            # Gov Moore, Jan 23 2026, statewide
+            dict(winter_storm,
+                id_str="STATE-2026-001-MD",
+                state="MD",
+                title="Governor Moore Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=None,
+                official_url="https://governor.maryland.gov/news/press/pages/Governor-Moore-Declares-State-of-Emergency,-Requests-Federal-Emergency-Declaration-Ahead-of-Dangerous-Winter-Storm.aspx",
+                last_verified="2026-03-27",
+            ),
+
+            # --- WASHINGTON, D.C. ---
+            # Mayor Bowser, Jan 23 2026, district-wide
+            # Snow emergency period Jan 24 - Jan 27
+            dict(winter_storm,
+                id_str="STATE-2026-001-DC",
+                state="DC",
+                title="Mayor Bowser Emergency Declaration — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 1, 27),
+                official_url="https://mayor.dc.gov/release/mayor-bowser-declares-state-emergency-washington-dc-ahead-major-winter-storm-and-extreme",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MAINE ---
+            # Gov Mills, Jan 5 2026, Energy Emergency Proclamation
+            # Also declared Civil Emergency for coastal flooding Jan 10
+            # Energy emergency expired Jan 15; coastal counties affected
+            dict(
+                id_str="STATE-2026-001-ME",
+                state="ME",
+                title="Governor Mills Emergency Declaration — January 2026 Energy Emergency & Coastal Flooding",
+                incident_type="Energy Emergency",
+                declaration_date=date(2026, 1, 5),
+                incident_start=date(2026, 1, 5),
+                incident_end=date(2026, 1, 15),
+                counties=[
+                    "Cumberland", "Hancock", "Knox", "Lincoln",
+                    "Sagadahoc", "Waldo", "Washington", "York",
+                ],
+                statewide=False,
+                official_url="https://www.maine.gov/governor/mills/news/governor-mills-declares-state-civil-emergency-coastal-counties-impacted-flooding-urges-maine",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # CALIFORNIA GOVERNOR DECLARATIONS
+            # =============================================================
+
+            # California Dec 2025 storms - Gov Newsom, 6 counties
+            dict(
+                id_str="STATE-2025-002-CA",
+                state="CA",
+                title="Governor Newsom Emergency Declaration — December 2025 Winter Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 24),
+                incident_start=date(2025, 12, 21),
+                incident_end=None,
+                counties=[
+                    "Los Angeles", "Orange", "Riverside", "San Bernardino",
+                    "San Diego", "Shasta",
+                ],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/24/governor-newsom-proclaims-state-of-emergency-to-support-response-in-multiple-counties-due-to-late-december-storms/",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # MASSACHUSETTS GOVERNOR DECLARATION
+            # =============================================================
+
+            # Gov Healey, Jan 23 2026, Declaration of Emergency (heating fuels + winter storm)
+            # Referenced on FMCSA site; statewide scope
+            dict(winter_storm,
+                id_str="STATE-2026-001-MA",
+                state="MA",
+                title="Governor Healey Declaration of Emergency — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=None,
+                official_url="https://www.fmcsa.dot.gov/emergency/massachusetts-declaration-emergency-notice-1-23-2026",
+                last_verified="2026-03-27",
+            ),
 
-        # --- CALIFORNIA: Mid-September Storm, Imperial + San Bernardino ---
-        rec = build_record(
-            id_str="STATE-2025-024-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — September 2025 Storm (Imperial, San Bernardino)",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 23),
-            incident_start=date(2025, 9, 18),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Imperial", "San Bernardino"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # California Jan 2025 LA Wildfires - Gov Newsom
+            dict(
+                id_str="STATE-2025-001-CA",
+                state="CA",
+                title="Governor Newsom Emergency Declaration — January 2025 Los Angeles Wildfires",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 1, 7),
+                incident_start=date(2025, 1, 7),
+                incident_end=None,
+                counties=["Los Angeles", "Ventura"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/01/07/governor-newsom-proclaims-state-of-emergency-meets-with-first-responders-in-pacific-palisades-amid-dangerous-fire-weather/",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # NEW STATE DECLARATIONS — Added Mar 27, 2026 audit
+            # =============================================================
+
+            # Florida EO 26-33: Cold front (Jan 31 - Feb 3), drought, wildfires — all 67 counties
+            # Signed Feb 9, 2026. Incident start = Jan 31 (cold front onset per EO text).
+            # Ongoing due to drought/wildfire component (120 active wildfires at signing).
+            # PDF: https://www.flgov.com/eog/sites/default/files/executive-orders/2026/EO%2026-33.pdf
+            dict(
+                id_str="STATE-2026-001-FL",
+                state="FL",
+                title="Governor DeSantis EO 26-33 — Cold Front, Drought, Wildfires",
+                incident_type="Wildfire",
+                declaration_date=date(2026, 2, 9),
+                incident_start=date(2026, 1, 31),
+                incident_end=None,  # Ongoing — drought + 120 active wildfires
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.flgov.com/eog/sites/default/files/executive-orders/2026/EO%2026-33.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # Oklahoma EO 2026-11: Tornadoes/severe weather — Mar 7, 2026
+            dict(
+                id_str="STATE-2026-002-OK",
+                state="OK",
+                title="Governor Stitt Emergency Declaration — Tornadoes and Severe Weather",
+                incident_type="Tornado",
+                declaration_date=date(2026, 3, 7),
+                incident_start=date(2026, 3, 7),
+                incident_end=None,
+                counties=["Creek", "Mayes", "Muskogee", "Okmulgee", "Rogers", "Tulsa", "Wagoner", "Washington"],
+                statewide=False,
+                official_url="https://oklahoma.gov/governor/newsroom/newsroom/2026/governor-stitt-declares-state-of-emergency-following-severe-weather.html",
+                last_verified="2026-03-27",
+            ),
+
+            # Michigan EO 2026-1: Deadly tornadoes — Mar 8, 2026
+            dict(
+                id_str="STATE-2026-002-MI",
+                state="MI",
+                title="Governor Whitmer Emergency Declaration — Deadly Tornadoes",
+                incident_type="Tornado",
+                declaration_date=date(2026, 3, 8),
+                incident_start=date(2026, 3, 8),
+                incident_end=None,
+                counties=["Branch", "Cass", "St. Joseph"],
+                statewide=False,
+                official_url="https://www.michigan.gov/whitmer/news/press-releases/2026/03/08/whitmer-declares-state-emergency-following-deadly-tornadoes-in-southwest-michigan",
+                last_verified="2026-03-27",
+            ),
 
-        # --- CALIFORNIA: Late December Storms, 6 counties ---
-        rec = build_record(
-            id_str="STATE-2025-025-CA",
-            source="STATE", state="CA",
-            title="Governor Newsom Proclamation — Late December 2025 Storms (6 counties)",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 12, 24),
-            incident_start=date(2025, 12, 23),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Los Angeles", "Orange", "Riverside", "San Bernardino", "San Diego", "Shasta"],
-            statewide=False,
-            official_url="https://www.gov.ca.gov/2025/12/24/governor-newsom-proclaims-state-of-emergency-to-support-response-in-multiple-counties-due-to-late-december-storms/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # Michigan EO 2026-2/3: Historic blizzard — Mar 17+25, 2026
+            dict(
+                id_str="STATE-2026-003-MI",
+                state="MI",
+                title="Governor Whitmer Emergency Declaration — Historic Blizzard (EO 2026-2, amended 2026-3)",
+                incident_type="Severe Winter Storm",
+                declaration_date=date(2026, 3, 17),
+                incident_start=date(2026, 3, 17),
+                incident_end=None,
+                renewal_dates_list=[date(2026, 3, 25)],  # EO 2026-3 amendment added Osceola County
+                counties=["Antrim", "Benzie", "Grand Traverse", "Kalkaska", "Leelanau",
+                           "Manistee", "Missaukee", "Osceola", "Wexford"],
+                statewide=False,
+                official_url="https://www.michigan.gov/whitmer/news/state-orders-and-directives/2026/03/17/executive-order-2026-2-declaration-of-state-of-emergency-and-energy-emergency",
+                last_verified="2026-03-27",
+            ),
+
+            # Missouri EO 26-08: Severe storms/tornadoes — Mar 6, 2026
+            dict(
+                id_str="STATE-2026-002-MO",
+                state="MO",
+                title="Governor Kehoe Emergency Declaration — Severe Storms and Tornadoes",
+                incident_type="Tornado",
+                declaration_date=date(2026, 3, 6),
+                incident_start=date(2026, 3, 6),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-signs-executive-order-26-08-activating-state-emergency",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NJ EO 409: Dec 26, 2025 Winter Storm ---
-        rec = build_record(
-            id_str="STATE-2025-001-NJ",
-            source="STATE", state="NJ",
-            title="NJ Acting Governor Way Emergency (EO 409) — December 2025 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2025, 12, 26),
-            incident_start=date(2025, 12, 26),
-            incident_end=date(2025, 12, 30),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://nj.gov/infobank/eo/056murphy/pdf/EO-409.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # Nebraska: Wildfires — Mar 25-26, 2026
+            dict(
+                id_str="STATE-2026-002-NE",
+                state="NE",
+                title="Governor Pillen Emergency Declaration — Wildfires",
+                incident_type="Wildfire",
+                declaration_date=date(2026, 3, 25),
+                incident_start=date(2026, 3, 25),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.nebraska.gov/gov-pillen-declares-emergency-mobilizes-guard-wildfires-burn-central-and-western-nebraska",
+                last_verified="2026-03-27",
+            ),
+
+            # Rhode Island EO 26-02: Blizzard — Feb 22, 2026
+            dict(winter_storm,
+                id_str="STATE-2026-001-RI",
+                state="RI",
+                title="Governor McKee Emergency Declaration — Blizzard",
+                declaration_date=date(2026, 2, 22),
+                incident_start=date(2026, 2, 22),
+                incident_end=None,
+                official_url="https://governor.ri.gov/press-releases/governor-mckee-declares-state-emergency-issues-travel-ban-ahead-blizzard-conditions",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # v3.0 CARRIER-DISCOVERED BACKFILL — March 2026
+            # Records below discovered via Aetna/Wellcare carrier data
+            # cross-reference (carrier_data_parser.py). Official government
+            # URLs verified from carrier RelatedLinks fields.
+            # =============================================================
+
+            # --- CALIFORNIA (Governor Newsom consolidated declarations) ---
+            # Many CA disasters covered by a Dec 23 2025 omnibus proclamation
+
+            dict(
+                id_str="STATE-2025-010-CA",
+                state="CA",
+                title="Governor Newsom Emergency — February 2025 Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 2, 1),
+                incident_start=date(2025, 1, 31),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/07/29/governor-newsom-issues-emergency-proclamation-for-storm-impacted-counties/",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-011-CA",
+                state="CA",
+                title="Governor Newsom Emergency — Rancho Cucamonga Windstorm",
+                incident_type="Severe Wind",
+                declaration_date=date(2025, 1, 7),
+                incident_start=date(2025, 1, 7),
+                incident_end=date(2026, 1, 7),
+                counties=["San Bernardino"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-012-CA",
+                state="CA",
+                title="Governor Newsom Emergency — July 2025 Tsunami",
+                incident_type="Tsunami",
+                declaration_date=date(2025, 7, 30),
+                incident_start=date(2025, 7, 30),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NJ EO 392: Jul 14, 2025 Flash Flooding ---
-        rec = build_record(
-            id_str="STATE-2025-002-NJ",
-            source="STATE", state="NJ",
-            title="Governor Murphy Emergency (EO 392) — July 2025 Flash Flooding",
-            incident_type="Flash Flooding",
-            declaration_date=date(2025, 7, 14),
-            incident_start=date(2025, 7, 14),
-            incident_end=date(2025, 8, 8),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://nj.gov/infobank/eo/056murphy/pdf/EO-392.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-013-CA",
+                state="CA",
+                title="Governor Newsom Emergency — Gifford Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 8, 1),
+                incident_start=date(2025, 8, 1),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-014-CA",
+                state="CA",
+                title="Governor Newsom Emergency — August Storms and Mudslides",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 8, 23),
+                incident_start=date(2025, 8, 23),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NJ EO 394: Jul 31, 2025 Flash Flooding ---
-        rec = build_record(
-            id_str="STATE-2025-003-NJ",
-            source="STATE", state="NJ",
-            title="NJ Acting Governor Way Emergency (EO 394) — July 2025 Flash Flooding",
-            incident_type="Flash Flooding",
-            declaration_date=date(2025, 7, 31),
-            incident_start=date(2025, 7, 31),
-            incident_end=date(2025, 8, 8),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.nj.gov/governor/news/news/562025/approved/20250731a.shtml",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-015-CA",
+                state="CA",
+                title="Governor Newsom Emergency — September Lightning Complex",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 9, 2),
+                incident_start=date(2025, 9, 2),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/09/19/governor-newsom-issues-emergency-proclamation-to-help-calaveras-and-tuolumne-counties-recover-from-tcu-lightning-complex-fires/",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-016-CA",
+                state="CA",
+                title="Governor Newsom Emergency — Tropical Storm Mario",
+                incident_type="Tropical Storm",
+                declaration_date=date(2025, 9, 18),
+                incident_start=date(2025, 9, 18),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NJ EO 14: Feb 21, 2026 Nor'easter ---
-        rec = build_record(
-            id_str="STATE-2026-002-NJ",
-            source="STATE", state="NJ",
-            title="Governor Sherrill Emergency (EO 14) — February 2026 Nor'easter",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 21),
-            incident_start=date(2026, 2, 22),
-            incident_end=date(2026, 2, 25),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://nj.gov/infobank/eo/057sherrill/pdf/EO-14.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-017-CA",
+                state="CA",
+                title="Governor Newsom Emergency — Mono Pack Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 12, 9),
+                incident_start=date(2025, 11, 13),
+                incident_end=None,
+                counties=["Mono"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/09/governor-newsom-proclaims-state-of-emergency-in-mono-county-due-to-the-pack-fire/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CONNECTICUT — Feb 22 2026 Winter Storm ---
+            dict(winter_storm,
+                id_str="STATE-2026-002-CT",
+                state="CT",
+                title="Governor Lamont Emergency Declaration — February 2026 Winter Storm",
+                declaration_date=date(2026, 2, 22),
+                incident_start=date(2026, 2, 22),
+                incident_end=None,
+                official_url="https://portal.ct.gov/governor/news/press-releases/2026/02-2026/governor-lamont-declares-state-of-emergency-prohibits-commercial-vehicle-travel",
+                last_verified="2026-03-27",
+            ),
 
-        # --- DE Feb 2026 Nor'easter ---
-        rec = build_record(
-            id_str="STATE-2026-002-DE",
-            source="STATE", state="DE",
-            title="Governor Meyer Emergency — February 2026 Nor'easter",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=date(2026, 2, 24),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.delaware.gov/state-of-emergency/declaration-of-a-state-of-emergency-due-to-a-severe-winter-storm/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # --- HAWAII ---
+            dict(
+                id_str="STATE-2025-001-HI",
+                state="HI",
+                title="Governor Green Emergency — Wildfires",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 15),
+                incident_start=date(2025, 7, 15),
+                incident_end=date(2025, 10, 21),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.hawaii.gov/wp-content/uploads/2025/07/2507065_ATG-Proclamation-Wildfires.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2026-001-HI",
+                state="HI",
+                title="Governor Green Emergency — February 2026 Severe Weather",
+                incident_type="Severe Storm",
+                declaration_date=date(2026, 2, 6),
+                incident_start=date(2026, 2, 6),
+                incident_end=date(2026, 2, 11),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.hawaii.gov/newsroom/news-release-hiema-advises-public-to-prepare-for-severe-weather/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- HAWAII — Feb 20-22 Heavy Rains ---
+            # Proclamation 2602068, signed Feb 24. Separate from Feb 6-11 severe weather.
+            dict(
+                id_str="STATE-2026-002-HI",
+                state="HI",
+                title="Governor Green Proclamation — February 20-22, 2026 Heavy Rains",
+                incident_type="Flood",
+                declaration_date=date(2026, 2, 24),
+                incident_start=date(2026, 2, 20),
+                incident_end=date(2026, 2, 22),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.hawaii.gov/wp-content/uploads/2026/02/2602068_Proclamation-Relating-to-February-20-22-2026-Rains-Scanned.pdf",
+                last_verified="2026-03-27",
+            ),
 
-        # --- WI EO 272: Aug 2025 Flooding ---
-        rec = build_record(
-            id_str="STATE-2025-001-WI",
-            source="STATE", state="WI",
-            title="Governor Evers Emergency (EO 272) — August 2025 Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 8, 11),
-            incident_start=date(2025, 8, 9),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://evers.wi.gov/Documents/EO/EO272-EmergencyOrderFlooding.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # --- KANSAS — Wildland Fires Feb 2026 ---
+            dict(
+                id_str="STATE-2026-002-KS",
+                state="KS",
+                title="Governor Kelly Emergency — Wildland Fires",
+                incident_type="Wildfire",
+                declaration_date=date(2026, 2, 15),
+                incident_start=date(2026, 2, 15),
+                incident_end=date(2026, 3, 2),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.kansastag.gov/m/newsflash/Home/Detail/821",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MAINE — Jan 2026 Winter Storm ---
+            dict(winter_storm,
+                id_str="STATE-2026-002-ME",
+                state="ME",
+                title="Governor Mills Emergency — January 2026 Winter Storm",
+                declaration_date=date(2026, 1, 25),
+                incident_start=date(2026, 1, 25),
+                incident_end=date(2026, 2, 24),
+                official_url="https://www.maine.gov/governor/mills/news/powerful-noreaster-expected-governor-mills-closes-state-offices-monday-2026-02-22",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MISSOURI ---
+            dict(
+                id_str="STATE-2025-001-MO",
+                state="MO",
+                title="Governor Kehoe Emergency — April 2025 Severe Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 4, 29),
+                incident_start=date(2025, 4, 29),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-requests-federal-disaster-declaration-response-march-30-april",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-002-MO",
+                state="MO",
+                title="Governor Kehoe Emergency — May 2025 Memorial Weekend Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 5, 23),
+                incident_start=date(2025, 5, 23),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.mo.gov/press-releases/archive/governor-kehoe-announces-fema-participate-joint-damage-assessments-5",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MONTANA — Dec 2025 Flooding ---
+            dict(
+                id_str="STATE-2025-001-MT",
+                state="MT",
+                title="Governor Gianforte Emergency — December 2025 Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 12, 8),
+                incident_start=date(2025, 12, 8),
+                incident_end=date(2026, 1, 25),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Receives-Incident-Command-Briefing-on-Flooding-in-Libby",
+                last_verified="2026-03-27",
+            ),
 
-        # --- PA Feb 22 Blizzard ---
-        rec = build_record(
-            id_str="STATE-2026-002-PA",
-            source="STATE", state="PA",
-            title="Governor Shapiro Disaster Emergency — February 2026 Winter Storm",
-            incident_type="Severe Winter Storm",
-            declaration_date=date(2026, 2, 22),
-            incident_start=date(2026, 2, 22),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://www.pa.gov/content/dam/copapwp-pagov/en/pema/documents/governor-proclamations/2026.2.22%20disaster%20emergency%20proclamation%20winter%20weather.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # --- NEBRASKA (multiple 2025 events) ---
+            dict(
+                id_str="STATE-2025-001-NE",
+                state="NE",
+                title="Governor Pillen Emergency — March 2025 Winter Storm",
+                incident_type="Severe Winter Storm",
+                declaration_date=date(2025, 3, 21),
+                incident_start=date(2025, 3, 18),
+                incident_end=None,
+                counties=["Boone", "Burt", "Butler", "Cass", "Clay", "Colfax", "Cuming", "Dodge", "Douglas", "Fillmore", "Hamilton", "Jefferson", "Johnson", "Lancaster", "Nuckolls", "Otoe", "Platte", "Polk", "Saline", "Sarpy", "Saunders", "Seward", "Thayer", "Thurston", "Washington", "York"],
+                statewide=False,
+                official_url="https://governor.nebraska.gov/gov-pillen-declares-emergency-counties-impacted-winter-storm",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NM EO 2025-362: Mora County Flooding ---
-        rec = build_record(
-            id_str="STATE-2025-009-NM",
-            source="STATE", state="NM",
-            title="Governor Lujan Grisham Emergency (EO 2025-362) — Mora County Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 9, 2),
-            incident_start=date(2025, 8, 28),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Mora"],
-            statewide=False,
-            official_url="https://www.governor.state.nm.us/2025/09/02/governor-signs-emergency-order-for-mora-county-flooding/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-002-NE",
+                state="NE",
+                title="Governor Pillen Emergency — Plum Creek Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 4, 21),
+                incident_start=date(2025, 4, 21),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.nebraska.gov/governor-pillen-declares-emergency-mobilizes-nebraska-national-guard-and-issues-statewide-burn-ban",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-003-NE",
+                state="NE",
+                title="Governor Pillen Emergency — Dawson County Severe Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 6, 29),
+                incident_start=date(2025, 6, 29),
+                incident_end=None,
+                counties=["Dawson"],
+                statewide=False,
+                official_url="https://governor.nebraska.gov/gov-pillen-issues-disaster-declaration-dawson-county-following-june-storms",
+                last_verified="2026-03-27",
+            ),
+
+            dict(
+                id_str="STATE-2025-004-NE",
+                state="NE",
+                title="Governor Pillen Emergency — August 2025 Storms",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 8, 8),
+                incident_start=date(2025, 8, 8),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.nebraska.gov/gov-pillen-issues-disaster-declaration-23-counties-following-aug-8-storms",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NEW MEXICO ---
+            dict(
+                id_str="STATE-2025-001-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — July 2025 Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 7, 25),
+                incident_start=date(2025, 7, 22),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.governor.state.nm.us/2025/07/08/new-mexico-governor-mobilizes-resources-following-catastrophic-flooding-in-ruidoso/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- HI Lahaina Wildfires (ongoing since Aug 2023) ---
-        # 27th Proclamation (Nov 2025), 28th (Jan 2026). Separate from STATE-2025-001-HI.
-        rec = build_record(
-            id_str="STATE-2023-001-HI",
-            source="STATE", state="HI",
-            title="Governor Green Emergency — Lahaina Wildfires (ongoing since Aug 2023)",
-            incident_type="Wildfire",
-            declaration_date=date(2023, 8, 9),
-            incident_start=date(2023, 8, 8),
-            incident_end=None,
-            renewal_dates_list=[date(2025, 11, 7), date(2026, 1, 9), date(2026, 3, 6)],
-            counties=["Maui"],
-            statewide=True,
-            official_url="https://governor.hawaii.gov/wp-content/uploads/2025/11/2511016.pdf",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(winter_storm,
+                id_str="STATE-2026-002-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — January 2026 Severe Weather",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=None,
+                official_url="https://www.dot.nm.gov/blog/2026/01/22/winter-storm-watch-and-travel-advisory-issued/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- PR records REMOVED 2026-03-27 ---
-        # CPC does not sell plans in Puerto Rico. PR declarations (OE-2025-004 landslides,
-        # OE-2025-022 April rains) are valid DSTs but not relevant to our agents.
+            # --- OKLAHOMA — Feb 2026 Wildfires ---
+            dict(
+                id_str="STATE-2026-003-OK",
+                state="OK",
+                title="Governor Stitt Emergency — February 2026 Wildfires",
+                incident_type="Wildfire",
+                declaration_date=date(2026, 2, 17),
+                incident_start=date(2026, 2, 17),
+                incident_end=date(2026, 3, 19),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://oklahoma.gov/governor/newsroom/newsroom/2026/governor-declares-state-of-emergency.html",
+                last_verified="2026-03-27",
+            ),
 
-        # =============================================================
-        # PHASE 3 SESSION 2b — REMAINING CARRIER GAPS (from cross-ref)
-        # =============================================================
+            # --- OREGON (multiple wildfires 2025) ---
+            dict(
+                id_str="STATE-2025-001-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Rowena Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 6, 11),
+                incident_start=date(2025, 6, 11),
+                incident_end=date(2025, 7, 30),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-for-rowena-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-002-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Cold Spring Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 2),
+                incident_start=date(2025, 7, 2),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-cold-springs-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-003-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Elk Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 9),
+                incident_start=date(2025, 7, 9),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-elk-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-004-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Highland Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 12),
+                incident_start=date(2025, 7, 12),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-highland-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-005-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Cram Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 14),
+                incident_start=date(2025, 7, 14),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-cram-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-006-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Flat Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 8, 22),
+                incident_start=date(2025, 8, 22),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-flat-fire",
+                last_verified="2026-03-27",
+            ),
+            dict(
+                id_str="STATE-2025-007-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Moon Complex Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 9, 27),
+                incident_start=date(2025, 9, 27),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-moon-complex-fire",
+                last_verified="2026-03-27",
+            ),
+
+            # --- SOUTH DAKOTA — Dec 2025 Winter Wind Storm ---
+            dict(
+                id_str="STATE-2025-001-SD",
+                state="SD",
+                title="Governor Noem Emergency — Severe Winter Wind Storm",
+                incident_type="Severe Wind",
+                declaration_date=date(2025, 12, 17),
+                incident_start=date(2025, 12, 17),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://news.sd.gov/news?id=news_kb_article_view&sys_id=96a3de25dbd2b2d091ce9f9583d5bfbd",
+                last_verified="2026-03-27",
+            ),
+
+            # --- WASHINGTON — Dec 2025 Winter Weather ---
+            dict(winter_storm,
+                id_str="STATE-2025-001-WA",
+                state="WA",
+                title="Governor Ferguson Emergency — Winter Weather and River Flooding",
+                declaration_date=date(2025, 12, 2),
+                incident_start=date(2025, 12, 2),
+                incident_end=None,
+                official_url="https://governor.wa.gov/news/2025/governor-ferguson-declares-statewide-emergency",
+                last_verified="2026-03-27",
+            ),
 
-        # --- OR Drought (5 EOs, 8 counties) ---
-        # Governor Kotek, July-Sep 2025, rolling drought declarations
-        rec = build_record(
-            id_str="STATE-2025-008-OR",
-            source="STATE", state="OR",
-            title="Governor Kotek Drought Emergency — Multiple Counties (EO 25-12 through 25-23)",
-            incident_type="Drought",
-            declaration_date=date(2025, 7, 15),
-            incident_start=date(2025, 6, 1),
-            incident_end=None,
-            renewal_dates_list=[date(2025, 8, 4), date(2025, 9, 29)],
-            counties=["Baker", "Coos", "Douglas", "Jefferson", "Lincoln", "Morrow", "Union", "Wheeler"],
-            statewide=False,
-            official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-drought-emergency-in-baker-county",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # --- WYOMING ---
+            dict(
+                id_str="STATE-2025-001-WY",
+                state="WY",
+                title="Governor Gordon Emergency — Red Canyon Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 8, 13),
+                incident_start=date(2025, 8, 13),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.wyo.gov/news-releases/governor-gordon-issues-emergency-declaration-for-red-canyon-fire",
+                last_verified="2026-03-27",
+            ),
 
-        # --- AR Severe Storms, Tornadoes, Flooding (DR 25-04) ---
-        # Governor Sanders, April 2, 2025
-        rec = build_record(
-            id_str="STATE-2025-001-AR",
-            source="STATE", state="AR",
-            title="Governor Sanders Emergency (DR 25-04) — April 2025 Storms and Tornadoes",
-            incident_type="Tornado",
-            declaration_date=date(2025, 4, 2),
-            incident_start=date(2025, 4, 2),
-            incident_end=date(2025, 4, 16),
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://governor.arkansas.gov/news_post/sanders-declares-an-emergency-for-severe-storms-tornadoes-and-flooding-on-or-about-april-2-2025/",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-002-WY",
+                state="WY",
+                title="Governor Gordon Emergency — Dollar Fire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 8, 21),
+                incident_start=date(2025, 8, 21),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.wyo.gov/news-releases/governor-gordon-provides-wildfire-updates-dollar-fire",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # FLORIDA — HURRICANE / STORM GOVERNOR DECLARATIONS
+            # Carrier cross-reference: Aetna + Wellcare both track these
+            # =============================================================
+
+            # --- FL Hurricane Debby (Aug 2024) ---
+            # EO 24-156 initial, 10 governor extensions through EO 2026-59 (Mar 2026)
+            # Note: Aug 7 date from prior data was CFO/FDACS order, NOT governor EO
+            # 51+ counties, still active
+            dict(
+                id_str="STATE-2024-001-FL",
+                state="FL",
+                title="Governor DeSantis Emergency — Hurricane Debby (EO 24-156)",
+                incident_type="Hurricane",
+                declaration_date=date(2024, 8, 1),
+                incident_start=date(2024, 8, 1),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2024, 9, 25), date(2024, 11, 22),
+                    date(2025, 1, 17), date(2025, 3, 14), date(2025, 5, 14),
+                    date(2025, 7, 11), date(2025, 9, 9), date(2025, 11, 7),
+                    date(2026, 1, 6), date(2026, 3, 6),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2026-59",
+                last_verified="2026-03-27",
+                extensions=[
+                    {"date": "2024-09-25", "eo": "2024-211", "url": "https://www.flgov.com/eog/news/executive-orders/2024-211", "notes": "First 60-day extension"},
+                    {"date": "2024-11-22", "eo": "2024-261", "url": "https://www.flgov.com/eog/news/executive-orders/2024-261", "notes": "Second extension"},
+                    {"date": "2025-01-17", "eo": "2025-12", "url": "https://www.flgov.com/eog/news/executive-orders/2025-12", "notes": "Third extension"},
+                    {"date": "2025-03-14", "eo": "2025-59", "url": "https://www.flgov.com/eog/news/executive-orders/2025-59", "notes": "Fourth extension"},
+                    {"date": "2025-05-14", "eo": "2025-104", "url": "https://www.flgov.com/eog/news/executive-orders/2025-104", "notes": "Fifth extension"},
+                    {"date": "2025-07-11", "eo": "2025-144", "url": "https://www.flgov.com/eog/news/executive-orders/2025-144", "notes": "Sixth extension"},
+                    {"date": "2025-09-09", "eo": "2025-184", "url": "https://www.flgov.com/eog/news/executive-orders/2025-184", "notes": "Seventh extension"},
+                    {"date": "2025-11-07", "eo": "2025-232", "url": "https://www.flgov.com/eog/news/executive-orders/2025-232", "notes": "Eighth extension"},
+                    {"date": "2026-01-06", "eo": "2026-03", "url": "https://www.flgov.com/eog/news/executive-orders/2026-3", "notes": "Ninth extension"},
+                    {"date": "2026-03-06", "eo": "2026-59", "url": "https://www.flgov.com/eog/news/executive-orders/2026-59", "notes": "Tenth extension (current)"},
+                ],
+            ),
+
+            # --- FL Hurricane Helene (Sep 2024) ---
+            # EO 24-208 initial (for "Potential Tropical Cyclone Nine"), 7 extensions through EO 2026-58
+            # EO 24-209 amended to expand to 61 counties on Sep 24
+            # Still active
+            dict(
+                id_str="STATE-2024-002-FL",
+                state="FL",
+                title="Governor DeSantis Emergency — Hurricane Helene (EO 24-208)",
+                incident_type="Hurricane",
+                declaration_date=date(2024, 9, 23),
+                incident_start=date(2024, 9, 23),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2024, 11, 21), date(2025, 5, 14), date(2025, 7, 11),
+                    date(2025, 9, 9), date(2025, 11, 7), date(2026, 1, 6),
+                    date(2026, 3, 6),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2026-58",
+                last_verified="2026-03-27",
+                extensions=[
+                    {"date": "2024-11-21", "eo": "2024-249", "url": "https://www.flgov.com/eog/news/executive-orders/2024-249", "notes": "First extension"},
+                    {"date": "2025-05-14", "eo": "2025-102", "url": "https://www.flgov.com/eog/news/executive-orders/2025-102", "notes": "Second extension"},
+                    {"date": "2025-07-11", "eo": "2025-143", "url": "https://www.flgov.com/eog/news/executive-orders/2025-143", "notes": "Third extension"},
+                    {"date": "2025-09-09", "eo": "2025-182", "url": "https://www.flgov.com/eog/news/executive-orders/2025-182", "notes": "Fourth extension"},
+                    {"date": "2025-11-07", "eo": "2025-231", "url": "https://www.flgov.com/eog/news/executive-orders/2025-231", "notes": "Fifth extension (previously untracked)"},
+                    {"date": "2026-01-06", "eo": "2026-02", "url": "https://www.flgov.com/eog/news/executive-orders/2026-2", "notes": "Sixth extension"},
+                    {"date": "2026-03-06", "eo": "2026-58", "url": "https://www.flgov.com/eog/news/executive-orders/2026-58", "notes": "Seventh extension (current)"},
+                ],
+            ),
+
+            # --- FL Hurricane Milton (Oct 2024) ---
+            # EO 24-214 initial (titled "Tropical Storm Milton" at issuance), 7 extensions
+            # EO 24-215 amended Oct 6 to expand counties as storm intensified to Cat 5
+            # Confirmed expired: Last extension EO 2025-242 (Nov 25, 2025). No 2026 renewal.
+            # incidentEnd set to 2026-01-24 per Humana carrier data + our research.
+            dict(
+                id_str="STATE-2024-003-FL",
+                state="FL",
+                title="Governor DeSantis Emergency — Hurricane Milton (EO 24-214)",
+                incident_type="Hurricane",
+                declaration_date=date(2024, 10, 5),
+                incident_start=date(2024, 10, 5),
+                incident_end=date(2026, 1, 24),
+                renewal_dates_list=[
+                    date(2024, 12, 3), date(2025, 1, 31), date(2025, 3, 31),
+                    date(2025, 5, 30), date(2025, 7, 28), date(2025, 9, 26),
+                    date(2025, 11, 25),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2025-242",
+                last_verified="2026-03-27",
+                extensions=[
+                    {"date": "2024-12-03", "eo": "2024-264", "url": "https://www.flgov.com/eog/news/executive-orders/2024-264", "notes": "First extension"},
+                    {"date": "2025-01-31", "eo": "2025-26", "url": "https://www.flgov.com/eog/news/executive-orders/2025-26", "notes": "Second extension"},
+                    {"date": "2025-03-31", "eo": "2025-68", "url": "https://www.flgov.com/eog/news/executive-orders/2025-68", "notes": "Third extension"},
+                    {"date": "2025-05-30", "eo": "2025-119", "url": "https://www.flgov.com/eog/news/executive-orders/2025-119", "notes": "Fourth extension (previously untracked)"},
+                    {"date": "2025-07-28", "eo": "2025-150", "url": "https://www.flgov.com/eog/news/executive-orders/2025-150", "notes": "Fifth extension"},
+                    {"date": "2025-09-26", "eo": "2025-191", "url": "https://www.flgov.com/eog/news/executive-orders/2025-191", "notes": "Sixth extension"},
+                    {"date": "2025-11-25", "eo": "2025-242", "url": "https://www.flgov.com/eog/news/executive-orders/2025-242", "notes": "Seventh extension (last known — no 2026 renewal found)"},
+                ],
+            ),
+
+            # --- FL May 2024 North Florida Tornadoes ---
+            # EO 24-94 initial, 9+ extensions, 15 counties
+            # incidentEnd set to 2025-12-23 per Humana carrier data
+            dict(
+                id_str="STATE-2024-004-FL",
+                state="FL",
+                title="Governor DeSantis Emergency — May 2024 North Florida Tornadoes (EO 24-94)",
+                incident_type="Tornado",
+                declaration_date=date(2024, 5, 10),
+                incident_start=date(2024, 5, 10),
+                incident_end=date(2025, 12, 23),
+                renewal_dates_list=[
+                    date(2024, 9, 6), date(2024, 11, 4), date(2025, 3, 3),
+                    date(2025, 5, 1), date(2025, 7, 1), date(2025, 9, 1),
+                    date(2025, 11, 1), date(2026, 1, 1), date(2026, 3, 1),
+                ],
+                counties=["Baker", "Columbia", "Escambia", "Gadsden", "Hamilton",
+                           "Jefferson", "Lafayette", "Leon", "Liberty", "Madison",
+                           "Okaloosa", "Santa Rosa", "Suwannee", "Taylor", "Wakulla"],
+                statewide=False,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2026-34",
+                last_verified="2026-03-27",
+            ),
+
+            # --- FL May 2025 NW Florida Tornadoes ---
+            # EO 25-101, 5 extensions, Holmes County
+            # incidentEnd set to 2026-01-06 per Humana carrier data (last extension expired)
+            dict(
+                id_str="STATE-2025-001-FL",
+                state="FL",
+                title="Governor Emergency — May 2025 NW Florida Tornadoes (EO 25-101)",
+                incident_type="Tornado",
+                declaration_date=date(2025, 5, 11),
+                incident_start=date(2025, 5, 10),
+                incident_end=date(2026, 1, 6),
+                renewal_dates_list=[
+                    date(2025, 7, 10), date(2025, 9, 8), date(2025, 11, 7),
+                    date(2026, 1, 6), date(2026, 3, 6),
+                ],
+                counties=["Holmes"],
+                statewide=False,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2025-101",
+                last_verified="2026-03-27",
+            ),
+
+            # --- FL Lake County Flooding ---
+            # EO 25-213, extended by EO 25-257
+            # incidentEnd set to 2025-12-28 per Humana carrier data
+            dict(
+                id_str="STATE-2025-002-FL",
+                state="FL",
+                title="Governor Emergency — Lake County Flooding (EO 25-213)",
+                incident_type="Flood",
+                declaration_date=date(2025, 10, 29),
+                incident_start=date(2025, 10, 26),
+                incident_end=date(2025, 12, 28),
+                renewal_dates_list=[date(2025, 12, 22)],
+                counties=["Lake"],
+                statewide=False,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2025-213",
+                last_verified="2026-03-27",
+            ),
+
+            # --- FL Illegal Migration ---
+            # EO 23-03, Jan 6 2023, statewide, 19+ renewals, still active (EO 2026-75)
+            dict(
+                id_str="STATE-2023-001-FL",
+                state="FL",
+                title="Governor DeSantis Emergency — Illegal Immigration (EO 23-03)",
+                incident_type="Immigration Emergency",
+                declaration_date=date(2023, 1, 6),
+                incident_start=date(2023, 1, 6),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 3, 24), date(2025, 5, 22), date(2025, 7, 20),
+                    date(2025, 9, 17), date(2025, 11, 25), date(2026, 3, 24),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.flgov.com/eog/news/executive-orders/2026-75",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # NEW YORK — NON-STANDARD GOVERNOR DECLARATIONS
+            # =============================================================
+
+            # --- NY Vaccine Access Disaster ---
+            # EO No. 52, Sep 5 2025, statewide, extended through Apr 19 2026 (EO 52.7)
+            dict(
+                id_str="STATE-2025-001-NY",
+                state="NY",
+                title="Governor Hochul Disaster Declaration — Vaccine Access (EO 52)",
+                incident_type="Healthcare Emergency",
+                declaration_date=date(2025, 9, 5),
+                incident_start=date(2025, 9, 5),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 10, 4), date(2025, 11, 3), date(2025, 12, 3),
+                    date(2026, 1, 2), date(2026, 1, 31), date(2026, 2, 20),
+                    date(2026, 3, 21),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.governor.ny.gov/executive-order/no-527-extending-declaration-disaster-state-new-york-due-federal-actions-related",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # TEXAS — BORDER CRISIS + DROUGHT
+            # =============================================================
+
+            # --- TX Border Crisis ---
+            # Disaster Proclamation May 31 2021, renewed monthly, 66 counties
+            # Latest renewal: Mar 18, 2026
+            dict(
+                id_str="STATE-2021-001-TX",
+                state="TX",
+                title="Governor Abbott Disaster Proclamation — Border Security",
+                incident_type="Immigration Emergency",
+                declaration_date=date(2021, 5, 31),
+                incident_start=date(2021, 5, 31),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1),
+                    date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
+                    date(2026, 3, 18),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://gov.texas.gov/news/post/governor-abbott-renews-border-security-disaster-proclamation-in-march-2026",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # OKLAHOMA — WILDFIRES
+            # =============================================================
+
+            # --- OK Wildfires EO 2026-09 ---
+            # Feb 18 2026, Beaver/Texas/Woodward/Harper counties
+            dict(
+                id_str="STATE-2026-001-OK",
+                state="OK",
+                title="Governor Stitt Emergency — Wildfires (EO 2026-09)",
+                incident_type="Wildfire",
+                declaration_date=date(2026, 2, 18),
+                incident_start=date(2026, 2, 17),
+                incident_end=date(2026, 3, 19),
+                counties=["Beaver", "Harper", "Texas", "Woodward"],
+                statewide=False,
+                official_url="https://www.sos.ok.gov/documents/executive/2170.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # MONTANA — FLOODING + HIGH WIND
+            # =============================================================
+
+            # --- MT Flooding EO 9-2025 ---
+            dict(
+                id_str="STATE-2025-003-MT",
+                state="MT",
+                title="Governor Gianforte Disaster Declaration — Flooding (EO 9-2025)",
+                incident_type="Flood",
+                declaration_date=date(2025, 12, 11),
+                incident_start=date(2025, 12, 8),
+                incident_end=date(2026, 1, 25),
+                counties=["Lincoln", "Sanders", "Flathead"],
+                statewide=False,
+                official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Issues-Executive-Order-Declaring-Flooding-Disaster",
+                last_verified="2026-03-27",
+            ),
+
+            # --- MT Damaging High Wind EO 11-2025 ---
+            dict(
+                id_str="STATE-2025-002-MT",
+                state="MT",
+                title="Governor Gianforte Disaster Declaration — Severe Wind (EO 11-2025)",
+                incident_type="Severe Wind",
+                declaration_date=date(2025, 12, 18),
+                incident_start=date(2025, 12, 17),
+                incident_end=date(2026, 2, 1),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://news.mt.gov/Governors-Office/Governor-Gianforte-Issues-Executive-Order-Declaring-Wind-Disaster",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # GEORGIA — SPALDING COUNTY WATER SUPPLY
+            # Fuel spill at Hartsfield-Jackson contaminated Flint River intake
+            # Advisory lifted same night after testing cleared supply
+            # =============================================================
+
+            dict(
+                id_str="STATE-2026-003-GA",
+                state="GA",
+                title="Governor Kemp Emergency — Spalding County Water Supply (EO 01.30.26.02)",
+                incident_type="Infrastructure Emergency",
+                declaration_date=date(2026, 1, 30),
+                incident_start=date(2026, 1, 30),
+                incident_end=date(2026, 2, 6),
+                counties=["Spalding"],
+                statewide=False,
+                official_url="https://gov.georgia.gov/document/2026-executive-order/01302602/download",
+                last_verified="2026-03-27",
+            ),
 
-        # --- AZ Gila County Flooding ---
-        # Governor Hobbs, Sep 27 + Oct 13, 2025
-        rec = build_record(
-            id_str="STATE-2025-001-AZ",
-            source="STATE", state="AZ",
-            title="Governor Hobbs Emergency — Gila County Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 9, 27),
-            incident_start=date(2025, 9, 27),
-            incident_end=None,
-            renewal_dates_list=[date(2025, 10, 13)],
-            counties=["Gila", "Maricopa", "Mohave"],
-            statewide=False,
-            official_url="https://azgovernor.gov/office-arizona-governor/news/2025/09/governor-katie-hobbs-declares-state-emergency-gila-county",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # =============================================================
+            # NEBRASKA — POWER DEMANDS
+            # =============================================================
 
-        # --- CO Western Colorado Flooding (EO D 2025 021) ---
-        # Governor Polis, Oct 12, 2025
-        rec = build_record(
-            id_str="STATE-2025-001-CO",
-            source="STATE", state="CO",
-            title="Governor Polis Emergency (EO D 2025 021) — Western Colorado Flooding",
-            incident_type="Flood",
-            declaration_date=date(2025, 10, 12),
-            incident_start=date(2025, 10, 10),
-            incident_end=date(2025, 10, 14),
-            renewal_dates_list=None,
-            counties=["Archuleta", "La Plata", "Mineral"],
-            statewide=False,
-            official_url="https://governorsoffice.colorado.gov/governor/news/governor-polis-verbally-declares-disaster-emergency-flooding-western-colorado",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2026-001-NE",
+                state="NE",
+                title="Governor Pillen Emergency — Power Demands (EO 26-01)",
+                incident_type="Power Emergency",
+                declaration_date=date(2026, 1, 23),
+                incident_start=date(2026, 1, 23),
+                incident_end=date(2026, 2, 27),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.nebraska.gov/sites/default/files/doc/press/EO-26-01.pdf",
+                last_verified="2026-03-27",
+            ),
 
-        # --- DC Potomac Interceptor Collapse (Mayor's Order 2026-028) ---
-        # Mayor Bowser, Feb 18, 2026. Pipe collapsed Jan 19.
-        rec = build_record(
-            id_str="STATE-2026-002-DC",
-            source="STATE", state="DC",
-            title="Mayor Bowser Public Emergency (Order 2026-028) — Potomac Sewer Collapse",
-            incident_type="Infrastructure Emergency",
-            declaration_date=date(2026, 2, 18),
-            incident_start=date(2026, 1, 19),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Statewide"],
-            statewide=True,
-            official_url="https://mayor.dc.gov/release/mayor-bowser-requests-federal-support-region-continues-respond-potomac-interceptor-break",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # =============================================================
+            # UTAH — WILDFIRES (single EO covers all 3 fires)
+            # =============================================================
 
-        # --- KS Severe Storms, Straight-line Winds, Flooding (Jul 2025) ---
-        # Governor Kelly, Jul 17-22, 2025. Federal disaster declaration approved.
-        rec = build_record(
-            id_str="STATE-2025-001-KS",
-            source="STATE", state="KS",
-            title="Governor Kelly Emergency — July 2025 Severe Storms and Flooding",
-            incident_type="Severe Storm",
-            declaration_date=date(2025, 7, 17),
-            incident_start=date(2025, 7, 17),
-            incident_end=date(2025, 7, 22),
-            renewal_dates_list=None,
-            counties=["Barton", "Comanche", "Edwards", "Ford", "Hodgeman", "Johnson",
-                       "Logan", "Marion", "Morris", "Ottawa", "Pawnee", "Rawlins",
-                       "Saline", "Stevens", "Sumner", "Wyandotte"],
-            statewide=False,
-            official_url="https://www.governor.ks.gov/Home/Components/News/News/696/55",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            dict(
+                id_str="STATE-2025-001-UT",
+                state="UT",
+                title="Governor Cox Emergency — 2025 Wildfires (EO 2025-08)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 31),
+                incident_start=date(2025, 7, 1),
+                incident_end=date(2025, 8, 30),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.utah.gov/press/gov-cox-declares-state-of-emergency-as-wildfires-intensify/",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # LOUISIANA — HURRICANE IDA (still active 2026!)
+            # =============================================================
+
+            dict(
+                id_str="STATE-2021-001-LA",
+                state="LA",
+                title="Governor Emergency — Hurricane Ida (JBE 2021-165, latest renewal JML 26-023)",
+                incident_type="Hurricane",
+                declaration_date=date(2021, 8, 26),
+                incident_start=date(2021, 8, 26),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1),
+                    date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
+                    date(2026, 3, 1),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.doa.la.gov/doa/osr/executive-orders/",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # OREGON — ADDITIONAL DECLARATIONS
+            # =============================================================
+
+            # --- OR Alder Springs Fire ---
+            # EO 25-07, Jun 16 2025, Jefferson/Deschutes (Conflagration Act)
+            dict(
+                id_str="STATE-2025-010-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Alder Springs Fire (EO 25-07)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 6, 16),
+                incident_start=date(2025, 6, 16),
+                incident_end=None,
+                counties=["Jefferson", "Deschutes"],
+                statewide=False,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-invokes-conflagration-act-for-the-alder-springs-fire",
+                last_verified="2026-03-27",
+            ),
+
+            # --- OR Rowena Fire ---
+            # EO 25-08, Jun 21 2025, Wasco County
+            dict(
+                id_str="STATE-2025-011-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Rowena Fire (EO 25-08)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 6, 21),
+                incident_start=date(2025, 6, 11),
+                incident_end=None,
+                counties=["Wasco"],
+                statewide=False,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-due-to-rowena-fire",
+                last_verified="2026-03-27",
+            ),
+
+            # --- OR Statewide Wildfire Emergency ---
+            # EO 25-16, Jul 16 2025, statewide, through Dec 2025
+            dict(
+                id_str="STATE-2025-008-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Statewide Wildfire Threat (EO 25-16)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 7, 16),
+                incident_start=date(2025, 7, 16),
+                incident_end=date(2025, 12, 31),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-state-of-emergency-due-to-imminent-threat-of-wildfire",
+                last_verified="2026-03-27",
+            ),
+
+            # --- OR Homelessness Emergency ---
+            # EO 25-01 (originally 23-02), statewide, through Jan 10 2027
+            dict(
+                id_str="STATE-2023-001-OR",
+                state="OR",
+                title="Governor Kotek Emergency — Homelessness (EO 25-01)",
+                incident_type="Homelessness Emergency",
+                declaration_date=date(2023, 1, 10),
+                incident_start=date(2023, 1, 10),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2024, 1, 9), date(2025, 1, 9), date(2026, 1, 9),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.oregon.gov/oem/pages/housing-emergency-executive-orders.aspx",
+                last_verified="2026-03-27",
+            ),
+
+            # --- OR December 2025 Severe Storms ---
+            # EO 25-32, Dec 30 2025, 25 counties
+            dict(
+                id_str="STATE-2025-009-OR",
+                state="OR",
+                title="Governor Kotek Emergency — December 2025 Severe Storms (EO 25-32)",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 30),
+                incident_start=date(2025, 12, 15),
+                incident_end=date(2025, 12, 21),
+                counties=["Clackamas", "Clatsop", "Coos", "Curry", "Douglas",
+                           "Hood River", "Jackson", "Klamath", "Lane", "Lincoln",
+                           "Linn", "Marion", "Multnomah", "Polk", "Tillamook",
+                           "Umatilla", "Union", "Wallowa", "Washington", "Yamhill"],
+                statewide=False,
+                official_url="https://www.oregon.gov/gov/eo/eo-25-32.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # KENTUCKY — UPS PLANE CRASH
+            # =============================================================
+
+            dict(
+                id_str="STATE-2025-001-KY",
+                state="KY",
+                title="Governor Beshear Emergency — Louisville UPS Plane Crash (EO 2025-758)",
+                incident_type="Plane Crash",
+                declaration_date=date(2025, 11, 5),
+                incident_start=date(2025, 11, 4),
+                incident_end=date(2025, 11, 4),
+                counties=["Jefferson"],
+                statewide=False,
+                official_url="https://governor.ky.gov/Documents/Executive%20Order%202025-758%20-%20State%20of%20Emergency%20Related%20to%20Louisville%20Plane%20Crash.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # MINNESOTA — WILDFIRES
+            # =============================================================
+
+            # --- MN Munger Shaw / Camp House Fires ---
+            # EO 25-05, May 20 2025, Saint Louis County
+            dict(
+                id_str="STATE-2025-001-MN",
+                state="MN",
+                title="Governor Walz Peacetime Emergency — NE Minnesota Wildfires (EO 25-05)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 5, 20),
+                incident_start=date(2025, 5, 12),
+                incident_end=None,
+                counties=["Saint Louis"],
+                statewide=False,
+                official_url="https://mn.gov/governor/newsroom/press-releases/?id=1055-685281",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # LOUISIANA — TALLULAH WATER SYSTEM
+            # =============================================================
+
+            # EO JML 25-054, renewed monthly through JML 26-027
+            dict(
+                id_str="STATE-2025-002-LA",
+                state="LA",
+                title="Governor Landry Emergency — Tallulah Water System (JML 25-054)",
+                incident_type="Infrastructure Emergency",
+                declaration_date=date(2025, 2, 13),
+                incident_start=date(2025, 2, 13),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 3, 15), date(2025, 4, 14), date(2025, 5, 14),
+                    date(2025, 6, 13), date(2025, 7, 13), date(2025, 8, 12),
+                    date(2025, 9, 11), date(2025, 10, 11), date(2025, 11, 10),
+                    date(2025, 12, 10), date(2026, 1, 9), date(2026, 2, 8),
+                ],
+                counties=["Madison"],
+                statewide=False,
+                official_url="https://gov.louisiana.gov/assets/2026-Executive-Orders/JML-Exective-Order-26-027.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # MASSACHUSETTS — FEB 2026 BLIZZARD
+            # =============================================================
+
+            dict(winter_storm,
+                id_str="STATE-2026-002-MA",
+                state="MA",
+                title="Governor Healey Emergency — February 2026 Blizzard",
+                declaration_date=date(2026, 2, 22),
+                incident_start=date(2026, 2, 22),
+                incident_end=date(2026, 2, 24),
+                official_url="https://www.mass.gov/news/governor-healey-declares-emergency-activates-national-guard-ahead-of-strong-winter-storm",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # ALASKA — WINDSTORM + WINTER STORM + POWER OUTAGE
+            # =============================================================
+
+            # --- AK Mat-SU Windstorm ---
+            dict(
+                id_str="STATE-2025-001-AK",
+                state="AK",
+                title="Governor Dunleavy Disaster Declaration — Mat-Su Windstorm",
+                incident_type="Severe Wind",
+                declaration_date=date(2025, 12, 10),
+                incident_start=date(2025, 12, 9),
+                incident_end=date(2026, 1, 9),
+                counties=["Matanuska-Susitna"],
+                statewide=False,
+                official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2025.12.10_Press%20Release%20-%20Governor%20Dunleavy%20Declares%20December%202025%20Mat-Su%20Windstorm%20a%20Disaster.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- AK Napaskiak Power Outage ---
+            # Dec 30 2025 declaration, Bethel Census Area
+            dict(
+                id_str="STATE-2025-002-AK",
+                state="AK",
+                title="Governor Dunleavy Disaster Declaration — Napaskiak Power Outage",
+                incident_type="Power Emergency",
+                declaration_date=date(2025, 12, 30),
+                incident_start=date(2025, 12, 6),
+                incident_end=date(2026, 2, 4),
+                counties=["Bethel"],
+                statewide=False,
+                official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2025.01.05_Press%20Release%20-%20Governor%20Dunleavy%20Declares%202025%20Napaskiak%20Power%20Outage.pdf",
+                last_verified="2026-03-27",
+            ),
 
-        # --- NC Sam Davis Road Fire (under EO 12 + FEMA FM-5580) ---
-        # Governor Stein EO 12 covers WNC wildfires including Swain County
-        rec = build_record(
-            id_str="STATE-2025-001-NC",
-            source="STATE", state="NC",
-            title="Governor Stein Emergency (EO 12) — WNC Wildfires (Sam Davis Road Fire)",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 3, 26),
-            incident_start=date(2025, 3, 26),
-            incident_end=None,
-            renewal_dates_list=[date(2025, 4, 26)],
-            counties=["Avery", "Buncombe", "Burke", "Caldwell", "Cherokee", "Clay",
-                       "Graham", "Haywood", "Henderson", "Jackson", "Macon", "Madison",
-                       "McDowell", "Mitchell", "Polk", "Rutherford", "Swain", "Transylvania",
-                       "Watauga", "Yancey"],
-            statewide=False,
-            official_url="https://governor.nc.gov/executive-order-no-12-declaration-state-emergency-0",
-            confidence="curated",
-            last_verified="2026-03-27",
-        )
-        if rec:
-            curated.append(rec)
+            # --- AK Southeast Winter Storm ---
+            dict(
+                id_str="STATE-2026-001-AK",
+                state="AK",
+                title="Governor Dunleavy Disaster Declaration — Jan 2026 Southeast Winter Storm",
+                incident_type="Severe Winter Storm",
+                declaration_date=date(2026, 1, 10),
+                incident_start=date(2026, 1, 6),
+                incident_end=date(2026, 2, 9),
+                counties=["Hoonah-Angoon", "Juneau"],
+                statewide=False,
+                official_url="https://ready.alaska.gov/Documents/PIO/PressReleases/2026.01.10_Press%20Release%20-%20Governor%20Dunleavy%20Declares%202026%20Jan%20Southeast%20Winter%20Storm.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- TX Flooding / Hill Country ---
+            # Jul 4 2025, 30 counties, renewed through Mar 2026
+            dict(
+                id_str="STATE-2025-001-TX",
+                state="TX",
+                title="Governor Abbott Disaster Proclamation — Hill Country Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 7, 4),
+                incident_start=date(2025, 7, 2),
+                incident_end=None,
+                renewal_dates_list=[date(2025, 7, 22), date(2026, 3, 1)],
+                counties=["Bandera", "Bexar", "Burnet", "Caldwell", "Coke", "Comal",
+                           "Concho", "Edwards", "Gillespie", "Guadalupe", "Hamilton",
+                           "Kendall", "Kerr", "Kimble", "Kinney", "Lampasas", "Llano",
+                           "Mason", "Maverick", "McCulloch", "Menard", "Real", "Reeves",
+                           "San Saba", "Schleicher", "Sutton", "Tom Green", "Travis",
+                           "Uvalde", "Williamson"],
+                statewide=False,
+                official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-flooding-disaster-proclamation-in-march-2026",
+                last_verified="2026-03-27",
+            ),
+
+            # --- TX Wildfires / Fire Weather ---
+            # Aug 12 2025, statewide, renewed through Mar 2026
+            dict(
+                id_str="STATE-2025-002-TX",
+                state="TX",
+                title="Governor Abbott Disaster Proclamation — Fire Weather Conditions",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 8, 12),
+                incident_start=date(2025, 8, 10),
+                incident_end=None,
+                renewal_dates_list=[date(2026, 3, 9)],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-fire-weather-conditions-disaster-proclamation-in-march-2026",
+                last_verified="2026-03-27",
+            ),
+
+            # --- TX Drought ---
+            # Governor Abbott disaster proclamation, renewed monthly, 80+ counties
+            dict(
+                id_str="STATE-2024-001-TX",
+                state="TX",
+                title="Governor Abbott Disaster Proclamation — Drought",
+                incident_type="Drought",
+                declaration_date=date(2024, 7, 1),
+                incident_start=date(2024, 7, 1),
+                incident_end=None,
+                renewal_dates_list=[
+                    date(2025, 9, 18), date(2025, 10, 18), date(2025, 11, 18),
+                    date(2025, 12, 18), date(2026, 1, 18), date(2026, 2, 18),
+                    date(2026, 3, 18),
+                ],
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://gov.texas.gov/news/post/governor-abbott-amends-renews-drought-disaster-proclamation-in-march-2026",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # NEW MEXICO — CRIME, FLOODS, FIRE, INFRASTRUCTURE
+            # =============================================================
+
+            # --- NM Española Crime Emergency ---
+            # EO 2025-358, Aug 13 2025, Rio Arriba County + Pueblos
+            dict(
+                id_str="STATE-2025-003-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Española Crime (EO 2025-358)",
+                incident_type="Crime Emergency",
+                declaration_date=date(2025, 8, 13),
+                incident_start=date(2025, 8, 13),
+                incident_end=None,
+                counties=["Rio Arriba"],
+                statewide=False,
+                official_url="https://www.governor.state.nm.us/2025/08/13/governor-declares-emergency-in-espanola-area-due-to-crime/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM Albuquerque Crime Emergency ---
+            # EO 2025-080, Apr 8 2025, Albuquerque/Bernalillo County
+            dict(
+                id_str="STATE-2025-004-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Albuquerque Crime (EO 2025-080)",
+                incident_type="Crime Emergency",
+                declaration_date=date(2025, 4, 8),
+                incident_start=date(2025, 4, 8),
+                incident_end=None,
+                counties=["Bernalillo"],
+                statewide=False,
+                official_url="https://www.governor.state.nm.us/wp-content/uploads/2025/04/Executive-Order-2025-080-1.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM Cotton/Desert Willow Complex Fire ---
+            # EO 2025-247, Jun 21 2025, Valencia County
+            dict(
+                id_str="STATE-2025-005-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Cotton Fire / Desert Willow Complex (EO 2025-247)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 6, 21),
+                incident_start=date(2025, 6, 21),
+                incident_end=None,
+                counties=["Valencia"],
+                statewide=False,
+                official_url="https://www.governor.state.nm.us/2025/06/21/governor-secures-resources-to-support-cotton-fire-response-additional-firefighting-crews-air-support-and-shelter-services-mobilized/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM Lincoln County Flood ---
+            # EO 2025-248, Jun 26 2025, Lincoln County
+            dict(
+                id_str="STATE-2025-006-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Lincoln County Flooding (EO 2025-248)",
+                incident_type="Flood",
+                declaration_date=date(2025, 6, 26),
+                incident_start=date(2025, 6, 23),
+                incident_end=None,
+                counties=["Lincoln"],
+                statewide=False,
+                official_url="https://www.dhsem.nm.gov/governor-signs-emergency-declarations-for-lincoln-and-chaves-county/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM Dona Ana County Flood ---
+            # EO 2025-333, Jul 25 2025, Dona Ana County
+            dict(
+                id_str="STATE-2025-007-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Dona Ana County Flooding (EO 2025-333)",
+                incident_type="Flood",
+                declaration_date=date(2025, 7, 25),
+                incident_start=date(2025, 7, 22),
+                incident_end=None,
+                counties=["Dona Ana"],
+                statewide=False,
+                official_url="https://www.governor.state.nm.us/2025/07/25/governor-signs-emergency-order-for-dona-ana-county-flooding/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM Torrance County Well Outages ---
+            # EO 2025-373, Oct 2025, Torrance County
+            dict(
+                id_str="STATE-2025-008-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency — Torrance County Water System (EO 2025-373)",
+                incident_type="Infrastructure Emergency",
+                declaration_date=date(2025, 10, 15),
+                incident_start=date(2024, 12, 1),
+                incident_end=None,
+                counties=["Torrance"],
+                statewide=False,
+                official_url="https://www.dhsem.nm.gov/state-to-provide-emergency-water-to-torrance-county-community/",
+                last_verified="2026-03-27",
+            ),
+
+            # =============================================================
+            # PHASE 3 SESSION 2 — CARRIER CROSS-REFERENCE GAP FILLS
+            # Added 2026-03-27 from four-carrier cross-reference analysis
+            # =============================================================
+
+            # --- CALIFORNIA: Pack Fire, Mono County ---
+            # Governor Newsom proclamation Dec 9, 2025
+            dict(
+                id_str="STATE-2025-018-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — Pack Fire (Mono County)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 12, 9),
+                incident_start=date(2025, 11, 13),
+                incident_end=date(2025, 12, 3),
+                counties=["Mono"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/09/governor-newsom-proclaims-state-of-emergency-in-mono-county-for-pack-fire/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: July Tsunami, Del Norte County ---
+            # Part of Dec 23, 2025 omnibus proclamation (6 events)
+            dict(
+                id_str="STATE-2025-019-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — July 2025 Tsunami (Del Norte County)",
+                incident_type="Tsunami",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 7, 29),
+                incident_end=date(2025, 7, 30),
+                counties=["Del Norte"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: August Storms/Mudslides, Sierra County ---
+            dict(
+                id_str="STATE-2025-020-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — August 2025 Storms and Mudslides (Sierra County)",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 8, 23),
+                incident_end=date(2025, 8, 27),
+                counties=["Sierra"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: August Monsoon Storms, Imperial County ---
+            dict(
+                id_str="STATE-2025-021-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — August 2025 Monsoon Storms (Imperial County)",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 8, 25),
+                incident_end=date(2025, 8, 25),
+                counties=["Imperial"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
 
-        # --- SC Covington Drive Fire (EO 2025-10 + FEMA FM-5554) ---
-        # Governor McMaster, Mar 2, 2025
-        rec = build_record(
-            id_str="STATE-2025-001-SC",
-            source="STATE", state="SC",
-            title="Governor McMaster Emergency (EO 2025-10) — Covington Drive Wildfire",
-            incident_type="Wildfire",
-            declaration_date=date(2025, 3, 2),
-            incident_start=date(2025, 3, 1),
-            incident_end=None,
-            renewal_dates_list=None,
-            counties=["Horry"],
-            statewide=False,
-            official_url="https://governor.sc.gov/news/2025-03/governor-henry-mcmaster-declares-state-emergency-due-wildfires",
-            confidence="curated",
-            last_verified="2026-03-27",
+            # --- CALIFORNIA: Gifford Fire, SLO + Santa Barbara ---
+            dict(
+                id_str="STATE-2025-022-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — Gifford Fire (SLO, Santa Barbara)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 8, 1),
+                incident_end=date(2025, 9, 28),
+                counties=["San Luis Obispo", "Santa Barbara"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: January Windstorm, San Bernardino ---
+            dict(
+                id_str="STATE-2025-023-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — January 2025 Windstorm (San Bernardino)",
+                incident_type="Severe Wind",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 1, 7),
+                incident_end=date(2025, 1, 9),
+                counties=["San Bernardino"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: Mid-September Storm, Imperial + San Bernardino ---
+            dict(
+                id_str="STATE-2025-024-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — September 2025 Storm (Imperial, San Bernardino)",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 23),
+                incident_start=date(2025, 9, 18),
+                incident_end=None,
+                counties=["Imperial", "San Bernardino"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/23/governor-newsom-declares-states-of-emergency-related-to-multiple-severe-weather-events-in-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CALIFORNIA: Late December Storms, 6 counties ---
+            dict(
+                id_str="STATE-2025-025-CA",
+                state="CA",
+                title="Governor Newsom Proclamation — Late December 2025 Storms (6 counties)",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 12, 24),
+                incident_start=date(2025, 12, 23),
+                incident_end=None,
+                counties=["Los Angeles", "Orange", "Riverside", "San Bernardino", "San Diego", "Shasta"],
+                statewide=False,
+                official_url="https://www.gov.ca.gov/2025/12/24/governor-newsom-proclaims-state-of-emergency-to-support-response-in-multiple-counties-due-to-late-december-storms/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NJ EO 409: Dec 26, 2025 Winter Storm ---
+            dict(winter_storm,
+                id_str="STATE-2025-001-NJ",
+                state="NJ",
+                title="NJ Acting Governor Way Emergency (EO 409) — December 2025 Winter Storm",
+                declaration_date=date(2025, 12, 26),
+                incident_start=date(2025, 12, 26),
+                incident_end=date(2025, 12, 30),
+                official_url="https://nj.gov/infobank/eo/056murphy/pdf/EO-409.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NJ EO 392: Jul 14, 2025 Flash Flooding ---
+            dict(
+                id_str="STATE-2025-002-NJ",
+                state="NJ",
+                title="Governor Murphy Emergency (EO 392) — July 2025 Flash Flooding",
+                incident_type="Flash Flooding",
+                declaration_date=date(2025, 7, 14),
+                incident_start=date(2025, 7, 14),
+                incident_end=date(2025, 8, 8),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://nj.gov/infobank/eo/056murphy/pdf/EO-392.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NJ EO 394: Jul 31, 2025 Flash Flooding ---
+            dict(
+                id_str="STATE-2025-003-NJ",
+                state="NJ",
+                title="NJ Acting Governor Way Emergency (EO 394) — July 2025 Flash Flooding",
+                incident_type="Flash Flooding",
+                declaration_date=date(2025, 7, 31),
+                incident_start=date(2025, 7, 31),
+                incident_end=date(2025, 8, 8),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://www.nj.gov/governor/news/news/562025/approved/20250731a.shtml",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NJ EO 14: Feb 21, 2026 Nor'easter ---
+            dict(winter_storm,
+                id_str="STATE-2026-002-NJ",
+                state="NJ",
+                title="Governor Sherrill Emergency (EO 14) — February 2026 Nor'easter",
+                declaration_date=date(2026, 2, 21),
+                incident_start=date(2026, 2, 22),
+                incident_end=date(2026, 2, 25),
+                official_url="https://nj.gov/infobank/eo/057sherrill/pdf/EO-14.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- DE Feb 2026 Nor'easter ---
+            dict(winter_storm,
+                id_str="STATE-2026-002-DE",
+                state="DE",
+                title="Governor Meyer Emergency — February 2026 Nor'easter",
+                declaration_date=date(2026, 2, 22),
+                incident_start=date(2026, 2, 22),
+                incident_end=date(2026, 2, 24),
+                official_url="https://governor.delaware.gov/state-of-emergency/declaration-of-a-state-of-emergency-due-to-a-severe-winter-storm/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- WI EO 272: Aug 2025 Flooding ---
+            dict(
+                id_str="STATE-2025-001-WI",
+                state="WI",
+                title="Governor Evers Emergency (EO 272) — August 2025 Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 8, 11),
+                incident_start=date(2025, 8, 9),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://evers.wi.gov/Documents/EO/EO272-EmergencyOrderFlooding.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- PA Feb 22 Blizzard ---
+            dict(winter_storm,
+                id_str="STATE-2026-002-PA",
+                state="PA",
+                title="Governor Shapiro Disaster Emergency — February 2026 Winter Storm",
+                declaration_date=date(2026, 2, 22),
+                incident_start=date(2026, 2, 22),
+                incident_end=None,
+                official_url="https://www.pa.gov/content/dam/copapwp-pagov/en/pema/documents/governor-proclamations/2026.2.22%20disaster%20emergency%20proclamation%20winter%20weather.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NM EO 2025-362: Mora County Flooding ---
+            dict(
+                id_str="STATE-2025-009-NM",
+                state="NM",
+                title="Governor Lujan Grisham Emergency (EO 2025-362) — Mora County Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 9, 2),
+                incident_start=date(2025, 8, 28),
+                incident_end=None,
+                counties=["Mora"],
+                statewide=False,
+                official_url="https://www.governor.state.nm.us/2025/09/02/governor-signs-emergency-order-for-mora-county-flooding/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- HI Lahaina Wildfires (ongoing since Aug 2023) ---
+            # 27th Proclamation (Nov 2025), 28th (Jan 2026). Separate from STATE-2025-001-HI.
+            dict(
+                id_str="STATE-2023-001-HI",
+                state="HI",
+                title="Governor Green Emergency — Lahaina Wildfires (ongoing since Aug 2023)",
+                incident_type="Wildfire",
+                declaration_date=date(2023, 8, 9),
+                incident_start=date(2023, 8, 8),
+                incident_end=None,
+                renewal_dates_list=[date(2025, 11, 7), date(2026, 1, 9), date(2026, 3, 6)],
+                counties=["Maui"],
+                statewide=True,
+                official_url="https://governor.hawaii.gov/wp-content/uploads/2025/11/2511016.pdf",
+                last_verified="2026-03-27",
+            ),
+
+            # --- PR records REMOVED 2026-03-27 ---
+            # CPC does not sell plans in Puerto Rico. PR declarations (OE-2025-004 landslides,
+            # OE-2025-022 April rains) are valid DSTs but not relevant to our agents.
+
+            # =============================================================
+            # PHASE 3 SESSION 2b — REMAINING CARRIER GAPS (from cross-ref)
+            # =============================================================
+
+            # --- OR Drought (5 EOs, 8 counties) ---
+            # Governor Kotek, July-Sep 2025, rolling drought declarations
+            dict(
+                id_str="STATE-2025-008-OR",
+                state="OR",
+                title="Governor Kotek Drought Emergency — Multiple Counties (EO 25-12 through 25-23)",
+                incident_type="Drought",
+                declaration_date=date(2025, 7, 15),
+                incident_start=date(2025, 6, 1),
+                incident_end=None,
+                renewal_dates_list=[date(2025, 8, 4), date(2025, 9, 29)],
+                counties=["Baker", "Coos", "Douglas", "Jefferson", "Lincoln", "Morrow", "Union", "Wheeler"],
+                statewide=False,
+                official_url="https://apps.oregon.gov/oregon-newsroom/OR/GOV/Posts/Post/governor-kotek-declares-drought-emergency-in-baker-county",
+                last_verified="2026-03-27",
+            ),
+
+            # --- AR Severe Storms, Tornadoes, Flooding (DR 25-04) ---
+            # Governor Sanders, April 2, 2025
+            dict(
+                id_str="STATE-2025-001-AR",
+                state="AR",
+                title="Governor Sanders Emergency (DR 25-04) — April 2025 Storms and Tornadoes",
+                incident_type="Tornado",
+                declaration_date=date(2025, 4, 2),
+                incident_start=date(2025, 4, 2),
+                incident_end=date(2025, 4, 16),
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://governor.arkansas.gov/news_post/sanders-declares-an-emergency-for-severe-storms-tornadoes-and-flooding-on-or-about-april-2-2025/",
+                last_verified="2026-03-27",
+            ),
+
+            # --- AZ Gila County Flooding ---
+            # Governor Hobbs, Sep 27 + Oct 13, 2025
+            dict(
+                id_str="STATE-2025-001-AZ",
+                state="AZ",
+                title="Governor Hobbs Emergency — Gila County Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 9, 27),
+                incident_start=date(2025, 9, 27),
+                incident_end=None,
+                renewal_dates_list=[date(2025, 10, 13)],
+                counties=["Gila", "Maricopa", "Mohave"],
+                statewide=False,
+                official_url="https://azgovernor.gov/office-arizona-governor/news/2025/09/governor-katie-hobbs-declares-state-emergency-gila-county",
+                last_verified="2026-03-27",
+            ),
+
+            # --- CO Western Colorado Flooding (EO D 2025 021) ---
+            # Governor Polis, Oct 12, 2025
+            dict(
+                id_str="STATE-2025-001-CO",
+                state="CO",
+                title="Governor Polis Emergency (EO D 2025 021) — Western Colorado Flooding",
+                incident_type="Flood",
+                declaration_date=date(2025, 10, 12),
+                incident_start=date(2025, 10, 10),
+                incident_end=date(2025, 10, 14),
+                counties=["Archuleta", "La Plata", "Mineral"],
+                statewide=False,
+                official_url="https://governorsoffice.colorado.gov/governor/news/governor-polis-verbally-declares-disaster-emergency-flooding-western-colorado",
+                last_verified="2026-03-27",
+            ),
+
+            # --- DC Potomac Interceptor Collapse (Mayor's Order 2026-028) ---
+            # Mayor Bowser, Feb 18, 2026. Pipe collapsed Jan 19.
+            dict(
+                id_str="STATE-2026-002-DC",
+                state="DC",
+                title="Mayor Bowser Public Emergency (Order 2026-028) — Potomac Sewer Collapse",
+                incident_type="Infrastructure Emergency",
+                declaration_date=date(2026, 2, 18),
+                incident_start=date(2026, 1, 19),
+                incident_end=None,
+                counties=STATEWIDE,
+                statewide=True,
+                official_url="https://mayor.dc.gov/release/mayor-bowser-requests-federal-support-region-continues-respond-potomac-interceptor-break",
+                last_verified="2026-03-27",
+            ),
+
+            # --- KS Severe Storms, Straight-line Winds, Flooding (Jul 2025) ---
+            # Governor Kelly, Jul 17-22, 2025. Federal disaster declaration approved.
+            dict(
+                id_str="STATE-2025-001-KS",
+                state="KS",
+                title="Governor Kelly Emergency — July 2025 Severe Storms and Flooding",
+                incident_type="Severe Storm",
+                declaration_date=date(2025, 7, 17),
+                incident_start=date(2025, 7, 17),
+                incident_end=date(2025, 7, 22),
+                counties=["Barton", "Comanche", "Edwards", "Ford", "Hodgeman", "Johnson",
+                           "Logan", "Marion", "Morris", "Ottawa", "Pawnee", "Rawlins",
+                           "Saline", "Stevens", "Sumner", "Wyandotte"],
+                statewide=False,
+                official_url="https://www.governor.ks.gov/Home/Components/News/News/696/55",
+                last_verified="2026-03-27",
+            ),
+
+            # --- NC Sam Davis Road Fire (under EO 12 + FEMA FM-5580) ---
+            # Governor Stein EO 12 covers WNC wildfires including Swain County
+            dict(
+                id_str="STATE-2025-001-NC",
+                state="NC",
+                title="Governor Stein Emergency (EO 12) — WNC Wildfires (Sam Davis Road Fire)",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 3, 26),
+                incident_start=date(2025, 3, 26),
+                incident_end=None,
+                renewal_dates_list=[date(2025, 4, 26)],
+                counties=["Avery", "Buncombe", "Burke", "Caldwell", "Cherokee", "Clay",
+                           "Graham", "Haywood", "Henderson", "Jackson", "Macon", "Madison",
+                           "McDowell", "Mitchell", "Polk", "Rutherford", "Swain", "Transylvania",
+                           "Watauga", "Yancey"],
+                statewide=False,
+                official_url="https://governor.nc.gov/executive-order-no-12-declaration-state-emergency-0",
+                last_verified="2026-03-27",
+            ),
+
+            # --- SC Covington Drive Fire (EO 2025-10 + FEMA FM-5554) ---
+            # Governor McMaster, Mar 2, 2025
+            dict(
+                id_str="STATE-2025-001-SC",
+                state="SC",
+                title="Governor McMaster Emergency (EO 2025-10) — Covington Drive Wildfire",
+                incident_type="Wildfire",
+                declaration_date=date(2025, 3, 2),
+                incident_start=date(2025, 3, 1),
+                incident_end=None,
+                counties=["Horry"],
+                statewide=False,
+                official_url="https://governor.sc.gov/news/2025-03/governor-henry-mcmaster-declares-state-emergency-due-wildfires",
+                last_verified="2026-03-27",
+            ),
         )
-        if rec:
-            curated.append(rec)
-
-        return curated
+        defaults = {"source": "STATE", "confidence": "curated", "renewal_dates_list": None}
+        return [rec for row in rows if (rec := build_record(**{**defaults, **row})) is not None]
 
 
 # =========================================================================
@@ -4471,38 +4369,63 @@ class FEMACollector:
 
         return self.records
 
-    def _fetch_all(self) -> List[Dict]:
-        """Paginate through the FEMA API with 24-month lookback."""
-        cutoff = (date.today() - timedelta(days=LOOKBACK_MONTHS * 31)).isoformat()
-        all_records = []
-        skip = 0
+    def _fetch_page(self, params: Dict) -> Tuple[List[Dict], Dict]:
+        """GET one FEMA API page. Returns (rows, full decoded response)."""
+        resp = _SESSION.get(self.FEMA_API_BASE, params=params, timeout=30)
+        if resp.status_code != 200:
+            raise RuntimeError(f"FEMA API returned HTTP {resp.status_code}")
+        # Pause only when the API signals we're near its rate limit; 429s are
+        # already retried with backoff (honouring Retry-After) by _SESSION
+        remaining = resp.headers.get("X-RateLimit-Remaining", "")
+        if remaining.isdigit() and int(remaining) < 5:
+            time.sleep(1.0)
+        data = json_loads(resp.content)
+        return data.get("DisasterDeclarationsSummaries", []), data
+
+    def _fetch_all(self) -> Iterator[Dict]:
+        """
+        Paginate through the FEMA API with 24-month lookback, yielding county-level
+        rows page by page so _consolidate folds each page in before the next is
+        fetched (no list of every row across all pages).
 
-        while True:
-            params = {
-                "$filter": f"declarationDate ge '{cutoff}'",
-                "$orderby": "declarationDate desc",
-                "$top": str(self.PAGE_SIZE),
-                "$skip": str(skip),
-            }
-            resp = requests.get(
-                self.FEMA_API_BASE, params=params, timeout=30,
-                headers={"User-Agent": USER_AGENT}
-            )
-            if resp.status_code != 200:
-                raise RuntimeError(f"FEMA API returned HTTP {resp.status_code}")
+        The first page asks for the total row count ($count=true); the remaining
+        pages are then fetched concurrently and yielded in offset order. Falls
+        back to serial paging if the count is missing.
+        """
+        cutoff = (date.today() - timedelta(days=LOOKBACK_MONTHS * 31)).isoformat()
+        params = {
+            "$filter": f"declarationDate ge '{cutoff}'",
+            "$orderby": "declarationDate desc",
+            "$top": str(self.PAGE_SIZE),
+        }
 
-            data = resp.json()
-            records = data.get("DisasterDeclarationsSummaries", [])
-            all_records.extend(records)
+        records, data = self._fetch_page({**params, "$skip": "0", "$count": "true"})
+        yield from records
+        if len(records) < self.PAGE_SIZE:
+            return
+        skip = self.PAGE_SIZE
+
+        total = (data.get("metadata") or {}).get("count")
+        if isinstance(total, int) and total > skip:
+            offsets = range(skip, total, self.PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=min(FEMA_FETCH_WORKERS, len(offsets))) as pool:
+                for page in pool.map(
+                    lambda offset: self._fetch_page({**params, "$skip": str(offset)})[0], offsets
+                ):
+                    yield from page
+            if len(page) < self.PAGE_SIZE:
+                return
+            # Rows were added after the count was taken — pick them up serially
+            skip = offsets[-1] + self.PAGE_SIZE
 
+        while True:
+            records, _ = self._fetch_page({**params, "$skip": str(skip)})
+            yield from records
             if len(records) < self.PAGE_SIZE:
                 break
             skip += self.PAGE_SIZE
-            time.sleep(0.3)  # Be respectful
-
-        return all_records
 
-    def _consolidate(self, records: List[Dict]) -> Dict[str, Dict]:
+    def _consolidate(self, records: Iterable[Dict]) -> Dict[str, Dict]:
         """
         Group county-level FEMA records by femaDeclarationString.
         Includes DR (Major Disaster), EM (Emergency), and FM (Fire Management).
@@ -4514,42 +4437,48 @@ class FEMACollector:
         Strips parenthetical suffixes from county names.
         Detects statewide declarations.
         """
-        groups: Dict[str, Dict] = {}
+        # key -> (group, counties already listed): one dict lookup per row and
+        # O(1) county membership
+        entries: Dict[str, Tuple[Dict, set]] = {}
 
         for rec in records:
             key = rec.get("femaDeclarationString", "")
             if not key:
                 continue
 
-            if key not in groups:
-                decl_date_raw = rec.get("declarationDate", "")
-                inc_begin_raw = rec.get("incidentBeginDate", "")
-                inc_end_raw = rec.get("incidentEndDate", "")
+            entry = entries.get(key)
+            if entry is None:
+                decl_date_raw = rec.get("declarationDate") or ""
+                inc_begin_raw = rec.get("incidentBeginDate") or ""
+                inc_end_raw = rec.get("incidentEndDate") or ""
 
-                groups[key] = {
+                entry = entries[key] = ({
                     "femaDeclarationString": key,
-                    "declarationType": rec.get("declarationType", ""),
-                    "declarationDate": decl_date_raw.split("T")[0] if decl_date_raw else None,
-                    "incidentBeginDate": inc_begin_raw.split("T")[0] if inc_begin_raw else None,
-                    "incidentEndDate": inc_end_raw.split("T")[0] if inc_end_raw else None,
-                    "state": rec.get("state", ""),
+                    "declarationType": intern_field(rec.get("declarationType", "")),
+                    "declarationDate": decl_date_raw.partition("T")[0] or None,
+                    "incidentBeginDate": inc_begin_raw.partition("T")[0] or None,
+                    "incidentEndDate": inc_end_raw.partition("T")[0] or None,
+                    "state": intern_field(rec.get("state", "")),
                     "declarationTitle": rec.get("declarationTitle", ""),
-                    "incidentType": rec.get("incidentType", ""),
+                    "incidentType": intern_field(rec.get("incidentType", "")),
                     "disasterNumber": rec.get("disasterNumber"),
                     "counties": [],
                     "statewide": False,
-                }
+                }, set())
+            group, seen = entry
 
             # Process county name
             area = rec.get("designatedArea", "")
             if area:
                 county = normalize_county_name(area)
                 if county.lower() == "statewide":
-                    groups[key]["statewide"] = True
-                if county and county not in groups[key]["counties"]:
-                    groups[key]["counties"].append(county)
+                    county = "Statewide"  # Canonical spelling, so it dedupes and needs no fix-up later
+                    group["statewide"] = True
+                if county and county not in seen:
+                    seen.add(county)
+                    group["counties"].append(county)
 
-        return groups
+        return {key: group for key, (group, _) in entries.items()}
 
     def _build_from_group(self, group: Dict) -> Optional[Dict]:
         """Convert a consolidated FEMA group into a standard disaster record."""
@@ -4578,13 +4507,10 @@ class FEMACollector:
             return None
 
         state = group.get("state", "")
+        # Statewide groups already list the canonical "Statewide" (see _consolidate)
         counties = group.get("counties", [])
         statewide = group.get("statewide", False)
 
-        # If statewide detected, ensure 'Statewide' is in counties
-        if statewide and "Statewide" not in counties:
-            counties = ["Statewide"] + [c for c in counties if c.lower() != "statewide"]
-
         fema_decl_string = group["femaDeclarationString"]
 
         return build_record(
@@ -4626,10 +4552,7 @@ class DroughtMonitor:
                 "enddate": today_str,
                 "statisticsType": "1",
             }
-            resp = requests.get(
-                self.API_URL, params=params, timeout=REQUEST_TIMEOUT,
-                headers={"User-Agent": USER_AGENT}
-            )
+            resp = _SESSION.get(self.API_URL, params=params, timeout=REQUEST_TIMEOUT)
             if resp.status_code != 200:
                 return
 
@@ -4681,29 +4604,23 @@ class CoverageGapAnalyzer:
 
     def analyze(self, curated_records: List[Dict], fema_records: List[Dict]):
         """Run gap analysis using curated records and FEMA collector output."""
-        # Collect curated STATE records by state
+        # Index curated records by state in one pass: STATE coverage and
+        # FMCSA titles per state
         state_covered = set()
-        for rec in curated_records:
-            if rec.get("source") == "STATE":
-                state_covered.add(rec.get("state"))
-
-        # Collect FMCSA-covered states
         fmcsa_states: Dict[str, List[str]] = {}
         for rec in curated_records:
-            if rec.get("source") == "FMCSA":
-                st = rec.get("state")
-                if st not in fmcsa_states:
-                    fmcsa_states[st] = []
-                fmcsa_states[st].append(rec.get("title", ""))
+            source = rec.get("source")
+            if source == "STATE":
+                state_covered.add(rec.get("state"))
+            elif source == "FMCSA":
+                fmcsa_states.setdefault(rec.get("state"), []).append(rec.get("title", ""))
 
         # Build FEMA state map from collector output (no separate API call)
         for rec in fema_records:
             state = rec.get("state", "")
             title = rec.get("title", "")
-            if state and state in VALID_STATES:
-                if state not in self.fema_states:
-                    self.fema_states[state] = []
-                self.fema_states[state].append(title)
+            if state in VALID_STATES:
+                self.fema_states.setdefault(state, []).append(title)
 
         # Gap detection 1: FEMA state has no governor declaration
         for state, disasters in self.fema_states.items():
@@ -5001,13 +4918,10 @@ def inject_carrier_acknowledgments(records: List[Dict]) -> None:
 
 def deduplicate(records: List[Dict]) -> List[Dict]:
     """Remove duplicate records by ID. First occurrence wins."""
-    seen = set()
-    unique = []
+    by_id: Dict[str, Dict] = {}
     for rec in records:
-        if rec["id"] not in seen:
-            seen.add(rec["id"])
-            unique.append(rec)
-    return unique
+        by_id.setdefault(rec["id"], rec)
+    return list(by_id.values())
 
 
 def deduplicate_prefer_fema(curated_records: List[Dict], fema_records: List[Dict]) -> List[Dict]:
@@ -5016,16 +4930,12 @@ def deduplicate_prefer_fema(curated_records: List[Dict], fema_records: List[Dict
     Matches the frontend's merge behavior: FEMA records go first,
     curated records added only if their ID doesn't already exist.
     """
-    by_id: Dict[str, Dict] = {}
-
     # FEMA records take priority
-    for rec in fema_records:
-        by_id[rec["id"]] = rec
+    by_id: Dict[str, Dict] = {rec["id"]: rec for rec in fema_records}
 
     # Curated records fill in the rest
     for rec in curated_records:
-        if rec["id"] not in by_id:
-            by_id[rec["id"]] = rec
+        by_id.setdefault(rec["id"], rec)
 
     return list(by_id.values())
 
@@ -5034,23 +4944,43 @@ def deduplicate_prefer_fema(curated_records: List[Dict], fema_records: List[Dict
 # Summary Report
 # =========================================================================
 
-def write_output(filepath: str, records: List[Dict], sba_collector=None) -> Dict:
+def prepare_output_records(records: List[Dict], verified_records: Optional[Iterable[Dict]] = None) -> None:
     """
-    Write disaster records to a JSON file with metadata wrapper.
-    Returns the output dict for reference.
+    Stamp lastVerified on STATE/HHS records and sort by state, then declaration date.
+    Modifies records in-place. Run once on the merged list before writing outputs.
+
+    verified_records, if given, are the STATE/HHS record dicts (e.g. those
+    collectors' output) and are stamped directly instead of scanning every
+    record's source.
     """
     # Auto-update lastVerified for STATE/HHS records
     today_str = date.today().isoformat()
-    for rec in records:
-        if rec.get("source") in ("STATE", "HHS"):
-            rec["lastVerified"] = today_str
+    if verified_records is None:
+        verified_records = (rec for rec in records if rec.get("source") in ("STATE", "HHS"))
+    for rec in verified_records:
+        rec["lastVerified"] = today_str
 
     # Sort by state, then declaration date
-    records.sort(key=lambda r: (r["state"], r.get("declarationDate", "")))
+    # build_record always sets declarationDate, so a C-level itemgetter key works
+    records.sort(key=itemgetter("state", "declarationDate"))
+
 
-    # Compute content hash and source counts
-    records_json = json.dumps(records, sort_keys=True)
-    content_hash = hashlib.sha256(records_json.encode()).hexdigest()[:16]
+def write_output(filepath: str, records: List[Dict], sba_collector=None) -> Dict:
+    """
+    Write disaster records (already passed through prepare_output_records)
+    to a JSON file with metadata wrapper. Returns the output dict for reference.
+    """
+    # Compute content hash and source counts. The hash covers the stdlib
+    # json.dumps(records, sort_keys=True) bytes (so it doesn't change with
+    # whether orjson is installed), fed one record at a time rather than
+    # building the whole string.
+    hasher = hashlib.sha256(b"[")
+    for i, rec in enumerate(records):
+        if i:
+            hasher.update(b", ")
+        hasher.update(json.dumps(rec, sort_keys=True).encode())
+    hasher.update(b"]")
+    content_hash = hasher.hexdigest()[:16]
 
     source_counts = {}
     for rec in records:
@@ -5067,7 +4997,7 @@ def write_output(filepath: str, records: List[Dict], sba_collector=None) -> Dict
 
     output = {
         "metadata": {
-            "lastUpdated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "recordCount": len(records),
             "generatedBy": "dst_data_fetcher.py",
             "contentHash": content_hash,
@@ -5081,8 +5011,7 @@ def write_output(filepath: str, records: List[Dict], sba_collector=None) -> Dict
         },
         "disasters": records,
     }
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2)
+    write_json(filepath, output)
 
     return output
 
@@ -5115,26 +5044,22 @@ def print_report(
         print(f"  {name:8} {count:4} records{detail}")
     print()
 
-    # Errors
-    all_errors = []
-    for name, collector in collectors.items():
-        for err in collector.errors:
-            all_errors.append(f"[{name}] {err}")
-    if all_errors:
-        print(f"ERRORS: {len(all_errors)}")
-        for err in all_errors:
-            print(f"  {err}")
+    # Errors (counted up front, then streamed per collector)
+    error_count = sum(len(collector.errors) for collector in collectors.values())
+    if error_count:
+        print(f"ERRORS: {error_count}")
+        for name, collector in collectors.items():
+            for err in collector.errors:
+                print(f"  [{name}] {err}")
         print()
 
     # Warnings
-    all_warnings = []
-    for name, collector in collectors.items():
-        for w in collector.warnings:
-            all_warnings.append(f"[{name}] {w}")
-    if all_warnings:
-        print(f"WARNINGS: {len(all_warnings)}")
-        for w in all_warnings:
-            print(f"  {w}")
+    warning_count = sum(len(collector.warnings) for collector in collectors.values())
+    if warning_count:
+        print(f"WARNINGS: {warning_count}")
+        for name, collector in collectors.items():
+            for w in collector.warnings:
+                print(f"  [{name}] {w}")
         print()
 
     # Drought Monitor
@@ -5177,12 +5102,21 @@ def main():
         "STATE": StateCollector(),
     }
 
+    fema_collector = FEMACollector()
+    drought = DroughtMonitor()
     curated_records: List[Dict] = []
 
+    # Collectors (and the Drought Monitor check) are independent; run them
+    # concurrently so their network round trips overlap, then report in the
+    # usual order.
+    with ThreadPoolExecutor(max_workers=len(curated_collectors) + 2) as pool:
+        futures = {name: pool.submit(collector.collect) for name, collector in curated_collectors.items()}
+        fema_future = pool.submit(fema_collector.collect)
+        drought_future = pool.submit(drought.check)
     for name, collector in curated_collectors.items():
         print(f"Collecting {name}...")
         try:
-            records = collector.collect()
+            records = futures[name].result()
             curated_records.extend(records)
             print(f"  -> {len(records)} records")
         except Exception as e:
@@ -5191,10 +5125,9 @@ def main():
         print()
 
     # --- FEMA collector (live API) ---
-    fema_collector = FEMACollector()
     print("Collecting FEMA (live API)...")
     try:
-        fema_records = fema_collector.collect()
+        fema_records = fema_future.result()
         print(f"  -> {len(fema_records)} records")
     except Exception as e:
         fema_collector.errors.append(f"Collector crashed: {e}")
@@ -5205,10 +5138,15 @@ def main():
     # All collectors for reporting
     collectors = {**curated_collectors, "FEMA": fema_collector}
 
+    if VERIFY_URLS_ON_BUILD:
+        print("Verifying official URLs...")
+        reachable = verify_record_urls(curated_records + fema_records)
+        print(f"  -> {sum(reachable.values())}/{len(reachable)} distinct URLs reachable")
+        print()
+
     # Drought Monitor signal
     print("Checking US Drought Monitor for D3/D4 signals...")
-    drought = DroughtMonitor()
-    drought.check()
+    drought_future.result()
     if drought.warnings:
         print(f"  -> {len(drought.warnings)} warnings")
     else:
@@ -5227,7 +5165,7 @@ def main():
         print("  -> No coverage gaps detected")
     print()
 
-    # --- Write curated_disasters.json (non-FEMA, backward compatible) ---
+    # --- Deduplicate curated records (non-FEMA) ---
     print("Deduplicating curated records...")
     unique_curated = deduplicate(curated_records)
     dup_count = len(curated_records) - len(unique_curated)
@@ -5249,16 +5187,26 @@ def main():
     # --- Inject carrier acknowledgments from carrier_analysis.json ---
     inject_carrier_acknowledgments(unique_curated)
 
-    sba_collector = curated_collectors.get("SBA")
-    print(f"Writing to {OUTPUT_FILE}...")
-    write_output(OUTPUT_FILE, unique_curated, sba_collector=sba_collector)
-    print(f"  -> {len(unique_curated)} records written")
-
-    # --- Write all_disasters.json (curated + FEMA merged) ---
-    print(f"\nMerging curated + FEMA for {ALL_DISASTERS_FILE}...")
+    # --- Build the merged record list once; both output files are views of it ---
+    print(f"Merging curated + FEMA for {ALL_DISASTERS_FILE}...")
     merged_records = deduplicate_prefer_fema(unique_curated, fema_records)
     print(f"  -> {len(merged_records)} merged records ({len(fema_records)} FEMA + {len(unique_curated)} curated, deduped)")
+    # STATE/HHS collector output holds the same dicts as merged_records
+    prepare_output_records(
+        merged_records,
+        verified_records=curated_collectors["STATE"].records + curated_collectors["HHS"].records,
+    )
 
+    # --- Write curated_disasters.json (non-FEMA, backward compatible) ---
+    # FEMA IDs never collide with curated IDs, so filtering the sorted merged
+    # list yields exactly the curated records in the same sorted order.
+    sba_collector = curated_collectors.get("SBA")
+    curated_sorted = [r for r in merged_records if r["source"] != "FEMA"]
+    print(f"\nWriting to {OUTPUT_FILE}...")
+    write_output(OUTPUT_FILE, curated_sorted, sba_collector=sba_collector)
+    print(f"  -> {len(curated_sorted)} records written")
+
+    # --- Write all_disasters.json (curated + FEMA merged) ---
     print(f"Writing to {ALL_DISASTERS_FILE}...")
     write_output(ALL_DISASTERS_FILE, merged_records, sba_collector=sba_collector)
     print(f"  -> {len(merged_records)} records written")